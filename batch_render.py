@@ -0,0 +1,369 @@
+"""Render every Scene in the repo in parallel.
+
+    python batch_render.py                      # every scene, low quality
+    python batch_render.py -q h -j 32           # high quality on 32 workers
+    python batch_render.py cosets.py queue_flow.py
+
+Scenes are discovered statically, so the parent process never imports manim.
+Each scene renders in a fresh worker process (module-level config tweaks such
+as the frame size in ``linear_compose.py`` must not leak between clips), and
+a JSON manifest of outputs, durations and failures is written to the media
+directory.
+"""
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from render_cache import RenderCache, cache_key
+
+REPO_DIR = Path(__file__).resolve().parent
+
+# Same flags as `manim -q<flag>`
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+@dataclass
+class SceneSpec:
+    path: str
+    name: str
+    # Constructor arguments without defaults, eg. ["N"] for Target(N)
+    required: list = field(default_factory=list)
+
+
+@dataclass
+class RenderJob:
+    path: str
+    scene: str
+    quality: str = "l"
+    media_dir: str = "media"
+    params: dict = field(default_factory=dict)
+    output_name: str = None
+    config: dict = field(default_factory=dict)
+    # Attach scene_profile.PlayProfiler and write its output here
+    profile_dir: str = None
+
+    @property
+    def label(self):
+        stem = Path(self.path).stem
+        return f"{stem}:{self.output_name or self.scene}"
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+def find_scene_files(paths=None):
+    if paths:
+        return [Path(p).resolve() for p in paths]
+    return sorted(REPO_DIR.glob("*.py"))
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _required_params(init):
+    args = init.args
+    positional = args.posonlyargs + args.args
+    n_required = len(positional) - len(args.defaults)
+    required = [a.arg for a in positional[1:n_required]]  # drop `self`
+    required += [a.arg for a, d in zip(args.kwonlyargs, args.kw_defaults) if d is None]
+    return required
+
+
+def discover_scenes(paths=None):
+    """Return a SceneSpec for every Scene subclass defined in the given files."""
+    specs = []
+    for path in find_scene_files(paths):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+        memo = {}
+
+        def is_scene(name):
+            if name not in memo:
+                memo[name] = False  # guards against cycles
+                bases = [_base_name(b) for b in classes[name].bases]
+                memo[name] = any(
+                    is_scene(b) if b in classes else bool(b) and b.endswith("Scene")
+                    for b in bases
+                )
+            return memo[name]
+
+        def find_init(name):
+            for item in classes[name].body:
+                if isinstance(item, ast.FunctionDef) and item.name == "__init__":
+                    return item
+            for b in classes[name].bases:
+                if _base_name(b) in classes:
+                    init = find_init(_base_name(b))
+                    if init is not None:
+                        return init
+            return None
+
+        for name in classes:
+            if is_scene(name):
+                init = find_init(name)
+                required = _required_params(init) if init is not None else []
+                specs.append(SceneSpec(str(path), name, required))
+    return specs
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+def load_scene_module(path):
+    """Import a scene file by path (file names like ngon-vector.py included)."""
+    path = Path(path).resolve()
+    # Same as the manim CLI: scenes may import helpers living next to them.
+    sys.path.insert(0, str(path.parent))
+    module_name = path.stem.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _count_calls(scene):
+    """Count self.play/self.wait calls on a scene (waits are plays internally)."""
+    counts = {"play": 0, "wait": 0}
+    play, wait = scene.play, scene.wait
+    waiting = [False]
+
+    def counted_play(*args, **kwargs):
+        if not waiting[0]:
+            counts["play"] += 1
+        return play(*args, **kwargs)
+
+    def counted_wait(*args, **kwargs):
+        counts["wait"] += 1
+        waiting[0] = True
+        try:
+            return wait(*args, **kwargs)
+        finally:
+            waiting[0] = False
+
+    scene.play, scene.wait = counted_play, counted_wait
+    return counts
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # not on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def render_scene(job):
+    """Render one job inside the current process and return a manifest record."""
+    record = {
+        "file": Path(job.path).name,
+        "scene": job.scene,
+        "params": job.params,
+        "quality": job.quality,
+        "status": "failed",
+        "output": None,
+        "video_seconds": None,
+        "num_plays": None,
+        "error": None,
+    }
+    start = time.perf_counter()
+    try:
+        from manim import config, tempconfig
+
+        with tempconfig({}):
+            config.quality = QUALITIES[job.quality]
+            config.media_dir = job.media_dir
+            config.input_file = job.path
+            config.preview = False
+            config.write_to_movie = True
+            config.progress_bar = "none"
+            # Parallel workers share media/Tex; manim's post-compile cleanup
+            # would delete the .dvi files other workers are still converting.
+            config.no_latex_cleanup = True
+            if job.output_name:
+                config.output_file = job.output_name
+            for key, value in job.config.items():
+                setattr(config, key, value)
+
+            module = load_scene_module(job.path)
+            scene = getattr(module, job.scene)(**job.params)
+            counts = _count_calls(scene)
+            profiler = None
+            if job.profile_dir:
+                from scene_profile import PlayProfiler
+
+                profiler = PlayProfiler(scene).attach()
+            scene_start = time.perf_counter()
+            scene.render()
+            # Excludes interpreter/manim start-up, unlike render_seconds.
+            record["scene_seconds"] = round(time.perf_counter() - scene_start, 3)
+
+            record["output"] = str(scene.renderer.file_writer.movie_file_path)
+            record["video_seconds"] = round(scene.renderer.time, 3)
+            record["num_plays"] = scene.renderer.num_plays
+            record["frames"] = round(scene.renderer.time * config.frame_rate)
+            record["play_calls"] = counts["play"]
+            record["wait_calls"] = counts["wait"]
+            if profiler is not None:
+                stem = Path(job.profile_dir) / job.label.replace(":", ".")
+                record["profile"] = str(profiler.write(stem))
+                record["profile_summary"] = profiler.summary()
+        record["status"] = "ok"
+    except Exception:
+        record["error"] = traceback.format_exc()
+    record["render_seconds"] = round(time.perf_counter() - start, 3)
+    record["peak_rss_mb"] = peak_rss_mb()
+    return record
+
+
+# ---------------------------------------------------------------------------
+# Pool + manifest
+# ---------------------------------------------------------------------------
+def render_many(jobs, workers=None, on_result=None):
+    """Render jobs in a process pool sized to the machine, one process per job.
+
+    Returns (records, workers), where workers is the pool size actually used.
+    """
+    if not jobs:
+        return [], 0
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    records = [None] * len(jobs)
+    # max_tasks_per_child=1 gives each scene a clean interpreter (and config).
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        futures = {pool.submit(render_scene, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            records[i] = future.result()
+            if on_result is not None:
+                on_result(jobs[i], records[i])
+    return records, workers
+
+
+def render_cached(jobs, workers=None, cache=None, on_result=None):
+    """Like render_many, but jobs whose cache key is unchanged are restored, not rendered."""
+    if cache is None:
+        return render_many(jobs, workers, on_result)
+    records = [None] * len(jobs)
+    keys = [cache_key(job) for job in jobs]
+    pending = []
+    for i, job in enumerate(jobs):
+        records[i] = cache.lookup(job, keys[i])
+        if records[i] is None:
+            pending.append(i)
+        elif on_result is not None:
+            on_result(job, records[i])
+
+    fresh, workers = render_many([jobs[i] for i in pending], workers, on_result)
+    for i, record in zip(pending, fresh):
+        cache.store(jobs[i], record, keys[i])
+        records[i] = record
+    return records, workers
+
+
+def write_manifest(records, path, **extra):
+    manifest = dict(extra)
+    manifest["results"] = records
+    manifest["failures"] = [
+        f"{r['file']}:{r['scene']}" for r in records if r["status"] == "failed"
+    ]
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+def print_progress(job, record):
+    if record["status"] == "failed":
+        last = record["error"].strip().splitlines()[-1]
+        print(f"FAILED  {job.label}  ({last})", flush=True)
+    else:
+        print(f"{record['status']:<7} {job.label}  {record['render_seconds']:.1f}s", flush=True)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help="scene files (default: every *.py in the repo)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: number of cores)")
+    parser.add_argument("--media-dir", default=str(REPO_DIR / "media"))
+    parser.add_argument("--manifest", default=None,
+                        help="manifest path (default: <media-dir>/manifest.json)")
+    parser.add_argument("--warm-tex", action="store_true",
+                        help="pre-compile all literal TeX strings first (see tex_warmup.py)")
+    parser.add_argument("--tex-dir", default=None,
+                        help="shared TeX cache directory (default: <media-dir>/Tex)")
+    parser.add_argument("--profile", metavar="DIR", default=None,
+                        help="write per-play() profiles for every scene here (implies --no-cache)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="re-render even when scene source and settings are unchanged")
+    parser.add_argument("-s", "--scene", action="append", default=None,
+                        help="only render scenes with this class name (repeatable)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    specs = discover_scenes(args.files)
+    if args.scene:
+        specs = [s for s in specs if s.name in args.scene]
+
+    jobs = []
+    for spec in specs:
+        if spec.required:
+            print(f"skip    {Path(spec.path).stem}:{spec.name}  "
+                  f"(needs parameters: {', '.join(spec.required)})")
+            continue
+        job = RenderJob(spec.path, spec.name, args.quality, args.media_dir,
+                        profile_dir=args.profile)
+        if args.profile:
+            job.config["disable_caching"] = True
+        if args.tex_dir:
+            job.config["tex_dir"] = args.tex_dir
+        jobs.append(job)
+
+    if args.warm_tex:
+        from tex_warmup import warm_tex
+
+        n, failures = warm_tex(args.files, args.media_dir, args.tex_dir, args.jobs)
+        print(f"tex     {n - len(failures)}/{n} strings cached")
+
+    cache = None if args.no_cache or args.profile else RenderCache(Path(args.media_dir) / "render_cache")
+    started = time.time()
+    records, workers = render_cached(jobs, args.jobs, cache, on_result=print_progress)
+    manifest = write_manifest(
+        records,
+        args.manifest or Path(args.media_dir) / "manifest.json",
+        quality=QUALITIES[args.quality],
+        workers=workers,
+        wall_seconds=round(time.time() - started, 3),
+    )
+    n_cached = sum(r["status"] == "cached" for r in records)
+    print(f"{len(records) - len(manifest['failures'])}/{len(records)} scenes ready "
+          f"({n_cached} from cache) in {manifest['wall_seconds']:.1f}s")
+    return 1 if manifest["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
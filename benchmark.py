@@ -0,0 +1,129 @@
+"""Benchmark every scene at fixed low-quality settings against a JSON baseline.
+
+    python benchmark.py --update          # record benchmarks/baseline.json
+    python benchmark.py                   # compare; exit 1 on regressions
+    python benchmark.py ortho-preserving.py --threshold 0.1
+
+Each scene renders in its own fresh process (one at a time by default, so
+timings don't compete for cores) with manim's partial-movie cache disabled.
+Recorded per scene: wall time, frames rendered, frames per second, peak RSS
+and the number of ``self.play`` / ``self.wait`` calls.  A scene regresses
+when its wall time or peak RSS grows by more than the threshold relative to
+the baseline.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from batch_render import REPO_DIR, RenderJob, discover_scenes, render_many
+
+DEFAULT_BASELINE = REPO_DIR / "benchmarks" / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+# Fixed settings, so numbers are comparable between runs.
+SETTINGS = {"quality": "l", "config": {"disable_caching": True}}
+# Metrics checked against the threshold (bigger is worse).
+CHECKED = ("wall_seconds", "peak_rss_mb")
+
+
+def measure(record):
+    wall = record["scene_seconds"]
+    frames = record.get("frames") or 0
+    return {
+        "wall_seconds": wall,
+        "frames": frames,
+        "fps": round(frames / wall, 2) if wall else None,
+        "peak_rss_mb": record["peak_rss_mb"],
+        "play_calls": record.get("play_calls"),
+        "wait_calls": record.get("wait_calls"),
+    }
+
+
+def run_benchmarks(paths=None, media_dir=None, workers=1, on_result=None):
+    """Return ({"file:Scene": metrics}, failed_records)."""
+    media_dir = media_dir or REPO_DIR / "media" / "benchmark"
+    jobs = [
+        RenderJob(spec.path, spec.name, SETTINGS["quality"], str(media_dir),
+                  config=dict(SETTINGS["config"]))
+        for spec in discover_scenes(paths)
+        if not spec.required
+    ]
+    results, failed = {}, []
+    records, _ = render_many(jobs, workers, on_result)
+    for job, record in zip(jobs, records):
+        if record["status"] == "ok":
+            results[job.label] = measure(record)
+        else:
+            failed.append(record)
+    return results, failed
+
+
+def compare(results, baseline, threshold):
+    """Return a list of human-readable regressions."""
+    regressions = []
+    for name, metrics in sorted(results.items()):
+        before = baseline.get("scenes", {}).get(name)
+        if before is None:
+            continue
+        for key in CHECKED:
+            old, new = before.get(key), metrics.get(key)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > threshold:
+                regressions.append(f"{name}: {key} {old} -> {new} (+{change:.0%})")
+    return regressions
+
+
+def print_table(results, baseline):
+    scenes = baseline.get("scenes", {})
+    print(f"{'scene':<48} {'wall s':>8} {'Δ':>6} {'frames':>7} {'fps':>7} "
+          f"{'rss MB':>7} {'plays':>6}")
+    for name, m in sorted(results.items()):
+        old = scenes.get(name, {}).get("wall_seconds")
+        delta = f"{(m['wall_seconds'] - old) / old:+.0%}" if old else ""
+        print(f"{name:<48} {m['wall_seconds']:>8.2f} {delta:>6} {m['frames']:>7} "
+              f"{m['fps'] or 0:>7.1f} {m['peak_rss_mb'] or 0:>7.0f} {m['play_calls']:>6}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--threshold", type=float, default=None,
+                        help=f"allowed relative slowdown (default: baseline's, else {DEFAULT_THRESHOLD})")
+    parser.add_argument("--update", action="store_true", help="write results as the new baseline")
+    parser.add_argument("-j", "--jobs", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    results, failed = run_benchmarks(args.files, workers=args.jobs)
+    print_table(results, baseline)
+    for record in failed:
+        print(f"FAILED {record['file']}:{record['scene']}\n{record['error']}")
+
+    if args.update:
+        scenes = dict(baseline.get("scenes", {}))
+        scenes.update(results)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps({
+            "settings": SETTINGS,
+            "threshold": args.threshold or baseline.get("threshold", DEFAULT_THRESHOLD),
+            "scenes": scenes,
+        }, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"baseline written to {baseline_path}")
+        return 1 if failed else 0
+
+    threshold = args.threshold or baseline.get("threshold", DEFAULT_THRESHOLD)
+    regressions = compare(results, baseline, threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
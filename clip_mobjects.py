@@ -0,0 +1,352 @@
+"""Reusable mobjects shared by the clips.
+
+Import them next to manim in a scene file:
+
+    from manim import *
+    from clip_mobjects import TrackingLine
+"""
+from functools import lru_cache
+
+from manim import *
+import numpy as np
+
+
+# ---------------------------------------------------------------------------
+# In-place replacements for always_redraw(lambda: Line(...)/Arc(...))
+# ---------------------------------------------------------------------------
+class TrackingLine(Line):
+    """A Line that follows two point sources, rewriting its own points each frame.
+
+    Same picture as ``always_redraw(lambda: Line(get_start(), get_end()))``
+    but no new Line is built (and garbage collected) per frame.
+    """
+
+    def __init__(self, get_start, get_end, **kwargs):
+        super().__init__(get_start(), get_end(), **kwargs)
+        self._get_start = get_start
+        self._get_end = get_end
+        self._alphas = np.linspace(0, 1, len(self.points))[:, None]
+        self.add_updater(lambda m: m.put_between(m._get_start(), m._get_end()))
+
+    def put_between(self, start, end):
+        start = np.asarray(start, dtype=float)
+        end = np.asarray(end, dtype=float)
+        if len(self.points) != len(self._alphas):
+            self.set_points_as_corners([start, end])
+            self._alphas = np.linspace(0, 1, len(self.points))[:, None]
+            return self
+        np.multiply(self._alphas, end - start, out=self.points)
+        self.points += start
+        return self
+
+
+class TrackingArc(Arc):
+    """An Arc whose (start_angle, angle) comes from `get_angles()` every frame.
+
+    The bezier points are recomputed into the existing point array, using the
+    same construction as ``Arc`` itself, instead of building a new Arc.
+    """
+
+    def __init__(self, get_angles, radius=1.0, arc_center=ORIGIN, **kwargs):
+        start_angle, angle = get_angles()
+        super().__init__(radius=radius, start_angle=start_angle, angle=angle,
+                         arc_center=arc_center, **kwargs)
+        self._get_angles = get_angles
+        self.add_updater(lambda m: m.set_angles(*m._get_angles()))
+
+    def set_angles(self, start_angle, angle):
+        self.start_angle, self.angle = start_angle, angle
+        n = self.num_components
+        theta = np.linspace(start_angle, start_angle + angle, n)
+        anchors = np.zeros((n, 3))
+        anchors[:, 0] = np.cos(theta)
+        anchors[:, 1] = np.sin(theta)
+        tangents = np.zeros((n, 3))
+        tangents[:, 0] = -anchors[:, 1]
+        tangents[:, 1] = anchors[:, 0]
+        step = angle / (n - 1.0) / 3
+
+        points = self.points
+        if len(points) != 4 * (n - 1):
+            self.generate_points()
+            return self
+        points[0::4] = anchors[:-1]
+        points[1::4] = anchors[:-1] + step * tangents[:-1]
+        points[2::4] = anchors[1:] - step * tangents[1:]
+        points[3::4] = anchors[1:]
+        points *= self.radius
+        points += self.arc_center
+        return self
+
+
+# ---------------------------------------------------------------------------
+# Hatched ("dithered") boxes
+# ---------------------------------------------------------------------------
+def segment_points(starts, ends):
+    """Bezier points for straight segments starts[i] -> ends[i], one subpath each."""
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    alphas = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+    points = starts[:, None, :] + alphas * (ends - starts)[:, None, :]
+    return points.reshape(-1, 3)
+
+
+def stripe_points(left, right, ys):
+    """Horizontal segments left->right at each y."""
+    ys = np.asarray(ys, dtype=float)
+    zeros = np.zeros_like(ys)
+    return segment_points(np.stack([np.full_like(ys, left), ys, zeros], axis=1),
+                          np.stack([np.full_like(ys, right), ys, zeros], axis=1))
+
+
+def plane_to_points(plane, coords):
+    """Scene points (n, 3) for plane coordinates (n, 2), in one vectorized c2p."""
+    coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+    return np.asarray(plane.c2p(coords[:, 0], coords[:, 1])).reshape(3, -1).T
+
+
+def grid_path(rows, cols, cell, **kwargs):
+    """All (rows + 1) + (cols + 1) lines of a cell grid as one VMobject, centered on ORIGIN."""
+    half_w, half_h = cols * cell / 2, rows * cell / 2
+    ys = half_h - cell * np.arange(rows + 1)
+    xs = -half_w + cell * np.arange(cols + 1)
+    zeros = np.zeros_like(xs)
+    verticals = segment_points(np.stack([xs, np.full_like(xs, half_h), zeros], axis=1),
+                               np.stack([xs, np.full_like(xs, -half_h), zeros], axis=1))
+    grid = VMobject(**kwargs)
+    grid.set_points(np.concatenate([stripe_points(-half_w, half_w, ys), verticals]))
+    return grid
+
+
+@lru_cache(maxsize=None)
+def _hatched_prototype(side_length, spacing):
+    outer_sq = Square(side_length=side_length)
+    outer_sq.set_fill(BLACK, opacity=1)
+    outer_sq.set_stroke(WHITE, width=2)
+
+    half = side_length / 2
+    # Same stripes as stepping y down from the top edge while y > bottom.
+    ys = half - spacing * np.arange(int(side_length / spacing) + 2)
+    stripes = VMobject()
+    stripes.set_points(stripe_points(-half, half, ys[ys > -half]))
+    stripes.set_stroke(WHITE, width=1, opacity=0.7)
+    return VGroup(outer_sq, stripes)
+
+
+def hatched_box(side_length, spacing=0.08):
+    """Black box with a white outline and horizontal white stripes.
+
+    All stripes are subpaths of a single VMobject, so transforming between
+    boxes interpolates one point array.  One prototype is built per
+    (side_length, spacing) and every call returns a copy of it.
+    """
+    return _hatched_prototype(float(side_length), float(spacing)).copy()
+
+
+# ---------------------------------------------------------------------------
+# Batched arrows
+# ---------------------------------------------------------------------------
+def arrow_points(starts, ends, buff=0.1, tip_length=0.2, tip_width=0.16):
+    """(shaft points, tip points) for straight arrows starts[i] -> ends[i].
+
+    Each shaft is one 4-point subpath and each tip one closed triangle of
+    12 points, in arrow order.
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    delta = ends - starts
+    length = np.linalg.norm(delta, axis=1, keepdims=True)
+    unit = delta / np.where(length == 0, 1, length)
+    tail = starts + unit * buff
+    head = ends - unit * buff
+    base = head - unit * np.minimum(tip_length, np.maximum(length - 2 * buff, 0))
+    normal = np.stack([-unit[:, 1], unit[:, 0], np.zeros(len(unit))], axis=1)
+    left = base + normal * tip_width / 2
+    right = base - normal * tip_width / 2
+    tips = segment_points(np.stack([left, head, right], axis=1).reshape(-1, 3),
+                          np.stack([head, right, left], axis=1).reshape(-1, 3))
+    return segment_points(tail, base), tips
+
+
+class ArrowField(VGroup):
+    """Many straight arrows drawn as a handful of VMobjects.
+
+    Arrows are bucketed by |weight|; each bucket is one shaft VMobject and
+    one tip VMobject whose subpaths are the individual arrows, drawn
+    thicker and more opaque for heavier buckets.  Weight 0 lands in the
+    faintest bucket.
+    """
+
+    def __init__(self, starts, ends, weights=None, buckets=4, color=WHITE,
+                 max_stroke_width=4, buff=0.1, tip_length=0.2, tip_width=0.16, **kwargs):
+        super().__init__(**kwargs)
+        starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+        n = len(starts)
+        weights = np.ones(n) if weights is None else np.abs(np.asarray(weights, dtype=float))
+        top = weights.max() if n and weights.max() > 0 else 1.0
+        self.bucket = np.minimum((weights / top * buckets).astype(int), buckets - 1)
+
+        shafts, tips = arrow_points(starts, ends, buff=buff, tip_length=tip_length, tip_width=tip_width)
+        shafts = shafts.reshape(n, 4, 3)
+        tips = tips.reshape(n, 12, 3)
+        for b in range(buckets):
+            mask = self.bucket == b
+            if not mask.any():
+                continue
+            level = (b + 1) / buckets
+            shaft = VMobject()
+            shaft.set_points(shafts[mask].reshape(-1, 3))
+            shaft.set_stroke(color, width=max_stroke_width * level, opacity=0.3 + 0.7 * level)
+            tip = VMobject()
+            tip.set_points(tips[mask].reshape(-1, 3))
+            tip.set_fill(color, opacity=0.3 + 0.7 * level).set_stroke(width=0)
+            self.add(shaft, tip)
+
+
+def pairwise_arrows(sources, targets, weights, **kwargs):
+    """ArrowField from every source to every target; weights[j, i] is source i -> target j."""
+    sources = np.asarray(sources, dtype=float)
+    targets = np.asarray(targets, dtype=float)
+    starts = np.repeat(sources, len(targets), axis=0)
+    ends = np.tile(targets, (len(sources), 1))
+    return ArrowField(starts, ends, np.asarray(weights).T.reshape(-1), **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Numbers from a glyph pool
+# ---------------------------------------------------------------------------
+GLYPHS = "0123456789-."
+_STRUT = 0.1  # unscaled length of PooledNumber's invisible size/position reference
+
+
+@lru_cache(maxsize=None)
+def _glyph_pool():
+    """{char: (points, width)} at DEFAULT_FONT_SIZE, from a single MathTex.
+
+    Points are relative to the glyph's left edge and the vertical center of
+    "0", so glyphs laid side by side share a baseline.
+    """
+    tex = MathTex(*GLYPHS)
+    zero_center = tex[0].get_center()[1]
+    pool = {}
+    for char, part in zip(GLYPHS, tex):
+        points = np.concatenate([m.points for m in part.family_members_with_points()])
+        points = points - [part.get_left()[0], zero_center, 0]
+        pool[char] = (points, part.width)
+    return pool
+
+
+class _Strut(VMobject):
+    """PooledNumber's size/position reference: moves with the number, never drawn.
+
+    Every fill/stroke update keeps opacity 0, so Write's outline pass,
+    set_opacity or set_color on the number can't give it a visible stroke.
+    """
+
+    def update_rgbas_array(self, array_name, color=None, opacity=None):
+        return super().update_rgbas_array(array_name, color, 0)
+
+
+class PooledNumber(VMobject):
+    """A number drawn from pre-built digit glyphs; ``set_value`` rewrites it in place.
+
+    A drop-in for Integer/DecimalNumber labels that change often (eg. as a
+    Matrix ``element_to_mobject``): after the first instance no LaTeX or SVG
+    parsing happens, and each character slot just gets its glyph's points.
+    Size and position are read back from an invisible strut, so the number
+    can be moved, scaled or transformed like any other mobject.  To animate a
+    change: ``self.play(Transform(n, n.copy().set_value(v)))``, then
+    ``n.set_value(v)`` to keep the stored value in sync.
+    """
+
+    def __init__(self, number=0, num_decimal_places=0, font_size=DEFAULT_FONT_SIZE,
+                 color=WHITE, max_chars=1, gap=0.04, **kwargs):
+        super().__init__(**kwargs)
+        self.num_decimal_places = num_decimal_places
+        self.gap = gap
+        scale = font_size / DEFAULT_FONT_SIZE
+        strut = _Strut(stroke_width=0)
+        strut.set_points(segment_points([[-_STRUT * scale / 2, 0, 0]], [[_STRUT * scale / 2, 0, 0]]))
+        self.add(strut)
+        self.add(*[self._slot(color) for _ in range(max_chars)])
+        self.set_value(number)
+
+    @staticmethod
+    def _slot(color):
+        return VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+
+    def _format(self, number):
+        if self.num_decimal_places:
+            return f"{number:.{self.num_decimal_places}f}"
+        return str(int(round(number)))
+
+    def get_value(self):
+        return self.number
+
+    def set_value(self, number):
+        self.number = number
+        text = self._format(number)
+        strut = self.submobjects[0]
+        start, end = strut.points[0], strut.points[-1]
+        scale = np.linalg.norm(end - start) / _STRUT
+        center = (start + end) / 2
+
+        pool = _glyph_pool()
+        slots = self.submobjects[1:]
+        while len(slots) < len(text):
+            slot = self._slot(slots[0].get_fill_color() if slots else WHITE)
+            self.add(slot)
+            slots.append(slot)
+        x = 0.0
+        placed = []
+        for char in text:
+            points, width = pool[char]
+            placed.append(points + [x, 0, 0])
+            x += width + self.gap
+        offset = np.array([(x - self.gap) / 2, 0, 0])
+        for i, slot in enumerate(slots):
+            if i < len(placed):
+                slot.set_points((placed[i] - offset) * scale + center)
+            else:
+                slot.clear_points()
+        return self
+
+
+# ---------------------------------------------------------------------------
+# Batched dots / rings
+# ---------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _unit_circle_points():
+    return Circle(radius=1).points.copy()
+
+
+class DotField(VGroup):
+    """Many circles (filled dots or rings) drawn as one VMobject per color.
+
+    Every circle is a closed subpath of its color's VMobject; ``members[i]``
+    holds the indices (into `centers`) drawn by ``self[i]``.
+    """
+
+    def __init__(self, centers, radius=DEFAULT_DOT_RADIUS, colors=WHITE,
+                 fill_opacity=1.0, stroke_width=0, **kwargs):
+        super().__init__(**kwargs)
+        centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        if isinstance(colors, (list, tuple, np.ndarray)):
+            colors = list(colors)
+        else:
+            colors = [colors] * len(centers)
+        groups = {}
+        for i, color in enumerate(colors):
+            groups.setdefault(ManimColor(color).to_hex(), []).append(i)
+
+        unit = _unit_circle_points()
+        self.members = []
+        for color, indices in groups.items():
+            indices = np.array(indices)
+            field = VMobject()
+            field.set_points((centers[indices, None, :] + radius * unit[None, :, :]).reshape(-1, 3))
+            field.set_fill(color, opacity=fill_opacity)
+            field.set_stroke(color, width=stroke_width)
+            self.add(field)
+            self.members.append(indices)
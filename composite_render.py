@@ -0,0 +1,172 @@
+"""Render several scenes back to back into ONE crossfaded video, in one encode.
+
+    python composite_render.py linear_compose.py \\
+        MatrixTScene MatrixSScene CompositionSetupScene MatrixMultiplicationScene
+
+This replaces the hand-written ``ffmpeg ... xfade=...:offset=18`` recipe at
+the top of ``linear_compose.py``.  The scenes render in this process with a
+file writer that hands every frame to a single ffmpeg encoder instead of
+writing partial movies.  The last ``--fade`` seconds of each scene are held
+back and blended into the first frames of the next one, so the crossfade
+offsets follow the real scene durations (they are printed at the end, in
+ffmpeg's xfade convention) and no intermediate mp4 is ever written.
+"""
+import argparse
+import shutil
+import subprocess
+import sys
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+from manim import config, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from batch_render import QUALITIES, REPO_DIR, load_scene_module
+
+
+class CrossfadeEncoder:
+    """Single ffmpeg rawvideo pipe; consecutive scenes overlap by `fade_frames`."""
+
+    def __init__(self, output, width, height, fps, fade_seconds=1.0):
+        ffmpeg = shutil.which(config.ffmpeg_executable) or shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg not found on PATH")
+        self.output = Path(output)
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self.fps = fps
+        self.fade_frames = max(0, round(fade_seconds * fps))
+        self.frames_per_scene = []
+        self.tail = deque()     # newest frames of the current scene, not yet written
+        self.incoming = []      # previous scene's tail, blended into this scene's head
+        self.blend_index = 0
+        self.process = subprocess.Popen(
+            [ffmpeg, "-y", "-loglevel", "error",
+             "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+             "-r", str(fps), "-i", "-",
+             "-c:v", "libx264", "-profile:v", "baseline", "-pix_fmt", "yuv420p",
+             "-movflags", "+faststart", str(self.output)],
+            stdin=subprocess.PIPE,
+        )
+
+    def _write(self, frame):
+        self.process.stdin.write(frame.tobytes())
+
+    def _leftover(self):
+        # Only non-empty if a scene was shorter than the fade itself.
+        rest = self.incoming[self.blend_index:]
+        self.incoming, self.blend_index = [], 0
+        return rest
+
+    def start_scene(self):
+        if self.frames_per_scene:
+            self.tail.extend(self._leftover())
+            self.incoming = list(self.tail)
+            self.tail.clear()
+        self.frames_per_scene.append(0)
+
+    def push(self, frame):
+        self.frames_per_scene[-1] += 1
+        if self.blend_index < len(self.incoming):
+            alpha = (self.blend_index + 1) / (len(self.incoming) + 1)
+            old = self.incoming[self.blend_index].astype(np.float32)
+            frame = (old + alpha * (frame.astype(np.float32) - old)).astype(np.uint8)
+            self.blend_index += 1
+        self.tail.append(frame)
+        if len(self.tail) > self.fade_frames:
+            self._write(self.tail.popleft())
+
+    def close(self):
+        self.tail.extend(self._leftover())
+        while self.tail:
+            self._write(self.tail.popleft())
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {self.process.returncode}")
+
+    def durations(self):
+        return [n / self.fps for n in self.frames_per_scene]
+
+    def offsets(self):
+        """xfade offsets, ie. where each transition starts in the joined video."""
+        fade = self.fade_frames / self.fps
+        durations = self.durations()
+        return [sum(durations[:i]) - i * fade for i in range(1, len(durations))]
+
+
+class CompositeFileWriter(SceneFileWriter):
+    """Routes frames to the shared encoder instead of partial movie files."""
+
+    encoder = None
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.encoder.start_scene()
+
+    def add_partial_movie_file(self, hash_animation):
+        pass
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        pass
+
+    def end_animation(self, allow_write=False):
+        pass
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        # manim >= 0.19 writes a static frame once with num_frames > 1.
+        for _ in range(num_frames):
+            self.encoder.push(frame_or_renderer)
+
+    def finish(self):
+        pass
+
+
+def render_composite(path, scene_names, output, quality="l", fade_seconds=1.0):
+    """Render `scene_names` from `path` in order into one crossfaded `output`."""
+    with tempconfig({}):
+        config.quality = QUALITIES[quality]
+        config.input_file = str(path)
+        config.preview = False
+        config.disable_caching = True  # no partial movies to look up
+        config.renderer = "cairo"
+        module = load_scene_module(path)
+
+        encoder = CrossfadeEncoder(output, config.pixel_width, config.pixel_height,
+                                   config.frame_rate, fade_seconds)
+        CompositeFileWriter.encoder = encoder
+        try:
+            for name in scene_names:
+                scene_class = getattr(module, name)
+                scene = scene_class(renderer=CairoRenderer(file_writer_class=CompositeFileWriter))
+                scene.render()
+        finally:
+            encoder.close()
+            CompositeFileWriter.encoder = None
+    return encoder
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scenes", nargs="+", help="scene classes, in playback order")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("--fade", type=float, default=1.0, help="crossfade seconds")
+    parser.add_argument("-o", "--output", default=None)
+    parser.add_argument("--media-dir", default=str(REPO_DIR / "media"))
+    args = parser.parse_args(argv)
+
+    path = Path(args.file).resolve()
+    output = args.output or (
+        Path(args.media_dir) / "videos" / path.stem / "composite" / f"{path.stem}.mp4"
+    )
+    encoder = render_composite(path, args.scenes, output, args.quality, args.fade)
+    for name, seconds in zip(args.scenes, encoder.durations()):
+        print(f"{name:<28} {seconds:7.2f}s")
+    print("xfade offsets:", ", ".join(f"{o:.2f}" for o in encoder.offsets()))
+    print(encoder.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,8 @@
 from manim import *
+import math
+
+from clip_mobjects import segment_points
+from groups import cycle_type_classes, partition_of, symmetric
 
 def rotation_about_origin(theta: float):
     """
@@ -20,10 +24,15 @@ class S3ConjugacyClasses(Scene):
         # Main title at the top
         heading_text = Tex(r"Symmetric Group $S_3$ Conjugacy Classes").to_edge(UP)
         
+        # One example per conjugacy class of S_3, keyed by element order
+        S3 = symmetric(3)
+        orders = S3.element_orders()
+        examples = {int(orders[c[0]]): min(S3.labels[g] for g in c) for c in S3.conjugacy_classes()}
+
         # Explanatory texts
         identity_text = Tex(r"No change, $e = \text{identity}$").next_to(heading_text, DOWN).align_to(heading_text, LEFT)
-        reflection_text = Tex(r"Reflection, transposition, e.g.\ $(1\;2)$").move_to(identity_text)
-        rotation_text = Tex(r"Rotation, 3-cycle, e.g.\ $(1\;2\;3)$").move_to(identity_text)
+        reflection_text = Tex(rf"Reflection, transposition, e.g.\ ${examples[2]}$").move_to(identity_text)
+        rotation_text = Tex(rf"Rotation, 3-cycle, e.g.\ ${examples[3]}$").move_to(identity_text)
 
         # Show the main title on screen
         self.play(Write(heading_text))
@@ -190,3 +199,80 @@ class OldS3ConjugacyClasses(Scene):
         #     run_time=2
         # )
         # self.wait(2)
+
+
+def polygon_points(centers, vertices):
+    """Closed polylines through vertices[j] (n points each), moved to centers[j]."""
+    corners = centers[:, None, :] + vertices
+    return segment_points(corners.reshape(-1, 3), np.roll(corners, -1, axis=1).reshape(-1, 3))
+
+
+class SnConjugacyClasses(Scene):
+    """Every element of S_n on a grid, grouped and colored by conjugacy class.
+
+    In S_n two permutations are conjugate exactly when they have the same
+    cycle type, so the classes come straight from ``cycle_type_classes`` on
+    the array of all n! permutations.  Each class then acts on a small n-gon
+    at every one of its members at once: the vertex arrays of the whole class
+    are one stack of permutation matrices times the n-gon, ``eye(n)[perms] @ V``,
+    and the class is a single VMobject transformed in one animation.
+    """
+
+    def __init__(self, n=4, **kwargs):
+        super().__init__(**kwargs)
+        self.n = n
+
+    def construct(self):
+        n = self.n
+        perms = symmetric(n).perms
+        class_of, types = cycle_type_classes(perms)
+        sizes = np.bincount(class_of)
+        colors = color_gradient([BLUE, GREEN, YELLOW, ORANGE, RED, PURPLE], max(len(types), 2))
+
+        title = Tex(rf"Conjugacy classes of $S_{{{n}}}$ by cycle type").to_edge(UP)
+        self.play(Write(title))
+
+        # Grid of all n! elements, class by class, left of the legend
+        m = len(perms)
+        cols = math.ceil(math.sqrt(m * 1.6))
+        rows = math.ceil(m / cols)
+        cell = min(1.5, 8.5 / cols, 5.8 / rows)
+        slot = np.empty(m, dtype=int)
+        slot[np.argsort(class_of, kind="stable")] = np.arange(m)
+        centers = np.stack([
+            (slot % cols - (cols - 1) / 2) * cell - 2.0,
+            ((rows - 1) / 2 - slot // cols) * cell - 0.4,
+            np.zeros(m),
+        ], axis=1)
+
+        dots = PMobject(stroke_width=max(2, min(12, 40 * cell)))
+        rgbas = np.array([[*color_to_rgb(c), 1.0] for c in colors])
+        dots.add_points(centers, rgbas=rgbas[class_of])
+
+        legend = VGroup(*[
+            MathTex("(" + ",".join(map(str, partition_of(t))) + rf")\quad {sizes[c]}",
+                    font_size=min(32, 280 / len(types)), color=colors[c])
+            for c, t in enumerate(types)
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.12)
+        legend.next_to(title, DOWN, buff=0.4).to_edge(RIGHT, buff=0.6)
+
+        self.play(FadeIn(dots), FadeIn(legend, lag_ratio=0.1))
+        self.wait()
+
+        # Regular n-gon (vertex 0 at the top), and every permutation applied to it
+        angles = PI / 2 - TAU * np.arange(n) / n
+        ngon = 0.38 * cell * np.stack([np.cos(angles), np.sin(angles), np.zeros(n)], axis=1)
+        permuted = np.eye(n)[perms] @ ngon          # permuted[g, i] = ngon[perms[g, i]]
+
+        for c in range(len(types)):
+            members = np.flatnonzero(class_of == c)
+            glyphs = VMobject(stroke_color=colors[c], stroke_width=2)
+            glyphs.set_points(polygon_points(centers[members], ngon))
+            moved = glyphs.copy().set_points(polygon_points(centers[members], permuted[members]))
+
+            self.play(Create(glyphs), Indicate(legend[c], color=colors[c]), run_time=1)
+            self.play(Transform(glyphs, moved), run_time=1.5)
+            self.wait(0.5)
+
+        self.wait(2)
+
@@ -1,167 +1,254 @@
 from manim import *
+import math
 import numpy as np
 
-"""Manim scene: cosets, non‑injective map T(n)=n mod 3, quotient fixing injectivity,
+from clip_mobjects import ArrowField, DotField
+from groups import cyclic
+
+"""Manim scene: cosets, non‑injective map T(n)=kn mod M, quotient fixing injectivity,
    with labels nudged farther left so they no longer crowd the graphics.
 
 Run with (community v0.18):
     manim -pqh coset_partition_quotient.py CosetQuotientScene
+
+Any homomorphism ℤ_N → ℤ_M works, eg. CosetQuotientScene(N=360, M=12, k=1);
+elements, arrows and cluster rings are batched fields (clip_mobjects), so
+the number of animations does not grow with N.
 """
 
 class CosetQuotientScene(Scene):
+    LABEL_LIMIT = 24         # largest circle that gets a label on every element
+    STEP_LIMIT = 6           # most cosets built one at a time
+
+    def __init__(self, N=12, M=3, k=1, **kwargs):
+        super().__init__(**kwargs)
+        if (k * N) % M:
+            raise ValueError(f"n -> {k}n mod {M} is not a homomorphism from Z_{N} (needs {M} | {k}·{N})")
+        self.N = N               # size of ℤ_N
+        self.M = M               # size of ℤ_M
+        self.k = k               # T(n) = k n mod M
+
     def construct(self):
         # ----------------------------- CONFIG ---------------------------------
-        self.N = 12              # size of ℤ₁₂
-        self.step = 3            # H = 3ℤ₁₂
-        self.outer_R = 3.0       # radius of ℤ₁₂ circle
-        self.inner_r = 1.2       # radius of inner ℤ₃ circle
+        self.outer_R = 3.0       # radius of ℤ_N circle
+        self.inner_r = 1.2       # radius of inner ℤ_M circle
         self.shift_right = 4.5   # slide for codomain later
-        self.coset_colors = [BLUE, GREEN, YELLOW]
 
-        # 1 : outer circle ℤ₁₂ --------------------------------------------------
-        self.draw_z12_outer_circle()
+        # T : ℤ_N → ℤ_M, its kernel and the cosets of the kernel, from groups.py
+        self.domain, self.codomain = cyclic(self.N), cyclic(self.M)
+        self.images = (self.k * np.arange(self.N)) % self.M
+        self.kernel = self.domain.kernel(self.images, self.codomain)
+        self.coset_of = self.domain.coset_of(self.kernel)
+        self.cosets = self.domain.cosets(self.kernel)
+        self.quotient, _ = self.domain.quotient(self.kernel)
+        n_cosets = len(self.cosets)
+        if n_cosets <= 3:
+            self.coset_colors = [BLUE, GREEN, YELLOW][:n_cosets]
+        else:
+            self.coset_colors = color_gradient([BLUE, GREEN, YELLOW, ORANGE, RED, PURPLE], n_cosets)
+        # kernel = dℤ_N (d = N for the trivial kernel)
+        self.kernel_gen = int(self.kernel[1]) if len(self.kernel) > 1 else self.N
+        self.ker_tex = (r"\{0\}" if self.kernel_gen == self.N
+                        else rf"{self.kernel_gen}\mathbb{{Z}}_{{{self.N}}}")
+
+        # 1 : outer circle ℤ_N --------------------------------------------------
+        self.draw_outer_circle()
         self.wait(0.8)
 
-        # 1b : inner circle ℤ₃ + many‑to‑one map ------------------------------
-        self.draw_inner_z3_circle()
+        # 1b : inner circle ℤ_M + many‑to‑one map ------------------------------
+        self.draw_inner_circle()
         self.show_non_injective_map()
         self.wait(1.0)
 
-        # 2 : highlight kernel 3ℤ₁₂ -------------------------------------------
+        # 2 : highlight kernel dℤ_N -------------------------------------------
         self.highlight_kernel()
         self.wait(1.4)
 
-        # 3 : build cosets visually -------------------------------------------
+        # 3 : build cosets visually -------------------------------------------
         self.build_cosets()
         self.wait(1.2)
 
-        # 4 : form quotient clusters & slide ℤ₃ right --------------------------
+        # 4 : form quotient clusters & slide ℤ_M right --------------------------
         self.form_quotient_clusters()
         self.wait(0.4)
-        self.move_z3_codomain_right()
+        self.move_codomain_right()
         self.wait(1.0)
 
-        # 5 : injective factor & isomorphism ----------------------------------
+        # 5 : injective factor & isomorphism ----------------------------------
         self.show_injective_factor()
         self.wait(4.0)
 
     # ---------------------------------------------------------------------
-    def draw_z12_outer_circle(self):
-        self.outer_dots = VGroup(); self.outer_labels = VGroup()
-        for k in range(self.N):
-            ang = TAU * k / self.N
-            pos = self.outer_R * np.array([np.cos(ang), np.sin(ang), 0])
-            d = Dot(pos, radius=0.08)
-            t = MathTex(str(k), font_size=28).next_to(d, 0.25 * (pos / self.outer_R))
-            self.outer_dots.add(d); self.outer_labels.add(t)
+    @staticmethod
+    def ring(n, radius, offset=0.0):
+        """Positions of n points evenly spaced on a circle about the origin."""
+        ang = TAU * np.arange(n) / n + offset
+        return radius * np.stack([np.cos(ang), np.sin(ang), np.zeros(n)], axis=1)
+
+    def ring_labels(self, positions, radius, font_size):
+        """Labels just outside each position; every few only on a crowded circle."""
+        n = len(positions)
+        shown = range(n) if n <= self.LABEL_LIMIT else range(0, n, math.ceil(n / 12))
+        return VGroup(*[
+            MathTex(str(k), font_size=font_size).next_to(positions[k], 0.25 * (positions[k] / radius))
+            for k in shown
+        ])
+
+    # ---------------------------------------------------------------------
+    def draw_outer_circle(self):
+        self.outer_pos = self.ring(self.N, self.outer_R)
+        self.outer_dot_r = min(0.08, 0.35 * TAU * self.outer_R / self.N)
+        self.outer_dots = DotField(self.outer_pos, radius=self.outer_dot_r)
+        self.outer_labels = self.ring_labels(self.outer_pos, self.outer_R, 28)
 
         # **label moved farther left (buff = 2.0)**
-        outer_lbl = MathTex(r"\mathbb{Z}_{12}").next_to(self.outer_dots, LEFT, buff=2.0)
+        outer_lbl = MathTex(rf"\mathbb{{Z}}_{{{self.N}}}").next_to(self.outer_dots, LEFT, buff=2.0)
 
         self.play(
-            LaggedStart(*[Create(d) for d in self.outer_dots], lag_ratio=0.03, run_time=4),
+            Create(self.outer_dots, run_time=4),
             LaggedStart(*[Write(l) for l in self.outer_labels], lag_ratio=0.03, run_time=4),
             Write(outer_lbl)
         )
 
     # ---------------------------------------------------------------------
-    def draw_inner_z3_circle(self):
+    def draw_inner_circle(self):
         base = Circle(radius=self.inner_r, color=WHITE, stroke_opacity=0.3)
         self.inner_circle = DashedVMobject(base, num_dashes=60)
-        self.inner_dots = VGroup(); self.inner_labels = VGroup()
-        for k in range(self.step):
-            ang = TAU * k / self.step + PI/2
-            pos = self.inner_r * np.array([np.cos(ang), np.sin(ang), 0])
-            d = Dot(pos, radius=0.1)
-            t = MathTex(str(k)).next_to(d, 0.25 * (pos / self.inner_r))
-            self.inner_dots.add(d); self.inner_labels.add(t)
-        self.z3_label = MathTex(r"\mathbb{Z}_{3}").next_to(self.inner_circle, RIGHT, buff=0.6)
+        inner_pos = self.ring(self.M, self.inner_r, PI / 2)
+        self.inner_dots = DotField(inner_pos, radius=min(0.1, 0.35 * TAU * self.inner_r / self.M))
+        self.inner_labels = self.ring_labels(inner_pos, self.inner_r, 48 if self.M <= 6 else 28)
+        self.inner_pos = inner_pos
+        self.codomain_label = MathTex(rf"\mathbb{{Z}}_{{{self.M}}}").next_to(self.inner_circle, RIGHT, buff=0.6)
         self.play(Create(self.inner_circle, run_time=2),
-                  LaggedStart(*[Create(d) for d in self.inner_dots], lag_ratio=0.15, run_time=2),
+                  Create(self.inner_dots, run_time=2),
                   LaggedStart(*[Write(l) for l in self.inner_labels], lag_ratio=0.15, run_time=2),
-                  Write(self.z3_label))
+                  Write(self.codomain_label))
 
     # ---------------------------------------------------------------------
+    def map_arrows(self, idxs, color=WHITE, stroke_width=1.8):
+        """One ArrowField from outer elements idxs to their images T(idxs)."""
+        return ArrowField(self.outer_pos[idxs], self.inner_pos[self.images[idxs]], buckets=1,
+                          color=color, max_stroke_width=stroke_width, buff=0.08,
+                          tip_length=0.2 if self.N <= self.LABEL_LIMIT else 0.1)
+
     def show_non_injective_map(self):
-        self.non_inj_arrows = VGroup()
-        for idx, d in enumerate(self.outer_dots):
-            tgt = self.inner_dots[idx % 3]
-            self.non_inj_arrows.add(Arrow(d.get_center(), tgt.get_center(), buff=0.08, stroke_width=1.8))
-        caption_tex = MathTex(r"T(n)=n\bmod 3\;\text{(not injective)}", font_size=30)
+        self.non_inj_arrows = self.map_arrows(np.arange(self.N))
+        injective = len(self.kernel) == 1
+        caption_tex = MathTex(
+            rf"T(n)={'' if self.k == 1 else self.k}n\bmod {self.M}\;"
+            + (r"\text{(injective)}" if injective else r"\text{(not injective)}"),
+            font_size=30,
+        )
         caption_tex.to_corner(UL)
         self.play(Create(self.non_inj_arrows, run_time=3), FadeIn(caption_tex))
         self.non_inj_caption = caption_tex
 
     # ---------------------------------------------------------------------
     def highlight_kernel(self):
-        idxs_H = list(range(0, self.N, self.step))
-        kernel_dots = VGroup(*[self.outer_dots[i] for i in idxs_H])
-        kernel_arrows = VGroup(*[self.non_inj_arrows[i] for i in idxs_H])
+        kernel_dots = DotField(self.outer_pos[self.kernel], radius=self.outer_dot_r, colors=RED)
+        self.kernel_arrows = self.map_arrows(self.kernel, color=RED)
         rect = SurroundingRectangle(kernel_dots, buff=0.3, color=RED)
-        txt = MathTex(r"\ker T = 3\mathbb{Z}_{12}").next_to(rect, DOWN)
-        self.play(*[d.animate.set_color(RED) for d in kernel_dots],
-                  *[a.animate.set_color(RED) for a in kernel_arrows])
+        txt = MathTex(rf"\ker T = {self.ker_tex}").next_to(rect, DOWN)
+        self.play(FadeIn(kernel_dots), Create(self.kernel_arrows))
         self.play(Create(rect), Write(txt))
         self.play(FadeOut(rect), FadeOut(txt))
+        # The coset coloring below repaints the kernel as coset 0.
+        self.kernel_dots = kernel_dots
 
     # ---------------------------------------------------------------------
     def build_cosets(self):
-        base = np.array(list(range(0, self.N, self.step)))
-        for rep in range(self.step):
-            idxs = list((base + rep) % self.N)
-            grp = VGroup(*[self.outer_dots[i] for i in idxs], *[self.outer_labels[i] for i in idxs])
-            if rep > 0:
-                arrow = Arrow(self.outer_dots[base[0]].get_center(),
-                               self.outer_dots[idxs[0]].get_center(),
-                               buff=0.05, color=self.coset_colors[rep])
-                shift_lbl = MathTex(f"+{rep}").next_to(arrow, DOWN, buff=0.1)
-                self.play(Create(arrow), Write(shift_lbl))
-            self.play(LaggedStart(*[m.animate.set_color(self.coset_colors[rep]) for m in grp],
-                                   lag_ratio=0.03, run_time=1.5))
-            if rep > 0:
-                self.play(FadeOut(arrow), FadeOut(shift_lbl))
-        self.coset_groups = [VGroup(*[self.outer_dots[i] for i in list((base + rep) % self.N)])
-                             for rep in range(self.step)]
+        """Color every element by its coset; one coset at a time while there are few."""
+        colors = [self.coset_colors[c] for c in self.coset_of]
+        self.coset_dots = DotField(self.outer_pos, radius=self.outer_dot_r, colors=colors)
+        if len(self.cosets) > self.STEP_LIMIT:
+            self.play(FadeIn(self.coset_dots), FadeOut(self.kernel_dots), run_time=1.5)
+        else:
+            base = self.cosets[0]
+            overlays = VGroup()
+            for rep, idxs in enumerate(self.cosets):
+                color = self.coset_colors[rep]
+                if rep > 0:
+                    arrow = Arrow(self.outer_pos[base[0]], self.outer_pos[idxs[0]],
+                                  buff=0.05, color=color)
+                    shift_lbl = MathTex(f"+{rep}").next_to(arrow, DOWN, buff=0.1)
+                    self.play(Create(arrow), Write(shift_lbl))
+                overlay = DotField(self.outer_pos[idxs], radius=self.outer_dot_r, colors=color)
+                overlays.add(overlay)
+                labels = [self.outer_labels[i] for i in idxs] if self.N <= self.LABEL_LIMIT else []
+                self.play(FadeIn(overlay), *[l.animate.set_color(color) for l in labels], run_time=1.5)
+                if rep > 0:
+                    self.play(FadeOut(arrow), FadeOut(shift_lbl))
+            # Same picture, now as one field for the collapse.
+            self.remove(overlays, self.kernel_dots)
+            self.add(self.coset_dots)
+        self.remove(self.outer_dots)
 
     # ---------------------------------------------------------------------
     def form_quotient_clusters(self):
-        self.cluster_centers = VGroup(); self.cluster_circles = VGroup(); self.cluster_labels = VGroup()
-        target_R = 1.9; anims = []
-        for j, grp in enumerate(self.coset_groups):
-            ang = TAU * j / self.step + PI / 2
-            center = target_R * np.array([np.cos(ang), np.sin(ang), 0])
-            circ = DashedVMobject(Circle(radius=0.55, color=self.coset_colors[j], stroke_width=2), num_dashes=40)
-            circ.move_to(center)
-            c_dot = Dot(center, radius=0.12, color=self.coset_colors[j])
-            lbl = MathTex(f"[{j}]").next_to(c_dot, RIGHT)
-            self.cluster_centers.add(c_dot); self.cluster_circles.add(circ); self.cluster_labels.add(lbl)
-            n = len(grp)
-            for k, d in enumerate(grp):
-                theta = TAU * k / n
-                dest = center + 0.45 * np.array([np.cos(theta), np.sin(theta), 0])
-                anims.append(d.animate.move_to(dest).set_opacity(0))
-            anims += [Create(circ), GrowFromCenter(c_dot), Write(lbl)]
-        self.play(*anims, lag_ratio=0.02, run_time=6)
+        """Collapse every coset onto its own small ring in one point-array Transform."""
+        n_cosets = len(self.cosets)
+        target_R = 1.9
+        cluster_r = min(0.55, 0.8 * target_R * np.sin(PI / max(n_cosets, 2)))
+        centers = self.ring(n_cosets, target_R, PI / 2)
+
+        # Element i of a coset of size s goes to angle TAU i / s on its cluster.
+        order = np.argsort(self.coset_of, kind="stable")
+        within = np.empty(self.N, dtype=int)
+        within[order] = np.arange(self.N) % len(self.kernel)
+        dest = centers[self.coset_of] + self.ring(len(self.kernel), 0.8 * cluster_r)[within]
+        collapsed = DotField(dest, radius=self.outer_dot_r,
+                             colors=[self.coset_colors[c] for c in self.coset_of])
+        collapsed.set_opacity(0)
+
+        if n_cosets <= self.STEP_LIMIT:
+            self.cluster_circles = VGroup(*[
+                DashedVMobject(Circle(radius=cluster_r, color=self.coset_colors[j], stroke_width=2),
+                               num_dashes=40).move_to(centers[j])
+                for j in range(n_cosets)
+            ])
+        else:
+            self.cluster_circles = DotField(centers, radius=cluster_r, colors=self.coset_colors,
+                                            fill_opacity=0, stroke_width=2)
+        self.cluster_centers = DotField(centers, radius=min(0.12, 0.5 * cluster_r),
+                                        colors=self.coset_colors)
+        self.cluster_center_pos = centers
+        if n_cosets <= 12:
+            self.cluster_labels = VGroup(*[
+                MathTex(self.quotient.labels[j]).next_to(centers[j], RIGHT, buff=0.2)
+                for j in range(n_cosets)
+            ])
+        else:
+            self.cluster_labels = VGroup()
+        self.play(Transform(self.coset_dots, collapsed),
+                  Create(self.cluster_circles), GrowFromCenter(self.cluster_centers),
+                  *[Write(l) for l in self.cluster_labels], run_time=6)
 
         # **quotient label moved farther left (buff = 2.0)**
-        quot_lbl = MathTex(r"\mathbb{Z}_{12}/3\mathbb{Z}_{12}")\
+        quot_lbl = MathTex(rf"\mathbb{{Z}}_{{{self.N}}}/{self.ker_tex}")\
                      .next_to(self.cluster_circles, LEFT, buff=2.0)
         self.play(Write(quot_lbl))
 
     # ---------------------------------------------------------------------
-    def move_z3_codomain_right(self):
-        group = VGroup(self.inner_circle, self.inner_dots, self.inner_labels, self.z3_label)
+    def move_codomain_right(self):
+        group = VGroup(self.inner_circle, self.inner_dots, self.inner_labels, self.codomain_label)
         self.play(group.animate.shift(RIGHT * self.shift_right),
-                  FadeOut(self.non_inj_arrows), FadeOut(self.non_inj_caption), run_time=3)
-        self.codomain_dots = self.inner_dots
+                  FadeOut(self.non_inj_arrows), FadeOut(self.kernel_arrows),
+                  FadeOut(self.non_inj_caption), run_time=3)
+        self.inner_pos = self.inner_pos + RIGHT * self.shift_right
 
     # ---------------------------------------------------------------------
     def show_injective_factor(self):
-        inj_arrows = VGroup()
-        for j in range(self.step):
-            inj_arrows.add(Arrow(self.cluster_centers[j].get_center(),
-                                 self.codomain_dots[j].get_center(),
-                                 buff=0.1, stroke_width=2.5, color=self.coset_colors[j]))
+        # Coset j is sent to T(representative of j), one arrow per coset.
+        reps = np.array([c[0] for c in self.cosets])
+        starts, ends = self.cluster_center_pos, self.inner_pos[self.images[reps]]
+        if len(self.cosets) <= self.STEP_LIMIT:
+            inj_arrows = VGroup(*[
+                ArrowField(starts[[j]], ends[[j]], buckets=1, color=self.coset_colors[j],
+                           max_stroke_width=2.5, buff=0.1)
+                for j in range(len(self.cosets))
+            ])
+        else:
+            inj_arrows = ArrowField(starts, ends, buckets=1, max_stroke_width=2.5, buff=0.1, tip_length=0.1)
         caption = Text("Injective after quotient", font_size=24).to_corner(UL)
         self.play(Create(inj_arrows, run_time=2.5), FadeIn(caption))
         iso = MathTex(r"\cong", font_size=80).move_to(inj_arrows.get_center())
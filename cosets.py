@@ -2,42 +2,74 @@ from manim import *
 import math
 import numpy as np
 
-class CosetsAndWaveInZ12(Scene):
+from clip_mobjects import ArrowField, DotField, segment_points
+from groups import cyclic
+
+class CosetsAndWaveInZn(Scene):
+    """Cosets of H = <d> in Z_n next to a wave with the same period, gcd(n, d).
+
+    Elements, subgroup rings and wave segments are each drawn as one
+    array-backed field per coset color, so n can be in the hundreds; element
+    labels, coset listings and per-element arrows are only drawn while they
+    are still legible.
+    """
+    LABEL_LIMIT = 24       # largest n with a numeric label under every element
+    ARROW_LIMIT = 24       # largest coset size that still gets per-element arrows
+    STEP_LIMIT = 6         # most cosets shown one at a time
+
+    def __init__(self, n=12, d=4, **kwargs):
+        super().__init__(**kwargs)
+        self.n = n
+        self.d = d
+
     def construct(self):
         ##################################################
         # 1) Basic Setup & Function Definitions
         ##################################################
-        n = 12                            # |Z_12|=12
-        spacing = 1.0                     # horizontal spacing
-        dot_radius = 0.1                  # size of points
-        coset_colors = [RED, GREEN, BLUE, ORANGE]
-        
-        # Subgroup H = <4> = {0,4,8}
-        H = {0, 4, 8}
-        
+        n, d = self.n, self.d
+        group = cyclic(n)
+        H = group.closure([d % n])       # H = <d> = <gcd(n, d)>
+        coset_of = group.coset_of(H)     # coset g + H is numbered g, the residue mod gcd(n, d)
+        period = n // len(H)
+        spacing = min(1.0, 13.0 / max(n - 1, 1))   # horizontal spacing
+        dot_radius = min(0.1, 0.3 * spacing)        # size of points
+        ring_radius = min(0.3, 0.45 * spacing)
+        if period <= 4:
+            coset_colors = [RED, GREEN, BLUE, ORANGE][:period]
+        else:
+            coset_colors = color_gradient([RED, ORANGE, YELLOW, GREEN, BLUE, PURPLE], period)
+
+        elements = np.arange(n)
+
         # We'll shift everything (wave & line) by Y_SHIFT downward
         # so there's extra space at the top for the combined label.
         Y_SHIFT = -0.7
 
-        # Sine-wave-like function with period 4:
+        # Sine wave with the period of the cosets:
         #   wave_offset is the base vertical shift for the wave
         #   wave_amplitude is how tall/low the wave goes
         WAVE_OFFSET = 2.0
         WAVE_AMPLITUDE = 0.7
-        
-        # f(x) = wave_offset + wave_amplitude*sin((π/2)*x), then shifted by Y_SHIFT
+
+        # f(x) = wave_offset + wave_amplitude*sin(2π x / period), then shifted by Y_SHIFT
         def f(x):
             return (WAVE_OFFSET + Y_SHIFT
-                    + WAVE_AMPLITUDE * math.sin((math.pi/2)*x))
+                    + WAVE_AMPLITUDE * np.sin(2 * np.pi * np.asarray(x) / period))
 
-        # Center the points 0..11 horizontally
+        # Center the points 0..n-1 horizontally
         left_x = - (n - 1) * spacing / 2
+        xs = left_x + elements * spacing
+        positions = np.stack([xs, np.full(n, Y_SHIFT), np.zeros(n)], axis=1)
 
         ##################################################
-        # 2) Top label: G, H, and f(x)=f(x+4) in one line
+        # 2) Top label: G, H, and f(x)=f(x+period) in one line
         ##################################################
+        if len(H) <= 6:
+            h_set = r"\{" + ",".join(str(h) for h in H) + r"\} = "
+        else:
+            h_set = ""
         top_label = MathTex(
-            r"G = \mathbb{Z}_{12},\quad H = \{0,4,8\} = \langle 4\rangle,\quad f(x) = f(x+4)"
+            rf"G = \mathbb{{Z}}_{{{n}}},\quad H = {h_set}\langle {d}\rangle,\quad f(x) = f(x+{period})"
         )
         top_label.to_edge(UP)  # place at top of the scene
         self.play(Write(top_label))
@@ -46,33 +78,34 @@ class CosetsAndWaveInZ12(Scene):
         ##################################################
         # 3) Create & Animate the Wave Segments
         ##################################################
+        # Segment [k, k+1] is the chord from f(k) to f(k+1), colored by k's coset;
+        # all segments of one coset are subpaths of one VMobject.
         wave_segments = VGroup()
-        for k in range(n):
-            start_point = np.array([left_x + k * spacing,     f(k),   0])
-            end_point   = np.array([left_x + (k+1) * spacing, f(k+1), 0])
-            segment = Line(
-                start=start_point,
-                end=end_point,
-                color=coset_colors[k % 4],
-                stroke_width=3
-            )
+        for r in range(period):
+            ks = elements[coset_of == r]
+            zeros = np.zeros(len(ks))
+            starts = np.stack([left_x + ks * spacing, f(ks), zeros], axis=1)
+            ends = np.stack([left_x + (ks + 1) * spacing, f(ks + 1), zeros], axis=1)
+            segment = VMobject(stroke_color=coset_colors[r], stroke_width=3)
+            segment.set_points(segment_points(starts, ends))
             wave_segments.add(segment)
-        
+
         self.play(Create(wave_segments))
         self.wait()
 
         ##################################################
-        # 4) Create Z_12 Points (Dots) & Numeric Labels
+        # 4) Create Z_n Points (Dots) & Numeric Labels
         ##################################################
-        points = VGroup()
-        labels = VGroup()
-        for k in range(n):
-            x_coord = left_x + k * spacing
-            # The number line is at y=Y_SHIFT
-            dot = Dot([x_coord, Y_SHIFT, 0], radius=dot_radius)
-            label = Tex(str(k)).next_to(dot, DOWN, buff=0.2)
-            points.add(dot)
-            labels.add(label)
+        points = DotField(positions, radius=dot_radius)
+        if n <= self.LABEL_LIMIT:
+            labelled = elements
+        else:
+            # A dozen or so evenly spaced labels (always including 0 and n-1)
+            labelled = np.unique(np.append(elements[::math.ceil(n / 12)], n - 1))
+        labels = VGroup(*[
+            Tex(str(k)).scale(min(1.0, 3 * spacing)).next_to(positions[k] + DOWN * dot_radius, DOWN, buff=0.2)
+            for k in labelled
+        ])
 
         self.play(Create(points), Write(labels))
         self.wait()
@@ -80,11 +113,8 @@ class CosetsAndWaveInZ12(Scene):
         ##################################################
         # 5) Highlight Subgroup H
         ##################################################
-        subgroup_circles = VGroup()
-        for h in H:
-            circle = Circle(radius=0.3, color=YELLOW)
-            circle.move_to(points[h].get_center())
-            subgroup_circles.add(circle)
+        subgroup_circles = DotField(positions[H], radius=ring_radius, colors=YELLOW,
+                                    fill_opacity=0, stroke_width=4)
 
         self.play(Create(subgroup_circles))
         self.wait()
@@ -92,62 +122,60 @@ class CosetsAndWaveInZ12(Scene):
         ##################################################
         # 6) Show Cosets g + H with Labels & Arrows
         ##################################################
-        # We'll place coset labels below the line in 2 rows, 2 columns:
-        #   g=0 -> top-left
-        #   g=1 -> top-right
-        #   g=2 -> bottom-left
-        #   g=3 -> bottom-right
+        if period > self.STEP_LIMIT:
+            # Too many cosets to step through: color every element by its coset at once.
+            colored = DotField(positions, radius=ring_radius, colors=[coset_colors[r] for r in coset_of],
+                               fill_opacity=0, stroke_width=3)
+            summary = MathTex(rf"|G/H| = {period} \text{{ cosets of size }} {n // period}")
+            summary.move_to([0, Y_SHIFT - 1.6, 0])
+            self.play(Create(colored), Write(summary))
+            self.wait(2)
+            return
+
+        # Coset labels go below the line, 2 per row (3 per row for 5-6 cosets):
+        #   g=0 -> top-left, g=1 -> top-right, g=2 -> bottom-left, ...
         # Shift them relative to Y_SHIFT so they're safely in view.
+        per_row = 2 if period <= 4 else 3
         coset_positions = [
-            (-4, Y_SHIFT - 1.6),  # g=0 (top-left)
-            ( 0, Y_SHIFT - 1.6),  # g=1 (top-right)
-            (-4, Y_SHIFT - 2.6),  # g=2 (bottom-left)
-            ( 0, Y_SHIFT - 2.6)   # g=3 (bottom-right)
+            (-4 + 4 * (g % per_row), Y_SHIFT - 1.6 - (g // per_row))
+            for g in range(period)
         ]
 
-        for g in range(4):
-            # Sort coset elements
-            coset = sorted(((x + g) % n) for x in H)
+        for g in range(period):
+            # Coset elements, already sorted
+            coset = elements[coset_of == g]
             color = coset_colors[g]
 
             # Draw circles around coset elements
-            coset_group = VGroup()
-            for c in coset:
-                c_circle = Circle(radius=0.3, color=color).move_to(points[c].get_center())
-                coset_group.add(c_circle)
+            coset_group = DotField(positions[coset], radius=ring_radius, colors=color,
+                                   fill_opacity=0, stroke_width=4)
             self.play(Create(coset_group))
 
             # Label for coset
-            coset_label_str = f"{g}+H = " + "{" + ",".join(str(x) for x in coset) + "}"
-            coset_label = Tex(coset_label_str)
+            if len(coset) <= 6:
+                listed = ",".join(str(x) for x in coset)
+            else:
+                listed = f"{coset[0]},{coset[1]},\\ldots,{coset[-1]}"
+            coset_label = Tex(f"{g}+H = " + "{" + listed + "}")
             (x_pos, y_pos) = coset_positions[g]
             coset_label.move_to([x_pos, y_pos, 0])
             self.play(Write(coset_label))
 
+            if len(coset) > self.ARROW_LIMIT:
+                self.wait(1)
+                continue
+
             # Draw arrows: from each coset element to label & wave
-            arrows = VGroup()
-            for c in coset:
-                # Arrow from dot to coset label
-                arrow_label = Arrow(
-                    start=points[c].get_bottom() + DOWN*0.1,
-                    end=coset_label.get_top() + UP*0.05,
-                    buff=0.1,
-                    stroke_width=3,
-                    color=color
-                )
-                arrows.add(arrow_label)
-
-                # Arrow from dot to midpoint of wave segment [c, c+1]
-                mid_x = c + 0.5
-                mid_point = np.array([left_x + mid_x*spacing, f(mid_x), 0])
-                arrow_wave = Arrow(
-                    start=points[c].get_top() + UP*0.1,
-                    end=mid_point,
-                    buff=0,
-                    stroke_width=3,
-                    color=color
-                )
-                arrows.add(arrow_wave)
+            dot_tops = positions[coset] + UP * (dot_radius + 0.1)
+            dot_bottoms = positions[coset] + DOWN * (dot_radius + 0.1)
+            mid_x = coset + 0.5
+            wave_mids = np.stack([left_x + mid_x * spacing, f(mid_x), np.zeros(len(coset))], axis=1)
+            label_top = np.repeat([coset_label.get_top() + UP * 0.05], len(coset), axis=0)
+            arrows = ArrowField(
+                np.concatenate([dot_bottoms, dot_tops]),
+                np.concatenate([label_top, wave_mids]),
+                buckets=1, color=color, max_stroke_width=3, buff=0.05,
+            )
 
             self.play(Create(arrows))
             self.wait(1)
@@ -158,3 +186,8 @@ class CosetsAndWaveInZ12(Scene):
 
         # Final pause
         self.wait(2)
+
+
+class CosetsAndWaveInZ12(CosetsAndWaveInZn):
+    def __init__(self, **kwargs):
+        super().__init__(n=12, d=4, **kwargs)
@@ -0,0 +1,341 @@
+"""Finite groups as NumPy Cayley tables, for scenes that need group structure.
+
+    from groups import cyclic, dihedral, symmetric
+
+    Z = cyclic(12)
+    H = Z.closure([4])            # array([0, 4, 8])
+    Z.coset_of(H)                 # coset number of every element
+    S = symmetric(5)
+    S.class_of()                  # conjugacy class number of every element
+
+Elements are the integers ``0 .. order - 1`` and ``table[a, b]`` is the
+element ``a·b``, so every structural question is array indexing: left cosets
+of H are the rows of ``table[:, H]``, conjugates of x are
+``table[table[g, x], inverse[g]]`` over all g, and so on.  Cosets and
+conjugacy classes are numbered by their smallest element.
+
+Permutation groups (``dihedral``, ``symmetric``) keep their elements as rows
+of ``perms``, composing as functions, ``(a·b)[i] = a[b[i]]``.  Their tables
+are built in chunks: each chunk of products is encoded as a base-n integer
+and looked up among the codes of ``perms``.  The tables, and conjugacy
+classes, are saved as ``.npz`` under ``media/groups`` so S_7 (5040 elements)
+is only worked out once per machine.
+"""
+import hashlib
+import itertools
+import os
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR = Path(__file__).resolve().parent / "media" / "groups"
+# Bump when the stored arrays change meaning, so stale files are never read.
+CACHE_VERSION = 1
+# Rough number of array entries handled per chunk.
+CHUNK = 1 << 24
+
+
+def _index_dtype(order):
+    return np.int16 if order <= np.iinfo(np.int16).max else np.int32
+
+
+def _stored(cache_dir, stem, build):
+    """``build()``'s dict of arrays, saved as ``<stem>.npz`` on first use."""
+    if cache_dir is None:
+        return build()
+    path = Path(cache_dir) / f"{stem}-v{CACHE_VERSION}.npz"
+    if path.exists():
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+    arrays = build()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Parallel renders may build the same group; publish the file atomically.
+    partial = path.with_name(f"{path.stem}.{os.getpid()}.npz")
+    np.savez(partial, **arrays)
+    os.replace(partial, path)
+    return arrays
+
+
+# ---------------------------------------------------------------------------
+# Permutations
+# ---------------------------------------------------------------------------
+def permutation_codes(perms):
+    """Each row of `perms` read as a base-n integer (lexicographic order)."""
+    perms = np.asarray(perms)
+    n = perms.shape[-1]
+    codes = np.zeros(perms.shape[:-1], dtype=np.int64)
+    for i in range(n):
+        codes *= n
+        codes += perms[..., i]
+    return codes
+
+
+def permutation_table(perms):
+    """Cayley table of the permutations in `perms` under composition.
+
+    Product codes are looked up in a dense code -> element array when n^n is
+    small (n <= 8), otherwise by binary search in the sorted codes.
+    """
+    perms = np.asarray(perms)
+    m, n = perms.shape
+    codes = permutation_codes(perms)
+    if n ** n <= CHUNK:
+        lookup = np.full(n ** n, -1, dtype=np.int32)
+        lookup[codes] = np.arange(m)
+
+        def find(products):
+            return lookup[products]
+    else:
+        order = np.argsort(codes)
+        sorted_codes = codes[order]
+
+        def find(products):
+            found = np.minimum(np.searchsorted(sorted_codes, products), m - 1)
+            return np.where(sorted_codes[found] == products, order[found], -1)
+
+    table = np.empty((m, m), dtype=_index_dtype(m))
+    chunk = max(1, CHUNK // (m * n))
+    for lo in range(0, m, chunk):
+        # products[a, b] encodes perms[a][perms[b]]
+        found = find(permutation_codes(perms[lo:lo + chunk][:, perms]))
+        if (found < 0).any():
+            raise ValueError("permutations are not closed under composition")
+        table[lo:lo + chunk] = found
+    return table
+
+
+def cycle_notation(perm, empty="e"):
+    """TeX cycle notation on 1..n, eg. ``(1\\;2)(3\\;4)``; `empty` for the identity."""
+    perm = [int(p) for p in perm]
+    seen = [False] * len(perm)
+    cycles = []
+    for start in range(len(perm)):
+        if seen[start]:
+            continue
+        cycle = []
+        i = start
+        while not seen[i]:
+            seen[i] = True
+            cycle.append(str(i + 1))
+            i = perm[i]
+        if len(cycle) > 1:
+            cycles.append("(" + r"\;".join(cycle) + ")")
+    return "".join(cycles) or empty
+
+
+def cycle_types(perms):
+    """``types[g, k - 1]`` = number of k-cycles of permutation g, for all rows at once."""
+    perms = np.asarray(perms, dtype=np.int64)
+    m, n = perms.shape
+    rows = np.arange(m)[:, None]
+    start = np.arange(n)
+    # lengths[g, i] = length of the cycle of g through i: first k with g^k(i) = i
+    lengths = np.zeros((m, n), dtype=np.int64)
+    image = perms
+    for k in range(1, n + 1):
+        lengths[(image == start) & (lengths == 0)] = k
+        image = perms[rows, image]
+    sizes = np.arange(1, n + 1)
+    return (lengths[:, :, None] == sizes).sum(axis=1) // sizes
+
+
+def cycle_type_classes(perms):
+    """(class_of, types): permutations grouped by cycle type, which in S_n are
+    exactly the conjugacy classes.  Classes are numbered by smallest member,
+    like ``FiniteGroup.class_of``; ``types[c]`` is class c's cycle type.
+    """
+    types, first, class_of = np.unique(cycle_types(perms), axis=0,
+                                       return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return rank[class_of.ravel()], types[order]
+
+
+def partition_of(cycle_type):
+    """Cycle lengths in decreasing order, eg. [2, 0, 1] -> [3, 1, 1]."""
+    return [k for k in range(len(cycle_type), 0, -1) for _ in range(int(cycle_type[k - 1]))]
+
+
+# ---------------------------------------------------------------------------
+# Groups
+# ---------------------------------------------------------------------------
+class FiniteGroup:
+    """A group given by its Cayley table; see the module docstring."""
+
+    def __init__(self, name, table, perms=None, labels=None, cache_dir=None, digest=None):
+        self.name = name
+        self.table = np.asarray(table)
+        self.perms = perms
+        self._labels = labels
+        self.cache_dir = cache_dir
+        self._digest = digest
+
+    def __repr__(self):
+        return f"<FiniteGroup {self.name} of order {self.order}>"
+
+    def __len__(self):
+        return self.order
+
+    @property
+    def order(self):
+        return len(self.table)
+
+    @cached_property
+    def identity(self):
+        # By cancellation, e is the only element with e·0 = 0.
+        return int(np.flatnonzero(self.table[:, 0] == 0)[0])
+
+    @cached_property
+    def inverse(self):
+        rows, cols = np.nonzero(self.table == self.identity)
+        inverse = np.empty(self.order, dtype=self.table.dtype)
+        inverse[rows] = cols
+        return inverse
+
+    @cached_property
+    def labels(self):
+        if self._labels is not None:
+            return list(self._labels)
+        if self.perms is not None:
+            return [cycle_notation(p) for p in self.perms]
+        return [str(g) for g in range(self.order)]
+
+    def _cache_stem(self, what):
+        if self._digest is None:
+            self._digest = hashlib.sha1(np.ascontiguousarray(self.table).tobytes()).hexdigest()[:12]
+        return f"{self.name}-{self._digest}-{what}"
+
+    def multiply(self, a, b):
+        return self.table[a, b]
+
+    def element_orders(self):
+        """Order of every element, by repeated multiplication of all of them at once."""
+        elements = np.arange(self.order)
+        orders = np.zeros(self.order, dtype=np.int64)
+        power = elements
+        k = 1
+        while not orders.all():
+            orders[(power == self.identity) & (orders == 0)] = k
+            power = self.table[power, elements]
+            k += 1
+        return orders
+
+    # -- subgroups and cosets ----------------------------------------------
+    def closure(self, generators):
+        """Sorted elements of the subgroup generated by `generators`."""
+        generators = np.unique(np.asarray(generators, dtype=np.int64))
+        members = np.array([self.identity])
+        frontier = members
+        while len(frontier) and len(generators):
+            products = np.unique(self.table[np.ix_(frontier, generators)])
+            frontier = np.setdiff1d(products, members, assume_unique=True)
+            members = np.union1d(members, frontier)
+        return members
+
+    def is_subgroup(self, H):
+        H = np.asarray(H)
+        return bool(np.isin(self.table[np.ix_(H, H)], H).all()) and self.identity in H
+
+    def _coset_keys(self, H, side):
+        """Smallest member of the coset containing each element."""
+        H = np.asarray(H)
+        if side == "left":          # gH
+            return self.table[:, H].min(axis=1)
+        if side == "right":         # Hg
+            return self.table[H, :].min(axis=0)
+        raise ValueError(f"side must be 'left' or 'right', not {side!r}")
+
+    def coset_of(self, H, side="left"):
+        """Coset number of every element, cosets numbered by smallest member."""
+        return np.unique(self._coset_keys(H, side), return_inverse=True)[1]
+
+    def cosets(self, H, side="left"):
+        """List of sorted coset arrays, in coset-number order."""
+        coset_of = self.coset_of(H, side)
+        order = np.argsort(coset_of, kind="stable")
+        return np.split(order, np.flatnonzero(np.diff(coset_of[order])) + 1)
+
+    def is_normal(self, H):
+        return np.array_equal(self._coset_keys(H, "left"), self._coset_keys(H, "right"))
+
+    def quotient(self, N, name=None):
+        """(G/N, projection) where projection[g] is the coset gN as an element of G/N."""
+        if not self.is_normal(N):
+            raise ValueError(f"subgroup is not normal in {self.name}")
+        reps, projection = np.unique(self._coset_keys(N, "left"), return_inverse=True)
+        table = projection[self.table[np.ix_(reps, reps)]].astype(_index_dtype(len(reps)))
+        labels = [f"[{self.labels[r]}]" for r in reps]
+        return FiniteGroup(name or f"{self.name}/N", table, labels=labels), projection
+
+    # -- homomorphisms -------------------------------------------------------
+    def is_homomorphism(self, images, target):
+        """Whether g -> images[g] respects multiplication into `target`."""
+        images = np.asarray(images)
+        return np.array_equal(images[self.table], target.table[images[:, None], images[None, :]])
+
+    def kernel(self, images, target):
+        """Sorted elements sent to the identity of `target`."""
+        return np.flatnonzero(np.asarray(images) == target.identity)
+
+    # -- conjugacy ------------------------------------------------------------
+    def class_of(self):
+        """Conjugacy class number of every element, classes numbered by smallest member."""
+        def build():
+            smallest = np.arange(self.order)
+            chunk = max(1, CHUNK // self.order)
+            for lo in range(0, self.order, chunk):
+                g = np.arange(lo, min(lo + chunk, self.order))
+                # conjugates[i, x] = g_i x g_i^-1
+                conjugates = self.table[self.table[g], self.inverse[g][:, None]]
+                np.minimum(smallest, conjugates.min(axis=0), out=smallest)
+            return {"class_of": np.unique(smallest, return_inverse=True)[1]}
+
+        return _stored(self.cache_dir, self._cache_stem("classes"), build)["class_of"]
+
+    def conjugacy_classes(self):
+        """List of sorted class arrays, in class-number order."""
+        class_of = self.class_of()
+        order = np.argsort(class_of, kind="stable")
+        return np.split(order, np.flatnonzero(np.diff(class_of[order])) + 1)
+
+
+# ---------------------------------------------------------------------------
+# Constructors
+# ---------------------------------------------------------------------------
+def permutation_group(name, perms, labels=None, cache_dir=CACHE_DIR):
+    """Group of the rows of `perms`, its table read from / saved to `cache_dir`."""
+    perms = np.asarray(perms, dtype=np.int8 if np.shape(perms)[-1] <= 127 else np.int16)
+    digest = hashlib.sha1(np.ascontiguousarray(perms).tobytes()).hexdigest()[:12]
+    stored = _stored(cache_dir, f"{name}-{digest}-table", lambda: {"table": permutation_table(perms)})
+    return FiniteGroup(name, stored["table"], perms=perms, labels=labels,
+                       cache_dir=cache_dir, digest=digest)
+
+
+@lru_cache(maxsize=None)
+def cyclic(n):
+    """Z_n under addition; element k is the residue k."""
+    k = np.arange(n)
+    return FiniteGroup(f"Z{n}", ((k[:, None] + k[None, :]) % n).astype(_index_dtype(n)))
+
+
+@lru_cache(maxsize=None)
+def dihedral(n):
+    """Symmetries of the n-gon acting on its vertices 0..n-1 (order 2n).
+
+    Elements 0..n-1 are the rotations r^k (i -> i + k), n..2n-1 the
+    reflections sr^k (i -> -i - k), with s: i -> -i.
+    """
+    i = np.arange(n)
+    k = np.arange(n)[:, None]
+    perms = np.concatenate([(i + k) % n, (-i - k) % n])
+    power = ["", "r"] + [f"r^{{{j}}}" for j in range(2, n)]
+    labels = ["e"] + power[1:] + ["s" + p for p in power]
+    return permutation_group(f"D{n}", perms, labels=labels)
+
+
+@lru_cache(maxsize=None)
+def symmetric(n):
+    """All permutations of 0..n-1, in lexicographic order (element 0 is e)."""
+    return permutation_group(f"S{n}", list(itertools.permutations(range(n))))
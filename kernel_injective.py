@@ -2,7 +2,10 @@
 from manim import *
 import numpy as np
 
-class KernelInjectiveIllustration(Scene):
+from clip_mobjects import plane_to_points
+from static_layer import StaticLayerMixin
+
+class KernelInjectiveIllustration(StaticLayerMixin, Scene):
     """
     Visual proof sketch that a homomorphism (here, a linear map) has
     trivial kernel  ⇔  it is injective.
@@ -28,6 +31,46 @@ class KernelInjectiveIllustration(Scene):
         self.wait(0.5)
         self.play(title.animate.to_edge(UP, buff=0.4))
 
+        domain_plane, codomain_plane, diagram_group = self.draw_planes()
+        self.promote_to_background(diagram_group)
+
+        # ════════════════════════════════════════════════════════════
+        # PART 1 — Trivial kernel  ⇒  Injective
+        # ════════════════════════════════════════════════════════════
+        self.trivial_kernel_part(domain_plane, codomain_plane)
+
+        # ════════════════════════════════════════════════════════════
+        # PART 2 — Non‑trivial kernel  ⇒  Not injective
+        # ════════════════════════════════════════════════════════════
+        self.non_trivial_kernel_part(domain_plane, codomain_plane)
+
+        # ----------  Wrap‑up slide  ----------
+        self.demote(diagram_group)
+        self.play(FadeOut(diagram_group), FadeOut(title))
+
+        summary_title = Tex(r"\textbf{Key Fact:}", font_size=40)
+        summary_math = MathTex(
+            r"\ker\varphi = \{0\} \iff \varphi \text{ is injective}",
+            font_size=40,
+        )
+        summary = VGroup(summary_title, summary_math).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.3,
+        )
+        box = SurroundingRectangle(summary, buff=0.4)
+        self.play(FadeIn(summary, box))
+        self.wait(2)
+
+        self.post_video_proof()
+
+        self.wait(2)
+
+    # ---------------------------------------------------------------
+    #  Helper blocks
+    # ---------------------------------------------------------------
+    def draw_planes(self):
+        """Domain and codomain planes joined by the map arrow φ."""
         # ----------  Domain / Codomain setup  ----------
         plane_scale = 0.8
         plane_edge_buff = 0.2
@@ -66,40 +109,8 @@ class KernelInjectiveIllustration(Scene):
             phi_tex,
         )
 
-        # ════════════════════════════════════════════════════════════
-        # PART 1 — Trivial kernel  ⇒  Injective
-        # ════════════════════════════════════════════════════════════
-        self.trivial_kernel_part(domain_plane, codomain_plane)
+        return domain_plane, codomain_plane, diagram_group
 
-        # ════════════════════════════════════════════════════════════
-        # PART 2 — Non‑trivial kernel  ⇒  Not injective
-        # ════════════════════════════════════════════════════════════
-        self.non_trivial_kernel_part(domain_plane, codomain_plane)
-
-        # ----------  Wrap‑up slide  ----------
-        self.play(FadeOut(diagram_group), FadeOut(title))
-
-        summary_title = Tex(r"\textbf{Key Fact:}", font_size=40)
-        summary_math = MathTex(
-            r"\ker\varphi = \{0\} \iff \varphi \text{ is injective}",
-            font_size=40,
-        )
-        summary = VGroup(summary_title, summary_math).arrange(
-            DOWN,
-            aligned_edge=LEFT,
-            buff=0.3,
-        )
-        box = SurroundingRectangle(summary, buff=0.4)
-        self.play(FadeIn(summary, box))
-        self.wait(2)
-
-        self.post_video_proof()
-
-        self.wait(2)
-
-    # ---------------------------------------------------------------
-    #  Helper blocks
-    # ---------------------------------------------------------------
     def trivial_kernel_part(self, domain_plane, codomain_plane):
         """Show that a map with trivial kernel is injective."""
         # A full‑rank linear map (rotation + shear) ⇒ ker = {0}
@@ -275,3 +286,92 @@ class KernelInjectiveIllustration(Scene):
         for line in proof_lines:
             self.play(Write(line))
             self.wait(0.4)
+
+
+def random_map(rng, rank):
+    """Random 2x2 matrix of the given rank, built from random singular vectors."""
+    U, _, Vt = np.linalg.svd(rng.normal(size=(2, 2)))
+    s = rng.uniform(0.5, 1.0, size=2)
+    s[rank:] = 0
+    return U @ np.diag(s) @ Vt
+
+
+class KernelPointCloudIllustration(KernelInjectiveIllustration):
+    """
+    The same statement shown statistically: thousands of sampled vectors go
+    through a random invertible map and then a random rank‑1 map.
+
+    Rank and kernel come from the SVD of each map.  Domain and image are one
+    PMobject each, colored by the coordinate along the first right singular
+    vector, so under the rank‑1 map every color collapses to a single image
+    point; the whole cloud moves to its image in one Transform.
+    """
+    def __init__(self, samples=3000, seed=0, **kwargs):
+        super().__init__(**kwargs)
+        self.samples = samples
+        self.seed = seed
+
+    def construct(self):
+        title = MathTex(r"\text{Trivial Kernel} \iff \text{Injective}", font_size=48)
+        title.to_edge(UP, buff=0.4)
+        self.play(Write(title))
+
+        domain_plane, codomain_plane, diagram_group = self.draw_planes()
+        self.promote_to_background(diagram_group)
+
+        rng = np.random.default_rng(self.seed)
+        coords = rng.uniform([-3.8, -2.8], [3.8, 2.8], size=(self.samples, 2))
+        for rank in (2, 1):
+            self.point_cloud_part(domain_plane, codomain_plane, random_map(rng, rank), coords)
+
+        self.demote(diagram_group)
+        self.play(FadeOut(diagram_group), FadeOut(title))
+        self.wait(1)
+
+    def point_cloud_part(self, domain_plane, codomain_plane, matrix, coords):
+        """Map every sampled vector at once; mark the kernel if there is one."""
+        # Shrink the map so every image stays on the codomain plane.
+        images = coords @ matrix.T
+        matrix = matrix * min(1.0, 0.95 * np.min(np.array([4.0, 3.0]) / np.abs(images).max(axis=0)))
+        images = coords @ matrix.T
+
+        _, singular, Vt = np.linalg.svd(matrix)
+        rank = int((singular > 1e-9 * max(singular[0], 1e-12)).sum())
+        kernel = Vt[rank:]
+
+        along = coords @ Vt[0]
+        t = ((along - along.min()) / np.ptp(along))[:, None]
+        rgbas = np.ones((len(coords), 4))
+        rgbas[:, :3] = (1 - t) * color_to_rgb(BLUE) + t * color_to_rgb(YELLOW)
+
+        cloud = PMobject(stroke_width=3)
+        cloud.add_points(plane_to_points(domain_plane, coords), rgbas=rgbas)
+        image = cloud.copy()
+        image.points = plane_to_points(codomain_plane, images)
+        moving = cloud.copy()
+
+        self.play(FadeIn(cloud))
+        self.play(Transform(moving, image), run_time=3)
+
+        verdict = r"\text{Injective}" if rank == 2 else r"\text{Not injective}"
+        note = MathTex(
+            rf"\operatorname{{rank}}\varphi = {rank},\quad \dim\ker\varphi = {2 - rank}"
+            rf"\ \Rightarrow\ {verdict}",
+            font_size=28,
+        ).next_to(codomain_plane, DOWN, buff=0.6)
+        extras = [note]
+        anims = [Write(note)]
+        if len(kernel):
+            # The kernel line, clipped to the domain plane.
+            direction = kernel[0]
+            reach = min(4.0 / max(abs(direction[0]), 1e-9), 3.0 / max(abs(direction[1]), 1e-9))
+            ker_line = Line(*plane_to_points(domain_plane, [-reach * direction, reach * direction]),
+                            color=RED, stroke_width=6)
+            ker_label = MathTex(r"\ker\varphi", color=RED).next_to(ker_line.get_end(), UP, buff=0.1)
+            extras += [ker_line, ker_label]
+            anims += [Create(ker_line), FadeIn(ker_label)]
+        self.play(*anims)
+        self.wait(2)
+
+        self.play(FadeOut(cloud, moving, *extras))
+
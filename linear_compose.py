@@ -1,18 +1,15 @@
 from manim import *
 import numpy as np
 
-# Cross-fade the 4 sub-scenes together via, eg: 
+from clip_mobjects import ArrowField, PooledNumber, pairwise_arrows
+
+# Cross-fade the 4 sub-scenes together in a single encode via:
+#
+# python composite_render.py linear_compose.py \
+#     MatrixTScene MatrixSScene CompositionSetupScene MatrixMultiplicationScene
 #
-# ffmpeg -i MatrixTScene.mp4 -i MatrixSScene.mp4 -i CompositionSetupScene.mp4 -i MatrixMultiplicationScene.mp4 \
-# -filter_complex "\
-# [0:v]format=yuv420p, setpts=PTS-STARTPTS[v0]; \
-# [1:v]format=yuv420p, setpts=PTS-STARTPTS[v1]; \
-# [2:v]format=yuv420p, setpts=PTS-STARTPTS[v2]; \
-# [3:v]format=yuv420p, setpts=PTS-STARTPTS[v3]; \
-# [v0][v1]xfade=transition=fade:duration=1:offset=18[v01]; \
-# [v01][v2]xfade=transition=fade:duration=1:offset=46[v012]; \
-# [v012][v3]xfade=transition=fade:duration=1:offset=59[v]" \
-# -map "[v]" -c:v libx264 -profile:v baseline -pix_fmt yuv420p -movflags +faststart -c:a aac output.mp4
+# The xfade offsets are worked out from the actual scene durations (and printed),
+# so they no longer need updating by hand whenever a scene's timing changes.
 
 
 # Set the frame dimensions (works for Manim Community v0.16+)
@@ -28,8 +25,11 @@ class MatrixMultiplicationScene(Scene):
         matrix_B = Matrix([[3],
                            [7],
                            [2]])
-        matrix_AB = Matrix([["0"],
-                            ["0"]])
+        # AB's entries change every step, so draw them from the glyph pool.
+        matrix_AB = Matrix([[0],
+                            [0]],
+                           element_to_mobject=PooledNumber,
+                           element_to_mobject_config={"max_chars": 3})
         times_sign = Tex("$\\times$")
         equals_sign = Tex("$=$")
         matrices = VGroup(matrix_A, times_sign, matrix_B, equals_sign, matrix_AB).arrange(RIGHT, buff=1)
@@ -147,6 +147,9 @@ class MatrixMultiplicationScene(Scene):
         self.wait(0.5)
 
         # --- Animate the computation of M(ST) and update the AB matrix ---
+        # The term label is built once; only its numbers change per step.
+        term_a, term_b, term_product = (PooledNumber(max_chars=n) for n in (1, 1, 2))
+        term = VGroup(term_a, MathTex(r"\times"), term_b, MathTex("="), term_product).scale(0.7)
         for j, w in enumerate(w_dots):
             total = 0
             for i in range(3):
@@ -166,15 +169,17 @@ class MatrixMultiplicationScene(Scene):
                 self.wait(0.5)
 
                 # Show the multiplication term on the left (near u node).
-                term = Tex(f"$ {A_values[j][i]}\\times {B_values[i]} = {product}$").scale(0.7)
-                term.next_to(u_dot, LEFT, buff=1.0)
+                term_a.set_value(A_values[j][i])
+                term_b.set_value(B_values[i])
+                term_product.set_value(product)
+                term.arrange(RIGHT, buff=0.15).next_to(u_dot, LEFT, buff=1.0)
                 self.play(Write(term))
                 self.wait(0.5)
 
                 total += product
                 ab_entry = matrix_AB.get_entries()[j]
-                new_val = Tex(f"$ {total}$").scale(0.8).move_to(ab_entry.get_center())
-                self.play(Transform(ab_entry, new_val))
+                self.play(Transform(ab_entry, ab_entry.copy().set_value(total)))
+                ab_entry.set_value(total)
                 self.wait(0.5)
                 self.play(FadeOut(term))
             self.wait(1)
@@ -376,3 +381,204 @@ class CompositionSetupScene(Scene):
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.5).scale(0.8).next_to(comp_eq, DOWN, buff=1)
         self.play(Write(derivation))
         self.wait(2)
+
+
+
+# ---------------------------------------------------------------------------
+# Generated graph scenes for arbitrary A (m x n) and B (n x k)
+#
+#     class MyComposition(CompositionGraphScene):
+#         A = np.array(...)
+#         B = np.array(...)
+#
+# or MyComposition = composition_graph_scene(A, B); LinearMapGraphScene draws
+# T (M = B) or S (M = A, domain "v", codomain "w") on their own.  Edges are
+# batched ArrowFields (a few VMobjects per layer, weight shown by thickness);
+# numbers are only drawn for small shapes.
+# ---------------------------------------------------------------------------
+LABEL_LIMIT = 4  # largest dimension that still gets matrices and weight labels
+
+
+def column_positions(count, x, spacing=2.0, height=5.0, y_shift=0.0):
+    """Node positions in a vertical column at x, top to bottom, centered on y_shift."""
+    spacing = min(spacing, height / max(count - 1, 1))
+    ys = spacing * ((count - 1) / 2 - np.arange(count)) + y_shift
+    return np.stack([np.full(count, float(x)), ys, np.zeros(count)], axis=1)
+
+
+def graph_nodes(positions, color, symbol=None, direction=UP):
+    """Dots (and, when `symbol` is given, subscripted labels) at each position."""
+    radius = DEFAULT_DOT_RADIUS if len(positions) <= 10 else DEFAULT_SMALL_DOT_RADIUS
+    dots = VGroup(*[Dot(point=p, radius=radius, color=color) for p in positions])
+    labels = VGroup()
+    if symbol is not None:
+        labels = VGroup(*[
+            MathTex(f"{symbol}_{{{i + 1}}}").next_to(dot, direction)
+            for i, dot in enumerate(dots)
+        ])
+    return dots, labels
+
+
+def weight_labels(sources, targets, weights, offset=0.3):
+    """One number per edge, offset perpendicular to the edge from its midpoint."""
+    labels = VGroup()
+    for i, src in enumerate(sources):
+        for j, dst in enumerate(targets):
+            direction = dst - src
+            normal = np.array([-direction[1], direction[0], 0])
+            norm = np.linalg.norm(normal)
+            normal = normal / norm if norm != 0 else normal
+            labels.add(MathTex(str(weights[j][i])).scale(0.7).move_to((src + dst) / 2 + normal * offset))
+    return labels
+
+
+def matrix_mobject(M):
+    return Matrix([[str(v) for v in row] for row in np.asarray(M)])
+
+
+class LinearMapGraphScene(Scene):
+    """Graph of one linear map: node i of the domain -> node j with weight M[j, i]."""
+    M = np.array([[3], [7], [2]])
+    map_name = "T"
+    domain = "u"
+    codomain = "v"
+
+    def __init__(self, M=None, **kwargs):
+        super().__init__(**kwargs)
+        if M is not None:
+            self.M = M
+        self.M = np.atleast_2d(np.asarray(self.M))
+
+    def construct(self):
+        M = self.M
+        rows, cols = M.shape
+        small = max(rows, cols) <= LABEL_LIMIT
+
+        if small:
+            title = VGroup(MathTex(rf"M({self.map_name}) ="), matrix_mobject(M).scale(0.7))
+            title.arrange(RIGHT).to_edge(UP)
+        else:
+            title = MathTex(rf"M({self.map_name}) \in \mathbb{{R}}^{{{rows} \times {cols}}}").to_edge(UP)
+        self.play(Write(title))
+
+        sources = column_positions(cols, -6, y_shift=-0.8)
+        targets = column_positions(rows, 6, y_shift=-0.8)
+        src_dots, src_labels = graph_nodes(sources, BLUE, self.domain if small else None, LEFT)
+        dst_dots, dst_labels = graph_nodes(targets, GREEN, self.codomain if small else None, RIGHT)
+        self.play(FadeIn(src_dots), FadeIn(src_labels), FadeIn(dst_dots), FadeIn(dst_labels))
+
+        edges = pairwise_arrows(sources, targets, M)
+        labels = weight_labels(sources, targets, M) if small else VGroup()
+        self.play(Create(edges), FadeIn(labels))
+        self.wait(0.5)
+
+        # Highlight each domain node's image, one batched field at a time.
+        run_time = 0.5 if small else max(0.2, 10 / cols)
+        for i in range(cols):
+            image = pairwise_arrows(sources[i:i + 1], targets, M[:, i:i + 1], color=YELLOW)
+            self.play(FadeIn(image), run_time=run_time)
+            self.play(FadeOut(image), run_time=run_time)
+        self.wait(2)
+
+
+class CompositionGraphScene(Scene):
+    """U -> V -> W graph of S∘T with M(T) = B (n x k) and M(S) = A (m x n).
+
+    Each entry (AB)[j, c] is shown by highlighting its n paths u_c -> v_r -> w_j
+    as one field, weighted by the products A[j, r] * B[r, c].
+    """
+    A = np.array([[4, 1, 8], [5, 6, 0]])
+    B = np.array([[3], [7], [2]])
+
+    def __init__(self, A=None, B=None, **kwargs):
+        super().__init__(**kwargs)
+        if A is not None:
+            self.A = A
+        if B is not None:
+            self.B = B
+        self.A = np.atleast_2d(np.asarray(self.A))
+        self.B = np.atleast_2d(np.asarray(self.B))
+        if self.A.shape[1] != self.B.shape[0]:
+            raise ValueError(f"cannot compose {self.A.shape} with {self.B.shape}")
+
+    def construct(self):
+        A, B = self.A, self.B
+        AB = A @ B
+        (m, n), k = A.shape, B.shape[1]
+        small = max(m, n, k) <= LABEL_LIMIT
+
+        if small:
+            matrix_A, matrix_B = matrix_mobject(A), matrix_mobject(B)
+            matrix_AB = Matrix([[0] * k for _ in range(m)], element_to_mobject=PooledNumber,
+                               element_to_mobject_config={"max_chars": len(str(np.abs(AB).max())) + 1})
+            header = VGroup(matrix_A, MathTex(r"\times"), matrix_B, MathTex("="), matrix_AB)
+            header.arrange(RIGHT, buff=0.6).scale(0.7).to_edge(UP)
+        else:
+            header = MathTex(
+                rf"A \in \mathbb{{R}}^{{{m} \times {n}}},\quad B \in \mathbb{{R}}^{{{n} \times {k}}}"
+            ).to_edge(UP)
+        self.play(Write(header))
+
+        graph_shift = -1.6 if small else -0.6
+        u_pos = column_positions(k, -5, y_shift=graph_shift)
+        v_pos = column_positions(n, 0, y_shift=graph_shift)
+        w_pos = column_positions(m, 5, y_shift=graph_shift)
+        symbols = ("u", "v", "w") if small else (None, None, None)
+        nodes = [
+            graph_nodes(u_pos, BLUE, symbols[0], LEFT),
+            graph_nodes(v_pos, GREEN, symbols[1], UP),
+            graph_nodes(w_pos, RED, symbols[2], RIGHT),
+        ]
+        self.play(*[FadeIn(part) for dots, labels in nodes for part in (dots, labels)])
+
+        # Edge weights: u_c -> v_r is B[r, c]; v_r -> w_j is A[j, r].
+        uv = pairwise_arrows(u_pos, v_pos, B, color=BLUE_B)
+        vw = pairwise_arrows(v_pos, w_pos, A, color=RED_B)
+        uv_labels = weight_labels(u_pos, v_pos, B) if small else VGroup()
+        vw_labels = weight_labels(v_pos, w_pos, A) if small else VGroup()
+        self.play(Create(uv), FadeIn(uv_labels))
+        self.play(Create(vw), FadeIn(vw_labels))
+        self.wait(0.5)
+
+        readout_label = MathTex("(AB)_{j,c} =", font_size=36)
+        readout = PooledNumber(0, font_size=36, max_chars=len(str(np.abs(AB).max())) + 1)
+        readout_group = VGroup(readout_label, readout).arrange(RIGHT).to_edge(DOWN)
+        if not small:
+            self.add(readout_group)
+
+        run_time = 0.5 if small else max(0.1, 15 / (m * k))
+        for j in range(m):
+            for c in range(k):
+                terms = A[j, :] * B[:, c]
+                starts = np.concatenate([np.repeat(u_pos[c:c + 1], n, axis=0), v_pos])
+                ends = np.concatenate([v_pos, np.repeat(w_pos[j:j + 1], n, axis=0)])
+                paths = ArrowField(starts, ends, np.concatenate([terms, terms]), color=YELLOW)
+                self.play(FadeIn(paths), run_time=run_time)
+                if small:
+                    expression = MathTex(
+                        rf"(AB)_{{{j + 1},{c + 1}}} = "
+                        + " + ".join(rf"{A[j, r]} \cdot {B[r, c]}" for r in range(n))
+                        + f" = {AB[j, c]}"
+                    ).to_edge(DOWN)
+                    entry = matrix_AB.get_entries()[j * k + c]
+                    self.play(Write(expression), Transform(entry, entry.copy().set_value(AB[j, c])))
+                    entry.set_value(AB[j, c])
+                    self.wait(0.5)
+                    self.play(FadeOut(expression), FadeOut(paths), run_time=run_time)
+                else:
+                    readout.set_value(AB[j, c])
+                    self.play(FadeOut(paths), run_time=run_time)
+        self.wait(2)
+
+
+def composition_graph_scene(A, B, name=None):
+    """A CompositionGraphScene subclass with A and B bound, for the manim CLI."""
+    A, B = np.atleast_2d(np.asarray(A)), np.atleast_2d(np.asarray(B))
+    name = name or f"CompositionGraph{A.shape[0]}x{A.shape[1]}x{B.shape[1]}"
+    return type(name, (CompositionGraphScene,), {"A": A, "B": B})
+
+
+class CompositionGraph10(CompositionGraphScene):
+    """A 10x10 by 10x10 composition with random small integer weights."""
+    A = np.random.default_rng(1).integers(0, 10, size=(10, 10))
+    B = np.random.default_rng(2).integers(0, 10, size=(10, 10))
@@ -1,13 +1,32 @@
 from manim import *
+import numpy as np
+
+from clip_mobjects import grid_path, hatched_box
 
 class MatrixDotProductCenter(Scene):
+    """Row-by-row picture of b = Ax.
+
+    With pipeline_depth=1 each row's five stages (rotate, pass through x,
+    dither, merge, move) play one after another.  With pipeline_depth=d up to
+    d rows are in flight at once: row i+1 starts 1/d of the way through row
+    i's stages, so the total runs about (1 + (rows - 1) / d) rows long.
+    """
+
+    def __init__(self, rows=4, cols=3, pipeline_depth=1, **kwargs):
+        super().__init__(**kwargs)
+        self.rows = rows
+        self.cols = cols
+        self.pipeline_depth = pipeline_depth
+
     def construct(self):
         # --------------------------------------------------
-        # 1) SETUP: Create A (4x3), x (3x1), but NOT b's boxes yet
+        # 1) SETUP: Create A (rows x cols), x (cols x 1), but NOT b's boxes yet
         # --------------------------------------------------
-        rows, cols = 4, 3
-        box_size = 0.6
-        box_buff = 0.1
+        rows, cols = self.rows, self.cols
+        # 0.6 with a 0.1 gap, shrunk when the rows would not fit on screen
+        box_size = min(0.6, 4.5 / (max(rows, cols) * 7 / 6))
+        box_buff = box_size / 6
+        label_buff = min(1.0, 2.5 * box_size)
 
         # 1a) Matrix A
         matrix_boxes = VGroup()
@@ -24,9 +43,9 @@ class MatrixDotProductCenter(Scene):
         
         # Give A a label, with bigger vertical buff
         label_A = MathTex("A")
-        label_A.next_to(matrix_boxes, UP, buff=1.0)  # Increased from 0.5
+        label_A.next_to(matrix_boxes, UP, buff=label_buff)  # Increased from 0.5
 
-        # 1b) Vector x (3x1)
+        # 1b) Vector x (cols x 1)
         vector_boxes = VGroup()
         for _ in range(cols):
             sq = Square(side_length=box_size)
@@ -37,7 +56,7 @@ class MatrixDotProductCenter(Scene):
 
         # Label x with a bigger buff as well
         label_x = MathTex("x")
-        label_x.next_to(vector_boxes, UP, buff=1.0)  # Increased from 0.5
+        label_x.next_to(vector_boxes, UP, buff=label_buff)  # Increased from 0.5
 
         # Group A and x so we can center them together
         ax_group = VGroup(matrix_boxes, vector_boxes)
@@ -78,28 +97,12 @@ class MatrixDotProductCenter(Scene):
         # 3) DOT PRODUCT ANIMATION (Row by Row)
         # --------------------------------------------------
 
-        def create_dithered_box(side_length):
-            """Black fill + white stroke + horizontal stripes."""
-            outer_sq = Square(side_length=side_length)
-            outer_sq.set_fill(BLACK, opacity=1)
-            outer_sq.set_stroke(WHITE, width=2)
-
-            stripes = VGroup()
-            top = side_length / 2
-            bottom = -side_length / 2
-            left = -side_length / 2
-            right = side_length / 2
-            stripe_spacing = 0.08
-            y = top
-            while y > bottom:
-                line = Line([left, y, 0], [right, y, 0])
-                line.set_stroke(WHITE, width=1, opacity=0.7)
-                stripes.add(line)
-                y -= stripe_spacing
-
-            return VGroup(outer_sq, stripes)
-
-        for i, row_group in enumerate(matrix_boxes):
+        def row_stages(i, row_group):
+            """The five animations taking row i of A to entry i of b.
+
+            Targets are computed up front from where each stage leaves the
+            row, so the stages can run inside a Succession.
+            """
             # Copy row i "in place"
             row_copy = row_group.copy()
             self.add(row_copy)  # on top of original
@@ -116,33 +119,185 @@ class MatrixDotProductCenter(Scene):
                 desired_center = sq_x.get_center() + LEFT * shift_left
                 sq_t.shift(desired_center - sq_t.get_center())
 
-            # Animate into that position
-            self.play(Transform(row_copy, row_target), run_time=2)
-
             # (b) "Pass through" x from left->right
             pass_distance = 2.0
-            self.play(row_copy.animate.shift(RIGHT * pass_distance), run_time=2)
+            passed = row_target.copy().shift(RIGHT * pass_distance)
 
             # (c) Transform squares into dithered boxes
             dithered_copies = VGroup()
-            for sq_copy in row_copy:
-                new_box = create_dithered_box(box_size)
-                new_box.move_to(sq_copy.get_center())
+            for sq_passed in passed:
+                new_box = hatched_box(box_size)
+                new_box.move_to(sq_passed.get_center())
                 dithered_copies.add(new_box)
-            self.play(
+
+            # (d) Merge partial-product squares into 1 final box
+            final_box = hatched_box(box_size)
+            final_box.move_to(passed.get_center())
+
+            return [
+                Transform(row_copy, row_target, run_time=2),
+                ApplyMethod(row_copy.shift, RIGHT * pass_distance, run_time=2),
+                AnimationGroup(
+                    *[
+                        Transform(sq_copy, d_box)
+                        for sq_copy, d_box in zip(row_copy, dithered_copies)
+                    ],
+                    run_time=1
+                ),
+                Transform(row_copy, final_box, run_time=1),
+                # (e) Move that final box to the correct position
+                ApplyMethod(row_copy.move_to, result_positions[i], run_time=1),
+            ]
+
+        if self.pipeline_depth <= 1:
+            for i, row_group in enumerate(matrix_boxes):
+                for stage in row_stages(i, row_group):
+                    self.play(stage)
+        else:
+            self.play(LaggedStart(
                 *[
-                    Transform(sq_copy, d_box)
-                    for sq_copy, d_box in zip(row_copy, dithered_copies)
+                    Succession(*row_stages(i, row_group))
+                    for i, row_group in enumerate(matrix_boxes)
                 ],
-                run_time=1
-            )
+                lag_ratio=1 / self.pipeline_depth
+            ))
 
-            # (d) Merge partial-product squares into 1 final box
-            final_box = create_dithered_box(box_size)
-            final_box.move_to(row_copy.get_center())
-            self.play(Transform(row_copy, final_box), run_time=1)
+        self.wait(2)
+
+
+# ---------------------------------------------------------------------------
+# Matrix-vector product from real data
+# ---------------------------------------------------------------------------
+def heat_pixels(values, scale):
+    """RGBA uint8 pixels for a 2-D array: blue (negative) .. grey (0) .. red (positive)."""
+    t = np.clip(np.asarray(values, dtype=float) / (scale or 1.0), -1, 1)[..., None]
+    mid = color_to_rgb(GREY_E)
+    rgb = np.where(t < 0, mid + (-t) * (color_to_rgb(BLUE) - mid), mid + t * (color_to_rgb(RED) - mid))
+    alpha = np.full(t.shape, 255, dtype=np.uint8)
+    return np.concatenate([(rgb * 255).round().astype(np.uint8), alpha], axis=-1)
+
+
+def heatmap(values, cell, scale):
+    """One ImageMobject (one pixel per entry, nearest-neighbour scaled) plus its grid."""
+    values = np.atleast_2d(values)
+    rows, cols = values.shape
+    image = ImageMobject(heat_pixels(values, scale))
+    image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+    image.stretch_to_fit_width(cols * cell).stretch_to_fit_height(rows * cell)
+    grid = grid_path(rows, cols, cell, stroke_color=GREY_B,
+                     stroke_width=1 if max(rows, cols) <= 16 else 0.5)
+    return image, grid.move_to(image)
+
+
+def value_labels(values, cell, at):
+    """Numbers over each entry of a (small) matrix whose image is centered at `at`."""
+    values = np.atleast_2d(values)
+    rows, cols = values.shape
+    integral = np.issubdtype(values.dtype, np.integer)
+    labels = VGroup()
+    for r in range(rows):
+        for c in range(cols):
+            label = Integer(int(values[r, c])) if integral else DecimalNumber(values[r, c], num_decimal_places=1)
+            label.scale_to_fit_height(cell * 0.35)
+            if label.width > cell * 0.9:
+                label.scale_to_fit_width(cell * 0.9)
+            label.move_to(at + cell * np.array([c - (cols - 1) / 2, (rows - 1) / 2 - r, 0]))
+            labels.add(label)
+    return labels
+
+
+class MatrixVectorProduct(Scene):
+    """b = Ax for an actual NumPy A (m x n) and x (n), up to about 64 x 64.
+
+    A, x, the per-row products a_i * x and b are each a single heatmap image
+    with one grid path, so the mobject count does not depend on the shape.
+    Entry values are written on top only up to `label_limit` rows/columns.
+    One ValueTracker walks the rows; its updater rewrites the product column
+    and the filled part of b in the images' pixel arrays.
+    """
+    label_limit = 8
+
+    def __init__(self, A=None, x=None, **kwargs):
+        super().__init__(**kwargs)
+        if A is None:
+            rng = np.random.default_rng(0)
+            A = rng.integers(-4, 5, size=(6, 5))
+            x = rng.integers(-3, 4, size=5)
+        self.A = np.asarray(A)
+        self.x = np.asarray(x).reshape(-1)
+        if self.A.ndim != 2 or self.A.shape[1] != len(self.x):
+            raise ValueError(f"cannot multiply {self.A.shape} by {self.x.shape}")
+
+    def construct(self):
+        A, x = self.A, self.x
+        b = A @ x
+        products = A * x  # row i holds the terms of b[i]
+        rows, cols = A.shape
+        cell = min(0.6, 5.0 / max(rows, cols), 7.0 / (cols + 6))
+        labelled = max(rows, cols) <= self.label_limit
+
+        A_img, A_grid = heatmap(A, cell, np.abs(A).max())
+        x_img, x_grid = heatmap(x[:, None], cell, np.abs(x).max())
+        prod_scale = np.abs(products).max()
+        prod_img, prod_grid = heatmap(np.zeros((cols, 1)), cell, prod_scale)
+        b_scale = np.abs(b).max()
+        b_img, b_grid = heatmap(np.zeros((rows, 1)), cell, b_scale)
+        blank = b_img.pixel_array[0, 0].copy()
+
+        times = MathTex(r"\cdot")
+        arrow = MathTex(r"\to")
+        equals = MathTex("=")
+        layout = Group(A_img, times, x_img, arrow, prod_img, equals, b_img)
+        layout.arrange(RIGHT, buff=0.5).move_to(DOWN * 0.3)
+        for grid, image in ((A_grid, A_img), (x_grid, x_img), (prod_grid, prod_img), (b_grid, b_img)):
+            grid.move_to(image)
+
+        names = VGroup(
+            MathTex("A").next_to(A_img, UP),
+            MathTex("x").next_to(x_img, UP),
+            MathTex(r"a_i \odot x").next_to(prod_img, UP),
+            MathTex("b").next_to(b_img, UP),
+        )
+        shape = MathTex(rf"{rows} \times {cols}", font_size=32).next_to(A_img, DOWN)
+        self.add(A_img, x_img, prod_img, b_img, A_grid, x_grid, prod_grid, b_grid,
+                 times, arrow, equals, names, shape)
+
+        b_labels = VGroup()
+        if labelled:
+            self.add(value_labels(A, cell, A_img.get_center()),
+                     value_labels(x[:, None], cell, x_img.get_center()))
+            b_labels = value_labels(b[:, None], cell, b_img.get_center()).set_opacity(0)
+            self.add(b_labels)
+
+        # -------------------------------
+        # Row sweep
+        # -------------------------------
+        progress = ValueTracker(0)
+        row_box = Rectangle(width=cols * cell, height=cell, stroke_color=YELLOW, stroke_width=3)
+        b_box = Square(side_length=cell, stroke_color=YELLOW, stroke_width=3)
+        A_top, b_top = A_img.get_top()[1], b_img.get_top()[1]
+        b_pixels = heat_pixels(b[:, None], b_scale)
+        product_pixels = heat_pixels(products[:, :, None], prod_scale)  # (rows, cols, 1, 4)
 
-            # (e) Move that final box to the correct position
-            self.play(row_copy.animate.move_to(result_positions[i]), run_time=1)
+        def sweep(mob):
+            done = int(np.clip(progress.get_value(), 0, rows))
+            row = min(done, rows - 1)
+            prod_img.pixel_array[:] = product_pixels[row]
+            b_img.pixel_array[:done] = b_pixels[:done]
+            b_img.pixel_array[done:] = blank
+            row_box.move_to([A_img.get_center()[0], A_top - (row + 0.5) * cell, 0])
+            b_box.move_to([b_img.get_center()[0], b_top - (row + 0.5) * cell, 0])
+            for i, label in enumerate(b_labels):
+                label.set_opacity(1 if i < done else 0)
 
+        # The updater sits on everything it changes, added last: Cairo treats
+        # every mobject from the first one with an updater onwards as moving,
+        # so A, x and the labels stay in the static frame and these don't.
+        live = Group(prod_img, b_img, prod_grid, b_grid, b_labels, row_box, b_box)
+        live.add_updater(sweep)
+        sweep(live)
+        self.add(live)
+        self.play(progress.animate.set_value(rows), run_time=min(2 * rows, 20), rate_func=linear)
+        live.remove_updater(sweep)
+        self.play(FadeOut(row_box), FadeOut(b_box))
         self.wait(2)
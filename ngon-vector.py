@@ -1,273 +1,280 @@
 from manim import *
 
-class RepeatedNGon(Scene):
-    def construct(self):
-        # ------------------------------
-        # Coordinate Plane
-        # ------------------------------
+from clip_mobjects import PooledNumber
+from static_layer import StaticLayerMixin
+
+# Above this N, vertex-by-vertex animation (~5 plays per vertex) gets tedious
+# to watch and slow to render; draw the whole sum in one sweep instead.
+FAST_THRESHOLD = 32
+
+
+def ngon_backdrop():
+    """The coordinate plane and unit circle the n-gon clips are drawn on."""
+    plane = NumberPlane(
+        x_range=[-3, 3, 1],
+        y_range=[-3, 3, 1],
+        background_line_style={
+            "stroke_color": BLUE_E,
+            "stroke_width": 1,
+            "stroke_opacity": 0.4
+        },
+    )
+    return plane, Circle(radius=1, color=WHITE)
+
+
+def draw_backdrop(scene, backdrop, bake, *alongside):
+    """Fade in the plane, then create the circle (together with `alongside`)."""
+    plane, unit_circle = backdrop
+    scene.play(FadeIn(plane))
+    scene.play(Create(unit_circle), *alongside)
+    if bake:
+        # Never changes afterwards: bake it into the background (the rasterized
+        # layer is reused for every N drawn in the same process).
+        scene.promote_to_background(plane, unit_circle)
+
+
+def do_target_animation(scene, N, fast=None, backdrop_first=True, bake=True):
+    """The whole n-gon clip for one N on `scene`.
+
+    `fast` (default: N > FAST_THRESHOLD) draws all N steps in one animation
+    instead of a handful of plays per vertex.  `backdrop_first=False` shows
+    the formula before the plane and circle (InscribedNGonWithSummation's
+    order), and `bake` needs a StaticLayerMixin scene; pass False otherwise."""
+    if fast is None:
+        fast = N > FAST_THRESHOLD
+    animation = ngon_fast_animation if fast else ngon_animation
+    backdrop = ngon_backdrop()
+    if backdrop_first:
+        draw_backdrop(scene, backdrop, bake)
+        scene.wait()
+        animation(scene, N)
+    else:
+        animation(scene, N, backdrop, bake)
+
+
+def ngon_animation(scene, N, backdrop=None, bake=False):
+    """Roots of unity for N drawn one by one: rotating vector, inscribed N-gon
+    and tip-to-tail partial sums, ending at the origin.  A `backdrop` still
+    to be drawn comes in after the formula, its circle with the vector."""
+    # ------------------------------
+    # 1) Parameters
+    # ------------------------------
+    angle_step = 2 * PI / N
+
+    # ------------------------------
+    # 2) Summation Equation & N=...
+    # ------------------------------
+    # Summation expression in terms of N
+    # Placed in the top-right corner
+    sum_expr = MathTex(
+        r"\sum_{k=0}^{N-1} e^{2 \pi i \frac{k}{N}} = 0"
+    ).to_corner(UP + RIGHT)
+
+    # Label for N (e.g., "N = 8"), placed below the summation
+    N_label = Tex(rf"N = {N}").next_to(sum_expr, DOWN, buff=0.3).align_to(sum_expr, RIGHT)
+
+    # Show them on screen
+    scene.play(FadeIn(sum_expr), FadeIn(N_label))
+    scene.wait(1)
+
+    # ------------------------------
+    # 4) Unit Circle & Initial Vector
+    # ------------------------------
+    vector = Arrow(start=ORIGIN, end=RIGHT, buff=0, color=YELLOW)
+
+    if backdrop is None:
+        scene.play(Create(vector))
+    else:
+        draw_backdrop(scene, backdrop, bake, Create(vector))
+    scene.wait()
+
+    # Keep track of endpoints for the inscribed N-gon
+    previous_endpoint = vector.get_end()
+    # Keep track of partial sums for the tip-to-tail path
+    partial_position = ORIGIN
+
+    # ------------------------------
+    # 5) Bottom "k = ..." Label
+    # ------------------------------
+    # We'll transform this label from k=0 to k=1 to k=2, etc., instead of overwriting.
+    current_k_label = Tex(r"k = 0").set_color(BLUE).to_edge(DOWN)
+    scene.play(FadeIn(current_k_label))
+
+    # Draw initial dotted line
+    # d) Tip-to-Tail partial sum (dotted blue line)
+    dotted_line = DashedLine(
+        start=ORIGIN,
+        end=previous_endpoint,
+        color=BLUE,
+        dash_length=0.05
+    )
+    partial_position = previous_endpoint
+    scene.play(Create(dotted_line), run_time=0.5)
+
+    # ------------------------------
+    # 6) Animate Rotations & Summation Steps
+    # ------------------------------
+    for k in range(1,N):
+
+        # b) Rotate the vector by angle_step
+        scene.play(Rotate(vector, angle=angle_step, about_point=ORIGIN), run_time=1)
+
+        # Transform the old label into the new one
+        new_k_label = Tex(rf"k = {k}").set_color(BLUE).to_edge(DOWN)
+        scene.play(ReplacementTransform(current_k_label, new_k_label))
+        current_k_label = new_k_label
+
+        # c) Draw the red line for the inscribed side
+        new_endpoint = vector.get_end()
+        edge_line = Line(previous_endpoint, new_endpoint, color=RED)
+        scene.play(Create(edge_line), run_time=0.3)
+        previous_endpoint = new_endpoint
 
-        for N in range(3, 9):
-            self.clear()
-            plane = NumberPlane(
-                x_range=[-3, 3, 1],
-                y_range=[-3, 3, 1],
-                background_line_style={
-                    "stroke_color": BLUE_E,
-                    "stroke_width": 1,
-                    "stroke_opacity": 0.4
-                },
-            )        
-            self.play(FadeIn(plane))
-            unit_circle = Circle(radius=1, color=WHITE)
-            self.play(Create(unit_circle))
-            self.wait()
-            self.ngonAnimation(N)
-                               
-    def ngonAnimation(self, N):
-        # ------------------------------
-        # 1) Parameters
-        # ------------------------------
-        angle_step = 2 * PI / N
-
-        # ------------------------------
-        # 2) Summation Equation & N=...
-        # ------------------------------
-        # Summation expression in terms of N
-        # Placed in the top-right corner
-        sum_expr = MathTex(
-            r"\sum_{k=0}^{N-1} e^{2 \pi i \frac{k}{N}} = 0"
-        ).to_corner(UP + RIGHT)
-
-        # Label for N (e.g., "N = 8"), placed below the summation
-        N_label = Tex(rf"N = {N}").next_to(sum_expr, DOWN, buff=0.3).align_to(sum_expr, RIGHT)
-
-        # Show them on screen
-        self.play(FadeIn(sum_expr), FadeIn(N_label))
-        self.wait(1)
-
-        # ------------------------------
-        # 4) Unit Circle & Initial Vector
-        # ------------------------------
-        vector = Arrow(start=ORIGIN, end=RIGHT, buff=0, color=YELLOW)
-
-        self.play(Create(vector))
-        self.wait()
-
-        # Keep track of endpoints for the inscribed N-gon
-        previous_endpoint = vector.get_end()
-        # Keep track of partial sums for the tip-to-tail path
-        partial_position = ORIGIN
-
-        # ------------------------------
-        # 5) Bottom "k = ..." Label
-        # ------------------------------
-        # We'll transform this label from k=0 to k=1 to k=2, etc., instead of overwriting.
-        current_k_label = Tex(r"k = 0").set_color(BLUE).to_edge(DOWN)
-        self.play(FadeIn(current_k_label))
-
-        # Draw initial dotted line
         # d) Tip-to-Tail partial sum (dotted blue line)
+        current_vector = new_endpoint - ORIGIN
+        next_partial_position = partial_position + current_vector
         dotted_line = DashedLine(
-            start=ORIGIN,
-            end=previous_endpoint,
+            start=partial_position,
+            end=next_partial_position,
             color=BLUE,
             dash_length=0.05
         )
-        partial_position = previous_endpoint
-        self.play(Create(dotted_line), run_time=0.5)
-
-        # ------------------------------
-        # 6) Animate Rotations & Summation Steps
-        # ------------------------------
-        for k in range(1,N):
-
-            # b) Rotate the vector by angle_step
-            self.play(Rotate(vector, angle=angle_step, about_point=ORIGIN), run_time=1)
-
-            # Transform the old label into the new one
-            new_k_label = Tex(rf"k = {k}").set_color(BLUE).to_edge(DOWN)
-            self.play(ReplacementTransform(current_k_label, new_k_label))
-            current_k_label = new_k_label
-
-            # c) Draw the red line for the inscribed side
-            new_endpoint = vector.get_end()
-            edge_line = Line(previous_endpoint, new_endpoint, color=RED)
-            self.play(Create(edge_line), run_time=0.3)
-            previous_endpoint = new_endpoint
-
-            # d) Tip-to-Tail partial sum (dotted blue line)
-            current_vector = new_endpoint - ORIGIN
-            next_partial_position = partial_position + current_vector
-            dotted_line = DashedLine(
-                start=partial_position,
-                end=next_partial_position,
-                color=BLUE,
-                dash_length=0.05
-            )
-            self.play(Create(dotted_line), run_time=0.5)
-            partial_position = next_partial_position
-
-            self.wait(0.3)
-
-        # ------------------------------
-        # 7) Close the N-gon
-        # ------------------------------
-        first_endpoint = RIGHT  # (1,0)
-        closing_line = Line(previous_endpoint, first_endpoint, color=RED)
-        self.play(Create(closing_line), run_time=0.5)
-
-        # Optionally fade out the final "k=..." label
-        if current_k_label is not None:
-            self.play(FadeOut(current_k_label))
-
-        # ------------------------------
-        # 8) Final partial sum at origin
-        # ------------------------------
-        # Because these vectors sum to zero (floating-point aside).
-        if np.allclose(partial_position, ORIGIN, atol=1e-6):
-            dot_at_origin = Dot(ORIGIN, color=YELLOW)
-            self.play(FadeIn(dot_at_origin, scale=2))
-        else:
-            # Show discrepancy if there's floating-point offset
-            final_line = DashedLine(partial_position, ORIGIN, color=BLUE, dash_length=0.05)
-            self.play(Create(final_line), run_time=0.5)
-
-        self.wait(2)
-
-
-class Target(Scene):
-    def __init__(self, N, **kwargs):
+        scene.play(Create(dotted_line), run_time=0.5)
+        partial_position = next_partial_position
+
+        scene.wait(0.3)
+
+    # ------------------------------
+    # 7) Close the N-gon
+    # ------------------------------
+    first_endpoint = RIGHT  # (1,0)
+    closing_line = Line(previous_endpoint, first_endpoint, color=RED)
+    scene.play(Create(closing_line), run_time=0.5)
+
+    # Optionally fade out the final "k=..." label
+    if current_k_label is not None:
+        scene.play(FadeOut(current_k_label))
+
+    # ------------------------------
+    # 8) Final partial sum at origin
+    # ------------------------------
+    # Zero up to floating point; show how far off it actually is.
+    show_closure(scene, np.linalg.norm(partial_position))
+
+    scene.wait(2)
+
+
+def ngon_fast_animation(scene, N, backdrop=None, bake=False):
+    """High-N version of ngon_animation: every root of unity and partial sum
+    is computed up front, and the inscribed N-gon and the tip-to-tail path
+    are two paths that grow together under a single ValueTracker."""
+    sum_expr = MathTex(
+        r"\sum_{k=0}^{N-1} e^{2 \pi i \frac{k}{N}} = 0"
+    ).to_corner(UP + RIGHT)
+    N_label = Tex(rf"N = {N}").next_to(sum_expr, DOWN, buff=0.3).align_to(sum_expr, RIGHT)
+    scene.play(FadeIn(sum_expr), FadeIn(N_label))
+    if backdrop is not None:
+        draw_backdrop(scene, backdrop, bake)
+
+    roots = np.exp(2j * np.pi * np.arange(N) / N)
+    partial_sums = np.cumsum(roots)
+    # The tip-to-tail path is itself a regular N-gon, of diameter
+    # 1/sin(pi/N) (~N/pi); shrink it to stay on screen.
+    path_scale = min(1.0, 3 * np.sin(np.pi / N))
+
+    polygon_full = VMobject(color=RED, stroke_width=2)
+    polygon_full.set_points_as_corners(to_points(np.append(roots, roots[0])))
+    path_full = VMobject(color=BLUE, stroke_width=2)
+    path_full.set_points_as_corners(to_points(path_scale * np.append(0, partial_sums)))
+    polygon, path = polygon_full.copy(), path_full.copy()
+
+    vector = Arrow(start=ORIGIN, end=RIGHT, buff=0, color=YELLOW)
+    k_label = Tex("k = ").set_color(BLUE)
+    # Rewritten every frame: pooled glyphs instead of a new Integer each time.
+    # Digits are centered, so lay it out at its widest value.
+    k_value = PooledNumber(N - 1, color=BLUE, max_chars=len(str(N - 1))).next_to(k_label, RIGHT)
+    VGroup(k_label, k_value).to_edge(DOWN)
+    k_value.set_value(0)
+    scale_note = (
+        Tex(rf"partial sums $\times {path_scale:.3g}$", font_size=28)
+        .set_color(BLUE).to_corner(DOWN + LEFT)
+    )
+
+    k = ValueTracker(0)
+
+    def sweep(mob):
+        alpha = k.get_value() / N
+        polygon.pointwise_become_partial(polygon_full, 0, alpha)
+        path.pointwise_become_partial(path_full, 0, alpha)
+        vector.put_start_and_end_on(ORIGIN, to_points(np.exp(2j * np.pi * alpha))[0])
+        k_value.set_value(min(int(k.get_value()), N - 1))
+
+    live = VGroup(polygon, path, vector, k_value)
+    sweep(live)
+    scene.play(Create(vector), FadeIn(k_label), FadeIn(k_value),
+               *([FadeIn(scale_note)] if path_scale < 1 else []))
+    # The updater sits on everything it moves, added last: Cairo redraws
+    # only the mobjects from the first one with an updater onwards.
+    live.add_updater(sweep)
+    scene.add(live)
+    scene.play(k.animate.set_value(N), run_time=8, rate_func=linear)
+    live.remove_updater(sweep)
+    scene.play(FadeOut(k_label), FadeOut(k_value))
+
+    show_closure(scene, abs(partial_sums[-1]))
+    scene.wait(2)
+
+
+def to_points(z):
+    """Complex numbers -> (n, 3) scene points."""
+    z = np.atleast_1d(z)
+    return np.stack([z.real, z.imag, np.zeros(len(z))], axis=1)
+
+
+def show_closure(scene, residual):
+    """Dot at the origin plus the actual |sum| left over by floating point."""
+    dot_at_origin = Dot(ORIGIN, color=YELLOW)
+    if residual == 0:
+        value = "0"
+    else:
+        mantissa, exponent = f"{residual:.3e}".split("e")
+        value = rf"{mantissa} \times 10^{{{int(exponent)}}}"
+    residual_label = (
+        MathTex(rf"\left|\sum\right| = {value}", font_size=36)
+        .set_color(YELLOW).to_corner(DOWN + RIGHT)
+    )
+    scene.play(FadeIn(dot_at_origin, scale=2), FadeIn(residual_label))
+
+
+class RepeatedNGon(StaticLayerMixin, Scene):
+    # Each N is an independent segment (the scene is cleared in between), so
+    # segment_render.py can render them in parallel by passing Ns=[N].
+    def __init__(self, Ns=range(3, 9), **kwargs):
+        super().__init__(**kwargs)
+        self.Ns = list(Ns)
+
+    def construct(self):
+        for N in self.Ns:
+            self.clear()
+            self.clear_background()
+            do_target_animation(self, N)
+
+
+class Target(StaticLayerMixin, Scene):
+    # One N per scene; render a whole range in parallel with
+    #     python sweep.py ngon-vector.py Target --param N=3:65
+    # N above FAST_THRESHOLD (eg. N=1000) switches to the one-sweep drawing;
+    # fast=True/False forces either.
+    def __init__(self, N, fast=None, **kwargs):
         super().__init__(**kwargs)
         self.N = N
-    
+        self.fast = fast
+
     def construct(self):
-        do_target_animation(self, self.N)
+        do_target_animation(self, self.N, self.fast)
 
 
 class InscribedNGonWithSummation(Scene):
+    # The published clip: formula first, nothing baked into the background.
     def construct(self):
-        # ------------------------------
-        # 1) Parameters
-        # ------------------------------
-        N = 8
-        angle_step = 2 * PI / N
-
-        # ------------------------------
-        # 2) Summation Equation & N=...
-        # ------------------------------
-        # Summation expression in terms of N
-        # Placed in the top-right corner
-        sum_expr = MathTex(
-            r"\sum_{k=0}^{N-1} e^{2 \pi i \frac{k}{N}} = 0"
-        ).to_corner(UP + RIGHT)
-
-        # Label for N (e.g., "N = 8"), placed below the summation
-        N_label = Tex(rf"N = {N}").next_to(sum_expr, DOWN, buff=0.3).align_to(sum_expr, RIGHT)
-
-        # Show them on screen
-        self.play(FadeIn(sum_expr), FadeIn(N_label))
-        self.wait(1)
-
-        # ------------------------------
-        # 3) Coordinate Plane (Optional)
-        # ------------------------------
-        plane = NumberPlane(
-            x_range=[-3, 3, 1],
-            y_range=[-3, 3, 1],
-            background_line_style={
-                "stroke_color": BLUE_E,
-                "stroke_width": 1,
-                "stroke_opacity": 0.4
-            },
-        )
-        self.play(FadeIn(plane))
-
-        # ------------------------------
-        # 4) Unit Circle & Initial Vector
-        # ------------------------------
-        unit_circle = Circle(radius=1, color=WHITE)
-        vector = Arrow(start=ORIGIN, end=RIGHT, buff=0, color=YELLOW)
-
-        self.play(Create(unit_circle), Create(vector))
-        self.wait()
-
-        # Keep track of endpoints for the inscribed N-gon
-        previous_endpoint = vector.get_end()
-        # Keep track of partial sums for the tip-to-tail path
-        partial_position = ORIGIN
-
-        # ------------------------------
-        # 5) Bottom "k = ..." Label
-        # ------------------------------
-        # We'll transform this label from k=0 to k=1 to k=2, etc., instead of overwriting.
-        current_k_label = Tex(r"k = 0").set_color(BLUE).to_edge(DOWN)
-        self.play(FadeIn(current_k_label))
-
-        # Draw initial dotted line
-        # d) Tip-to-Tail partial sum (dotted blue line)
-        dotted_line = DashedLine(
-            start=ORIGIN,
-            end=previous_endpoint,
-            color=BLUE,
-            dash_length=0.05
-        )
-        partial_position = previous_endpoint
-        self.play(Create(dotted_line), run_time=0.5)
-
-        # ------------------------------
-        # 6) Animate Rotations & Summation Steps
-        # ------------------------------
-        for k in range(1,N):
-
-            # b) Rotate the vector by angle_step
-            self.play(Rotate(vector, angle=angle_step, about_point=ORIGIN), run_time=1)
-
-            # Transform the old label into the new one
-            new_k_label = Tex(rf"k = {k}").set_color(BLUE).to_edge(DOWN)
-            self.play(ReplacementTransform(current_k_label, new_k_label))
-            current_k_label = new_k_label
-
-            # c) Draw the red line for the inscribed side
-            new_endpoint = vector.get_end()
-            edge_line = Line(previous_endpoint, new_endpoint, color=RED)
-            self.play(Create(edge_line), run_time=0.3)
-            previous_endpoint = new_endpoint
-
-            # d) Tip-to-Tail partial sum (dotted blue line)
-            current_vector = new_endpoint - ORIGIN
-            next_partial_position = partial_position + current_vector
-            dotted_line = DashedLine(
-                start=partial_position,
-                end=next_partial_position,
-                color=BLUE,
-                dash_length=0.05
-            )
-            self.play(Create(dotted_line), run_time=0.5)
-            partial_position = next_partial_position
-
-            self.wait(0.3)
-
-        # ------------------------------
-        # 7) Close the N-gon
-        # ------------------------------
-        first_endpoint = RIGHT  # (1,0)
-        closing_line = Line(previous_endpoint, first_endpoint, color=RED)
-        self.play(Create(closing_line), run_time=0.5)
-
-        # Optionally fade out the final "k=..." label
-        if current_k_label is not None:
-            self.play(FadeOut(current_k_label))
-
-        # ------------------------------
-        # 8) Final partial sum at origin
-        # ------------------------------
-        # Because these vectors sum to zero (floating-point aside).
-        if np.allclose(partial_position, ORIGIN, atol=1e-6):
-            dot_at_origin = Dot(ORIGIN, color=YELLOW)
-            self.play(FadeIn(dot_at_origin, scale=2))
-        else:
-            # Show discrepancy if there's floating-point offset
-            final_line = DashedLine(partial_position, ORIGIN, color=BLUE, dash_length=0.05)
-            self.play(Create(final_line), run_time=0.5)
-
-        self.wait(2)
+        do_target_animation(self, 8, backdrop_first=False, bake=False)
@@ -1,8 +1,12 @@
 from manim import *
 import numpy as np
 
+from clip_mobjects import ArrowField, PooledNumber, TrackingArc, arrow_points, segment_points
+from static_layer import StaticLayerMixin
+
 # Manim Community Edition
 # Run (example): manim -pqh ortho-preserving.py OrthogonalityTrick
+#                manim -pqh ortho-preserving.py OrthogonalityField   (hundreds of pairs)
 
 def dot(a, b):
     return float(np.dot(np.array(a, dtype=float), np.array(b, dtype=float)))
@@ -44,11 +48,12 @@ def label_at_end(vector, tex, scale=0.6, buff=0.1):
     label.add_updater(_update)
     return label
 
-def angle_arc_between(vu, vv, radius=0.6):
+def arc_angles_between(vu, vv):
+    """(start_angle, angle) of the smaller arc between the two vectors."""
     u_vec = np.array(vu.get_vector(), dtype=float)
     v_vec = np.array(vv.get_vector(), dtype=float)
     if np.linalg.norm(u_vec[:2]) == 0 or np.linalg.norm(v_vec[:2]) == 0:
-        return Arc(radius=radius, start_angle=0, angle=0.01, color=WHITE)
+        return 0.0, 0.01
     ang1 = np.arctan2(u_vec[1], u_vec[0])
     ang2 = np.arctan2(v_vec[1], v_vec[0])
     delta = (ang2 - ang1) % TAU
@@ -59,19 +64,23 @@ def angle_arc_between(vu, vv, radius=0.6):
         start = ang1
     if np.isclose(delta, 0.0):
         delta = 0.01
-    return Arc(radius=radius, start_angle=start, angle=delta, color=WHITE).set_z_index(1)
+    return start, delta
+
+def angle_arc_between(vu, vv, radius=0.6):
+    # Re-bends one Arc in place each frame instead of always_redraw'ing a new one.
+    arc = TrackingArc(lambda: arc_angles_between(vu, vv), radius=radius, color=WHITE)
+    return arc.set_z_index(1)
 
-class OrthogonalityTrick(Scene):
+class OrthogonalityTrick(StaticLayerMixin, Scene):
     def construct(self):
         plane = NumberPlane(
             x_range=[-6, 6, 1],
             y_range=[-4, 4, 1],
             background_line_style={"stroke_opacity": 0.4},
         )
-        self.add(plane)
-
         title = Tex(r"$u=e_1+e_2,\; v=e_1-e_2$").scale(0.7).to_corner(UL, buff=0.3)
-        self.add(title)
+        # Both stay put for the whole clip, so they are rasterized once.
+        self.add_static(plane, title)
 
         e1 = np.array([1, 0, 0], dtype=float)
         e2 = np.array([0, 1, 0], dtype=float)
@@ -92,7 +101,7 @@ class OrthogonalityTrick(Scene):
             return ve1, ve2, vu, vv, labels
 
         def build_hud(vu, vv):
-            angle_arc = always_redraw(lambda: angle_arc_between(vu, vv, radius=0.6))
+            angle_arc = angle_arc_between(vu, vv, radius=0.6)
             angle_prefix = MathTex(r"\angle(u,v)\approx").scale(0.65)
             angle_value = DecimalNumber(0, num_decimal_places=0).scale(0.65)
             angle_suffix = MathTex(r"^\circ").scale(0.65)
@@ -197,3 +206,158 @@ class OrthogonalityTrick(Scene):
 
         self.play(FadeOut(part2), FadeOut(warn))
         self.wait(0.5)
+
+
+def rotation_2d(theta):
+    return np.array([
+        [np.cos(theta), -np.sin(theta)],
+        [np.sin(theta),  np.cos(theta)],
+    ])
+
+def pair_angles(u, v):
+    """Angles (radians) and inner products of all pairs u[i], v[i] at once."""
+    inner = np.einsum("ij,ij->i", u, v)
+    norms = np.linalg.norm(u, axis=1) * np.linalg.norm(v, axis=1)
+    cos = np.divide(inner, norms, out=np.zeros_like(inner), where=norms > 0)
+    return np.arccos(np.clip(cos, -1.0, 1.0)), inner
+
+def to_points(xy):
+    return np.column_stack([xy, np.zeros(len(xy))])
+
+class OrthogonalityField(StaticLayerMixin, Scene):
+    """Hundreds of orthogonal pairs (u_i, v_i) under a sequence of matrices.
+
+    Every pair lives in one (2, pairs, 2) array.  A single updater maps the
+    whole array through the current matrix each frame, takes every angle and
+    inner product from ``pair_angles`` and rewrites the points of the two
+    ArrowFields and of a histogram of |∠(u_i, v_i) − 90°|.
+    """
+    BINS = 18                   # 5° per bar
+
+    def __init__(self, pairs=300, seed=0, steps=None, **kwargs):
+        super().__init__(**kwargs)
+        self.pairs = pairs
+        self.seed = seed
+        # (caption, matrix): each matrix is applied on top of the ones before it
+        self.steps = steps or [
+            ("Rotation + uniform scale", 1.3 * rotation_2d(35 * DEGREES)),
+            ("Anisotropic scaling", np.diag([1.8, 0.7])),
+            ("Rotation (angles kept)", rotation_2d(-60 * DEGREES)),
+        ]
+
+    def construct(self):
+        plane = NumberPlane(
+            x_range=[-8, 8, 1],
+            y_range=[-4, 4, 1],
+            background_line_style={"stroke_opacity": 0.25},
+        )
+        self.add_static(plane)
+
+        # ------------------------------------------------------------
+        # Pairs on a jittered grid, left of the histogram panel
+        # ------------------------------------------------------------
+        rng = np.random.default_rng(self.seed)
+        n = self.pairs
+        cols = int(np.ceil(np.sqrt(n * 8.5 / 6.6)))
+        rows = int(np.ceil(n / cols))
+        cell = min(8.5 / cols, 6.6 / rows)
+        idx = np.arange(n)
+        anchors = np.stack([-6.8 + (idx % cols + 0.5) * cell, 3.3 - (idx // cols + 0.5) * cell], axis=1)
+        anchors += rng.uniform(-0.15, 0.15, size=(n, 2)) * cell
+        starts = to_points(anchors)
+
+        phi = rng.uniform(0, TAU, n)
+        length = 0.3 * cell
+        u = length * np.stack([np.cos(phi), np.sin(phi)], axis=1)
+        v = length * rng.uniform(0.6, 1.0, n)[:, None] * np.stack([-np.sin(phi), np.cos(phi)], axis=1)
+        pairs = np.stack([u, v])                # (2, n, 2), u_i ⟂ v_i
+        tip = dict(buff=0, tip_length=0.3 * length, tip_width=0.2 * length)
+
+        fields = VGroup(*[
+            ArrowField(starts, starts + to_points(vecs), buckets=1, color=color, max_stroke_width=2, **tip)
+            for vecs, color in zip(pairs, (YELLOW, BLUE))
+        ])
+
+        # ------------------------------------------------------------
+        # Histogram of angle deviation, and the HUD
+        # ------------------------------------------------------------
+        origin = np.array([2.9, -1.6, 0.0])
+        hist_w, hist_h = 3.6, 2.6
+        edges = np.linspace(0, 90, self.BINS + 1)
+        left = origin[0] + edges[:-1] / 90 * hist_w
+        right = origin[0] + edges[1:] / 90 * hist_w
+
+        def bar_points(counts):
+            top = origin[1] + hist_h * counts / n
+            bottom = np.full(self.BINS, origin[1])
+            corners = np.stack([
+                np.stack([left, bottom], axis=1), np.stack([right, bottom], axis=1),
+                np.stack([right, top], axis=1), np.stack([left, top], axis=1),
+            ], axis=1)
+            corners = np.concatenate([corners, np.zeros((self.BINS, 4, 1))], axis=2)
+            return segment_points(corners.reshape(-1, 3), np.roll(corners, -1, axis=1).reshape(-1, 3))
+
+        bars = VMobject(fill_color=RED, fill_opacity=0.8, stroke_width=0)
+        bars.set_points(bar_points(np.zeros(self.BINS)))
+        hist_axis = Line(origin, origin + RIGHT * hist_w, stroke_width=2)
+        hist_labels = VGroup(
+            MathTex(r"0^\circ").scale(0.5).next_to(origin, DOWN, buff=0.1),
+            MathTex(r"90^\circ").scale(0.5).next_to(origin + RIGHT * hist_w, DOWN, buff=0.1),
+            MathTex(r"|\angle(u_i,v_i)-90^\circ|").scale(0.6).next_to(hist_axis, DOWN, buff=0.45),
+        )
+        panel = Rectangle(width=hist_w + 0.6, height=hist_h + 3.2, stroke_width=0,
+                          fill_color=BLACK, fill_opacity=0.85)
+        panel.move_to(origin + RIGHT * hist_w / 2 + UP * (hist_h / 2 + 0.75))
+
+        max_prefix = MathTex(r"\max|\angle-90^\circ|\approx").scale(0.6)
+        max_prefix.move_to(origin + RIGHT * hist_w / 2 + UP * (hist_h + 1.3))
+        max_dev = PooledNumber(0, font_size=0.6 * DEFAULT_FONT_SIZE, max_chars=2)
+        max_dev.next_to(max_prefix, RIGHT, buff=0.15)
+        inner_prefix = MathTex(r"\text{mean}\,|\langle u_i,v_i\rangle|\approx").scale(0.6)
+        inner_prefix.next_to(max_prefix, DOWN, buff=0.25, aligned_edge=LEFT)
+        mean_inner = PooledNumber(0, num_decimal_places=3, font_size=0.6 * DEFAULT_FONT_SIZE, max_chars=5)
+        mean_inner.next_to(inner_prefix, RIGHT, buff=0.15)
+        hud = VGroup(max_prefix, max_dev, inner_prefix, mean_inner)
+
+        # ------------------------------------------------------------
+        # One updater for every pair, bar and number
+        # ------------------------------------------------------------
+        alpha = ValueTracker(0)
+        matrices = {"from": np.eye(2), "to": np.eye(2)}
+
+        def update(mob):
+            a = alpha.get_value()
+            mapped = pairs @ ((1 - a) * matrices["from"] + a * matrices["to"]).T
+            angles, inner = pair_angles(*mapped)
+            deviation = np.degrees(np.abs(angles - PI / 2))
+            for field, vecs in zip(fields, mapped):
+                shafts, tips = arrow_points(starts, starts + to_points(vecs), **tip)
+                field[0].set_points(shafts)
+                field[1].set_points(tips)
+            bars.set_points(bar_points(np.histogram(deviation, bins=edges)[0]))
+            max_dev.set_value(deviation.max())
+            mean_inner.set_value(np.abs(inner).mean())
+
+        live = VGroup(fields, bars, hud)
+        update(live)
+
+        self.play(FadeIn(panel), Create(hist_axis), FadeIn(hist_labels))
+        self.promote_to_background(panel, hist_axis, hist_labels)
+        self.play(Create(fields), FadeIn(bars), FadeIn(hud), run_time=2)
+        # The group itself has to be in the scene for its updater to run.
+        live.add_updater(update)
+        self.add(live)
+        self.wait(0.5)
+
+        for caption_text, matrix in self.steps:
+            caption = Tex(caption_text).scale(0.6).move_to(max_prefix.get_top() + UP * 0.5)
+            caption.set_x(origin[0] + hist_w / 2)
+            self.play(FadeIn(caption))
+            matrices["from"], matrices["to"] = matrices["to"], matrix @ matrices["to"]
+            alpha.set_value(0)
+            self.play(alpha.animate.set_value(1), run_time=2.5)
+            self.wait(1)
+            self.play(FadeOut(caption))
+
+        self.wait(1)
+
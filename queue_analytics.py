@@ -0,0 +1,202 @@
+"""Queue-depth, waiting-time and cycle-time analytics for large queue traces.
+
+    python queue_analytics.py load.csv --out media/analytics/load
+    python queue_analytics.py --timeline media/analytics/load    # reuse arrays
+
+A trace (see ``queue_sim.read_trace``) is replayed through ``QueueSimulation``
+unless its rows already carry ``processing_start``/``finish``.  Per-item
+timestamps are written in fixed-size chunks to raw float64 files
+(``arrival.f64``, ``processing_start.f64``, ``finish.f64``) and read back as
+``np.memmap``, so the trace never has to fit in a Python list.
+
+Queue depth is a sweep line over the 2n arrival/finish events: sort the
+event times once (finishes before arrivals at equal times, like the
+simulation) and take the cumulative sum of +1/-1.  That is the README's
+"bars crossing the yellow timeline", in O(n log n) NumPy.
+``downsample_max`` reduces the step curve to one point per bin, keeping the
+peak in each bin, for drawing as a single path.
+"""
+import argparse
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from queue_sim import FINISH, QueueSimulation, constant, read_trace
+
+COLUMNS = ("arrival", "processing_start", "finish")
+CHUNK = 1 << 20
+
+
+# ---------------------------------------------------------------------------
+# Memory-mapped timelines
+# ---------------------------------------------------------------------------
+def finished_items(sim, arrivals):
+    """Yield items from `sim` as they finish (not in arrival order)."""
+    for _, kind, item in sim.stream(arrivals):
+        if kind == FINISH:
+            yield item
+
+
+def write_timeline(items, directory, chunk=CHUNK):
+    """Write per-item timestamps to `directory` in chunks; return the item count."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    buffers = {name: np.empty(chunk) for name in COLUMNS}
+    files = {name: open(directory / f"{name}.f64", "wb") for name in COLUMNS}
+    n = filled = 0
+    try:
+        for item in items:
+            for name in COLUMNS:
+                buffers[name][filled] = item[name]
+            filled += 1
+            if filled == chunk:
+                for name in COLUMNS:
+                    buffers[name].tofile(files[name])
+                n += filled
+                filled = 0
+        for name in COLUMNS:
+            buffers[name][:filled].tofile(files[name])
+        n += filled
+    finally:
+        for f in files.values():
+            f.close()
+    return n
+
+
+def load_timeline(directory):
+    """Return {column: read-only float64 memmap} for a directory written above."""
+    timeline = {}
+    for name in COLUMNS:
+        path = Path(directory) / f"{name}.f64"
+        if path.stat().st_size == 0:
+            timeline[name] = np.empty(0)
+        else:
+            timeline[name] = np.memmap(path, dtype=np.float64, mode="r")
+    return timeline
+
+
+def trace_timeline(trace, directory, sim=None, chunk=CHUNK):
+    """Replay (or copy) a trace file into a memory-mapped timeline."""
+    rows = read_trace(trace)
+    first = next(rows, None)
+    items = itertools.chain([first] if first is not None else [], rows)
+    if first is not None and not ("finish" in first and "processing_start" in first):
+        items = finished_items(sim or QueueSimulation(service=constant(3)), items)
+    write_timeline(items, directory, chunk)
+    return load_timeline(directory)
+
+
+# ---------------------------------------------------------------------------
+# Vectorized metrics
+# ---------------------------------------------------------------------------
+def occupancy(begin, end):
+    """Step curve of how many [begin, end) intervals cover each event time.
+
+    Returns (times, counts): counts[i] holds from times[i] until times[i + 1].
+    With begin=arrival, end=finish this is the queue depth (items in the
+    system); with end=processing_start it is the number waiting.
+    """
+    begin = np.asarray(begin, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    times = np.concatenate([begin, end])
+    steps = np.concatenate([np.ones(len(begin), np.int64), -np.ones(len(end), np.int64)])
+    # lexsort's last key is primary: by time, then -1 before +1.
+    order = np.lexsort((steps, times))
+    return times[order], np.cumsum(steps[order])
+
+
+def queue_depth(timeline):
+    return occupancy(timeline["arrival"], timeline["finish"])
+
+
+def waiting_times(timeline):
+    return np.subtract(timeline["processing_start"], timeline["arrival"])
+
+
+def cycle_times(timeline):
+    return np.subtract(timeline["finish"], timeline["arrival"])
+
+
+def time_average(times, counts):
+    """Time-weighted mean of a step curve over its span."""
+    if len(times) < 2 or times[-1] == times[0]:
+        return float(counts[-1]) if len(counts) else 0.0
+    return float(np.dot(counts[:-1], np.diff(times)) / (times[-1] - times[0]))
+
+
+def summarize(values):
+    values = np.asarray(values)
+    if not len(values):
+        return {"count": 0}
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        "count": int(len(values)),
+        "mean": float(values.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(values.max()),
+    }
+
+
+def downsample_max(times, counts, t_min, t_max, bins):
+    """(bin_left_edges, peak count in each bin) for a step curve."""
+    edges = np.linspace(t_min, t_max, bins + 1)
+    starts = np.searchsorted(times, edges[:-1], side="right")
+    ends = np.searchsorted(times, edges[1:], side="right")
+    # Value carried into each bin from the last event before it.
+    peaks = np.where(starts > 0, counts[np.maximum(starts - 1, 0)], 0)
+    inside = ends > starts
+    if inside.any():
+        # Bins are contiguous, so [starts[i], starts[i + 1]) are the events in
+        # bin i; a padded zero lets the last bound equal len(counts).
+        padded = np.append(counts, 0)
+        within = np.maximum.reduceat(padded, np.append(starts, ends[-1]))[:-1]
+        peaks = np.where(inside, np.maximum(peaks, within), peaks)
+    return edges[:-1], peaks
+
+
+def report(timeline):
+    times, depth = queue_depth(timeline)
+    return {
+        "items": int(len(timeline["arrival"])),
+        "depth_max": int(depth.max()) if len(depth) else 0,
+        "depth_mean": time_average(times, depth),
+        "waiting": summarize(waiting_times(timeline)),
+        "cycle": summarize(cycle_times(timeline)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", nargs="?")
+    parser.add_argument("--out", default=None, help="timeline directory (default: next to the trace)")
+    parser.add_argument("--timeline", default=None, help="read an existing timeline directory")
+    parser.add_argument("--service", type=float, default=3.0, help="constant service time to simulate")
+    parser.add_argument("--servers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.timeline:
+        timeline = load_timeline(args.timeline)
+    elif args.trace:
+        out = args.out or str(Path(args.trace).with_suffix("")) + "_timeline"
+        sim = QueueSimulation(service=constant(args.service), servers=args.servers)
+        timeline = trace_timeline(args.trace, out, sim)
+        print(f"timeline written to {out}")
+    else:
+        parser.error("give a trace file or --timeline")
+
+    r = report(timeline)
+    print(f"items {r['items']}  depth max {r['depth_max']}  time-averaged {r['depth_mean']:.2f}")
+    for name in ("waiting", "cycle"):
+        s = r[name]
+        if s["count"]:
+            print(f"{name:<8} mean {s['mean']:.2f}  p50 {s['p50']:.2f}  p90 {s['p90']:.2f}  "
+                  f"p99 {s['p99']:.2f}  max {s['max']:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,99 @@
 from manim import *
 import numpy as np
 
+from clip_mobjects import TrackingLine
+from queue_analytics import COLUMNS, downsample_max, queue_depth
+from queue_sim import (ARRIVAL, FINISH, START, QueueSimulation, constant,
+                       poisson_arrivals, read_trace)
+
 class QueueFlowDiagram(Scene):
+    # The simulated scenario; subclass and override to show another queue.
+    # (Distributions are plain functions of rng: keep them staticmethods so
+    # they aren't bound to the scene, eg. staticmethod(exponential(2)).)
+    arrivals = [0, 2, 2.05, 2.1, 5]
+    service_time = staticmethod(constant(3))
+    servers = 1
+    discipline = "fifo"
+    colors = [BLUE, RED, GREEN, YELLOW, PURPLE]
+    show_depth = True
+
+    def simulate(self):
+        sim = QueueSimulation(service=self.service_time, servers=self.servers,
+                              discipline=self.discipline)
+        items, events = sim.run(self.arrivals)
+        for i, item in enumerate(items):
+            item["color"] = self.colors[i % len(self.colors)]
+        return items, events
+
+    @staticmethod
+    def depth_chart(flow_axes, items_data, t_max, below, bins=400):
+        """Queue depth over time as a step path on its own small axes.
+
+        The axes sit under `below` and share the flow chart's time scale.
+        Long traces are reduced to the peak depth per bin (queue_analytics).
+        """
+        timeline = {
+            name: np.fromiter((item[name] for item in items_data), float, len(items_data))
+            for name in COLUMNS
+        }
+        times, depth = queue_depth(timeline)
+        if len(times) > bins:
+            times, depth = downsample_max(times, depth, 0, t_max, bins)
+        max_depth = max(1, int(depth.max()) if len(depth) else 0)
+        depth_axes = Axes(
+            x_range=[0, t_max, 1],
+            y_range=[0, max_depth, max_depth],
+            x_length=8,
+            y_length=1.5,
+            axis_config={"color": WHITE},
+            y_axis_config={"include_numbers": True},
+        )
+        depth_axes.scale(0.6)
+        depth_axes.next_to(below, DOWN, buff=0.2)
+        # Line the time axes up with the flow chart's.
+        depth_axes.shift((flow_axes.c2p(0, 0)[0] - depth_axes.c2p(0, 0)[0]) * RIGHT)
+        depth_label = Text("Queue depth", font_size=20, color=ORANGE)
+        depth_label.next_to(depth_axes, RIGHT, buff=0.2)
+        # Corners (t_i, depth_{i-1}) -> (t_i, depth_i), from t=0 out to t_max.
+        xs = np.concatenate([[0], np.repeat(times, 2), [t_max]])
+        ys = np.concatenate([[0, 0], np.repeat(depth, 2)])
+        path = VMobject(color=ORANGE, stroke_width=3)
+        path.set_points_as_corners(depth_axes.c2p(xs, ys).T)
+        return depth_axes, depth_label, path
+
+    def draw_queue(self, queue_offset):
+        """Draw the pipe and one processing box per server; return the box centers."""
+        pipe_top = Line(
+            start=[0, 0.5, 0] + queue_offset,
+            end=[3, 0.5, 0] + queue_offset,
+            color=WHITE
+        )
+        pipe_bottom = Line(
+            start=[0, -0.5, 0] + queue_offset,
+            end=[3, -0.5, 0] + queue_offset,
+            color=WHITE
+        )
+        self.play(Create(pipe_top), Create(pipe_bottom))
+        # One processing box per server, stacked around the pipe's axis.
+        server_centers = [
+            np.array([3.5, 1.2 * ((self.servers - 1) / 2 - s), 0]) + queue_offset
+            for s in range(self.servers)
+        ]
+        proc_boxes = VGroup(*[
+            Rectangle(width=1, height=1, color=WHITE).move_to(center)
+            for center in server_centers
+        ])
+        proc_box_label = Text("Processing", font_size=24)
+        proc_box_label.next_to(proc_boxes, UP)
+        self.play(Create(proc_boxes), Write(proc_box_label))
+        return server_centers
+
+    @staticmethod
+    def waiting_slot(queue_offset, index):
+        gap = 0.8
+        x = 2.2 - index * gap
+        return np.array([x, 0, 0]) + queue_offset
+
     def construct(self):
         # -------------------------------
         # GLOBAL TIMELINE SETUP
@@ -13,16 +105,11 @@ class QueueFlowDiagram(Scene):
         # SETUP: FLOW CHART (Left Side)
         # -------------------------------
         # Set up the Flow axes with a y_range that matches the number of items.
-        items_data = [
-            {"color": BLUE,   "arrival": 0,    "processing_start": 0,   "finish": 3},
-            {"color": RED,    "arrival": 2,    "processing_start": 3,   "finish": 6},
-            {"color": GREEN,  "arrival": 2.05, "processing_start": 6,   "finish": 9},
-            {"color": YELLOW, "arrival": 2.1,  "processing_start": 9,   "finish": 12},
-            {"color": PURPLE, "arrival": 5,    "processing_start": 12,  "finish": 15},
-        ]
+        items_data, events = self.simulate()
         n_items = len(items_data)
+        t_max = int(np.ceil(max(item["finish"] for item in items_data))) + 1
         flow_axes = Axes(
-            x_range=[0, 16, 1],
+            x_range=[0, t_max, 1],
             y_range=[0, n_items, 1],
             x_length=8,
             y_length=5,
@@ -35,12 +122,11 @@ class QueueFlowDiagram(Scene):
         time_label = Text("Time", font_size=24).next_to(flow_axes, DOWN)
         self.play(Write(time_label))
         # A vertical yellow line indicates the current global time.
-        time_line = always_redraw(lambda: 
-            Line(
-                start=flow_axes.c2p(global_clock.get_value(), 0),
-                end=flow_axes.c2p(global_clock.get_value(), n_items),
-                color=YELLOW
-            )
+        # (Moved in place every frame rather than rebuilt via always_redraw.)
+        time_line = TrackingLine(
+            lambda: flow_axes.c2p(global_clock.get_value(), 0),
+            lambda: flow_axes.c2p(global_clock.get_value(), n_items),
+            color=YELLOW
         )
         self.add(time_line)
 
@@ -69,29 +155,19 @@ class QueueFlowDiagram(Scene):
             )
             flow_bars.add(connection_line, bar, dot)
         self.play(FadeIn(flow_bars))
+        if self.show_depth:
+            # Queue depth: how many bars the yellow line crosses at each time.
+            depth_axes, depth_label, depth_path = self.depth_chart(
+                flow_axes, items_data, t_max, below=time_label)
+            self.play(Create(depth_axes), Write(depth_label))
+            self.play(Create(depth_path))
 
         # -------------------------------
         # SETUP: QUEUE ANIMATION (To the Right of the Flow Chart)
         # -------------------------------
         queue_offset = flow_axes.get_right() + RIGHT * 1.5
 
-        pipe_top = Line(
-            start=[0, 0.5, 0] + queue_offset,
-            end=[3, 0.5, 0] + queue_offset,
-            color=WHITE
-        )
-        pipe_bottom = Line(
-            start=[0, -0.5, 0] + queue_offset,
-            end=[3, -0.5, 0] + queue_offset,
-            color=WHITE
-        )
-        self.play(Create(pipe_top), Create(pipe_bottom))
-        processing_box_center = np.array([3.5, 0, 0]) + queue_offset
-        proc_box = Rectangle(width=1, height=1, color=WHITE)
-        proc_box.move_to(processing_box_center)
-        proc_box_label = Text("Processing", font_size=24)
-        proc_box_label.next_to(proc_box, UP)
-        self.play(Create(proc_box), Write(proc_box_label))
+        server_centers = self.draw_queue(queue_offset)
 
         # Create block objects for the queue.
         blocks = []
@@ -101,51 +177,214 @@ class QueueFlowDiagram(Scene):
             blocks.append(block)
             self.add(block)
 
-        def get_waiting_slot(index):
-            gap = 0.8
-            x = 2.2 - index * gap
-            return np.array([x, 0, 0]) + queue_offset
-
-        processing_block = None
         waiting_queue = []
 
-        events = [
-            (0,    "arrival", 0),
-            (2,    "arrival", 1),
-            (2.05, "arrival", 2),
-            (2.1,  "arrival", 3),
-            (3,    "processing_finish", 0),
-            (5,    "arrival", 4),
-            (6,    "processing_finish", 1),
-            (9,    "processing_finish", 2),
-            (12,   "processing_finish", 3),
-            (15,   "processing_finish", 4),
-        ]
-
         for event in events:
             event_time, event_type, idx = event
             current = global_clock.get_value()
             if event_time > current:
                 dt = event_time - current
                 self.play(global_clock.animate.increment_value(dt), run_time=dt)
-            if event_type == "arrival":
-                if idx == 0:
-                    processing_block = idx
-                    self.play(blocks[idx].animate.move_to(processing_box_center), run_time=0.5)
-                else:
+            item = items_data[idx]
+            if event_type == ARRIVAL:
+                # Items served on arrival go straight to a box at their start event.
+                if item["processing_start"] > item["arrival"]:
                     waiting_queue.append(idx)
-                    target_pos = get_waiting_slot(len(waiting_queue) - 1)
+                    target_pos = self.waiting_slot(queue_offset, len(waiting_queue) - 1)
                     self.play(blocks[idx].animate.move_to(target_pos), run_time=0.5)
-            elif event_type == "processing_finish":
-                if processing_block is not None:
-                    self.play(FadeOut(blocks[processing_block]), run_time=0.5)
-                if waiting_queue:
-                    next_block = waiting_queue.pop(0)
-                    processing_block = next_block
-                    self.play(blocks[next_block].animate.move_to(processing_box_center), run_time=0.5)
+            elif event_type == START:
+                self.play(blocks[idx].animate.move_to(server_centers[item["server"]]), run_time=0.5)
+                if idx in waiting_queue:
+                    waiting_queue.remove(idx)
                     for i, b_idx in enumerate(waiting_queue):
-                        self.play(blocks[b_idx].animate.move_to(get_waiting_slot(i)), run_time=0.3)
-                else:
-                    processing_block = None
+                        self.play(blocks[b_idx].animate.move_to(self.waiting_slot(queue_offset, i)), run_time=0.3)
+            elif event_type == FINISH:
+                self.play(FadeOut(blocks[idx]), run_time=0.5)
+
+        self.wait(2)
+
+
+class StreamingQueueFlowDiagram(QueueFlowDiagram):
+    """QueueFlowDiagram for long traces, replayed lazily through QueueSimulation.stream().
+
+    Only the latest `window_rows` items have marks on the flow chart (rows are
+    reused round-robin) and the time axis scrolls once the clock passes
+    `lead` of `window_seconds`.  Marks that scroll off or lose their row are
+    removed from the scene; blocks exist only while visible in the pipe or
+    being processed.  Memory and per-frame work are bounded by the window, not
+    by the trace length.
+
+        manim -ql queue_flow.py StreamingQueueFlowDiagram   # Poisson demo
+        RenderJob("queue_flow.py", "StreamingQueueFlowDiagram",
+                  params={"trace": "load.csv"})              # batch_render
+    """
+    pipe_slots = 4       # waiting blocks drawn in the pipe; the rest are only counted
+    lead = 0.75          # where the time line stops and the chart starts scrolling
+    time_scale = 0.25    # video seconds per trace second
+    move_time = 0.2
+
+    def __init__(self, trace=None, window_rows=12, window_seconds=20, **kwargs):
+        super().__init__(**kwargs)
+        self.trace = trace
+        self.window_rows = window_rows
+        self.window_seconds = window_seconds
+
+    def arrival_source(self):
+        if self.trace is not None:
+            return read_trace(self.trace)
+        return poisson_arrivals(rate=0.3, n=40, seed=0)
+
+    def construct(self):
+        clock = ValueTracker(0)
+        self.add(clock)
+        window = self.window_seconds
+        rows = self.window_rows
+
+        flow_axes = Axes(
+            x_range=[0, window, window / 10],
+            y_range=[0, rows, 1],
+            x_length=8,
+            y_length=5,
+            axis_config={"color": WHITE},
+        )
+        flow_axes.scale(0.6)
+        flow_axes.to_edge(LEFT, buff=1)
+        self.play(Create(flow_axes))
+        time_label = Text("Time", font_size=24).next_to(flow_axes, DOWN)
+        self.play(Write(time_label))
+
+        # The axes never move, so map trace time / row to scene coordinates directly.
+        x0, y0, _ = flow_axes.c2p(0, 0)
+        x_unit = flow_axes.c2p(1, 0)[0] - x0
+        row_height = flow_axes.c2p(0, 1)[1] - y0
+
+        def view_start():
+            return max(0.0, clock.get_value() - self.lead * window)
+
+        def x_of(t, t0):
+            return x0 + x_unit * min(max(t - t0, 0.0), window)
+
+        def row_y(item):
+            return y0 + row_height * (item["row"] + 0.5)
+
+        time_line = TrackingLine(
+            lambda: [x_of(clock.get_value(), view_start()), y0, 0],
+            lambda: [x_of(clock.get_value(), view_start()), y0 + row_height * rows, 0],
+            color=YELLOW
+        )
+        clock_readout = DecimalNumber(0, num_decimal_places=1, font_size=24, color=YELLOW)
+        clock_readout.add_updater(
+            lambda m: m.set_value(clock.get_value()).next_to(time_line, UP, buff=0.1)
+        )
+        self.add(time_line, clock_readout)
+
+        # idx -> [item, dot, wait line, bar or None]; at most `rows` entries.
+        live = {}
+        row_owner = {}
+
+        def place(item, dot, wait_line, bar, t0, now):
+            y = row_y(item)
+            dot.move_to([x_of(item["arrival"], t0), y, 0])
+            dot.set_opacity(1 if item["arrival"] >= t0 else 0)
+            waited_until = item.get("processing_start", now)
+            wait_line.set_points_as_corners([
+                [x_of(item["arrival"], t0), y, 0], [x_of(waited_until, t0), y, 0]
+            ])
+            if bar is not None:
+                left, right = x_of(item["processing_start"], t0), x_of(item["finish"], t0)
+                half = 0.4 * row_height
+                bar.set_points_as_corners([
+                    [left, y - half, 0], [right, y - half, 0], [right, y + half, 0],
+                    [left, y + half, 0], [left, y - half, 0],
+                ])
+
+        def retire(idx):
+            _, dot, wait_line, bar = live.pop(idx)
+            self.remove(dot, wait_line, *([bar] if bar is not None else []))
+
+        def scroll(dt):
+            t0, now = view_start(), clock.get_value()
+            for idx in [i for i, marks in live.items() if marks[0].get("finish", np.inf) < t0]:
+                retire(idx)
+            for marks in live.values():
+                place(*marks, t0, now)
+
+        self.add_updater(scroll)
+
+        # -------------------------------
+        # QUEUE (bounded number of blocks)
+        # -------------------------------
+        queue_offset = flow_axes.get_right() + RIGHT * 1.5
+        server_centers = self.draw_queue(queue_offset)
+        waiting_count = Integer(0, font_size=28).next_to(queue_offset + np.array([0.3, 0.5, 0]), UP)
+        self.add(waiting_count)
+        blocks = {}
+        waiting = []
+
+        def show_block(item):
+            block = Square(side_length=0.5, fill_color=item["color"], fill_opacity=1)
+            block.move_to(np.array([-1, 0, 0]) + queue_offset)
+            blocks[item["index"]] = block
+            self.add(block)
+            return block
+
+        sim = QueueSimulation(service=self.service_time, servers=self.servers,
+                              discipline=self.discipline)
+        events = sim.stream(self.arrival_source())
+        upcoming = next(events, None)
+        while upcoming is not None:
+            event_time, event_type, item = upcoming
+            upcoming = next(events, None)
+            idx = item["index"]
+            current = clock.get_value()
+            if event_time > current:
+                dt = event_time - current
+                self.play(clock.animate.increment_value(dt), run_time=dt * self.time_scale)
+
+            if event_type == ARRIVAL:
+                item["color"] = self.colors[idx % len(self.colors)]
+                item["row"] = idx % rows
+                if row_owner.get(item["row"]) in live:
+                    retire(row_owner[item["row"]])
+                row_owner[item["row"]] = idx
+                marks = [item, Dot(color=item["color"]),
+                         Line(color=item["color"], stroke_width=2), None]
+                place(*marks, view_start(), event_time)
+                live[idx] = marks
+                self.add(*marks[1:3])
+                # Items served on arrival go straight to a box at their start event.
+                served_now = (upcoming is not None and upcoming[1] == START
+                              and upcoming[2] is item)
+                if not served_now:
+                    waiting.append(item)
+                    waiting_count.set_value(len(waiting))
+                    slot = len(waiting) - 1
+                    if slot < self.pipe_slots:
+                        self.play(show_block(item).animate.move_to(
+                            self.waiting_slot(queue_offset, slot)), run_time=self.move_time)
+            elif event_type == START:
+                if idx in live:
+                    bar = Polygon(ORIGIN, RIGHT, UP, fill_color=item["color"],
+                                  fill_opacity=0.8, stroke_width=0)
+                    live[idx][3] = bar
+                    place(*live[idx], view_start(), event_time)
+                    self.add(bar)
+                block = blocks.get(idx) or show_block(item)
+                self.play(block.animate.move_to(server_centers[item["server"]]),
+                          run_time=self.move_time)
+                position = next((i for i, w in enumerate(waiting) if w is item), None)
+                if position is not None:
+                    del waiting[position]
+                    waiting_count.set_value(len(waiting))
+                    moves = [
+                        (blocks.get(w["index"]) or show_block(w)).animate.move_to(
+                            self.waiting_slot(queue_offset, i))
+                        for i, w in enumerate(waiting[:self.pipe_slots])
+                        if i >= position
+                    ]
+                    if moves:
+                        self.play(*moves, run_time=self.move_time)
+            elif event_type == FINISH:
+                self.play(FadeOut(blocks.pop(idx)), run_time=self.move_time)
 
         self.wait(2)
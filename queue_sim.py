@@ -0,0 +1,177 @@
+"""Discrete-event queue simulation behind queue_flow.py.
+
+Given arrivals and a service-time distribution, this produces the per-item
+timeline (arrival, processing start, finish, server) and the ordered event
+stream that ``QueueFlowDiagram`` animates, instead of hand-written tables:
+
+    sim = QueueSimulation(service=constant(3), servers=1)
+    items, events = sim.run([0, 2, 2.05, 2.1, 5])
+    # events: [(0, "arrival", 0), (0, "processing_start", 0), (2, "arrival", 1), ...]
+
+Events live on a heap keyed by (time, rank, sequence); finishes rank before
+arrivals at the same instant, so a server freed at t can take an item that
+arrives at t.  Disciplines: "fifo" and "priority" (lowest priority value
+first, FIFO among equals), each with any number of servers.  ``stream()``
+pulls arrivals lazily and holds only in-flight items, so traces of any length
+can be replayed; ``read_trace()`` streams arrivals from a CSV/JSONL file.
+"""
+import csv
+import heapq
+import itertools
+import json
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+FIFO = "fifo"
+PRIORITY = "priority"
+
+ARRIVAL = "arrival"
+START = "processing_start"
+FINISH = "processing_finish"
+
+# Heap rank of simultaneous events: finishes free servers before arrivals queue.
+_RANK = {FINISH: 0, ARRIVAL: 1}
+
+
+# ---------------------------------------------------------------------------
+# Distributions: callables taking a numpy Generator
+# ---------------------------------------------------------------------------
+def constant(value):
+    return lambda rng: float(value)
+
+
+def exponential(mean):
+    return lambda rng: float(rng.exponential(mean))
+
+
+def uniform(low, high):
+    return lambda rng: float(rng.uniform(low, high))
+
+
+def poisson_arrivals(rate, n, seed=None, start=0.0):
+    """Arrival times of a Poisson process (exponential inter-arrival gaps)."""
+    rng = np.random.default_rng(seed)
+    t = start
+    for _ in range(n):
+        t += rng.exponential(1.0 / rate)
+        yield t
+
+
+def _number(text):
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def read_trace(path):
+    """Yield arrival dicts from a trace file, one line at a time.
+
+    ``.csv`` files need a header row with an ``arrival`` column; any other
+    suffix is read as JSON lines (``{"arrival": 1.5, "service": 2}``).
+    Optional ``service``/``priority`` fields override the simulated ones.
+    """
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            for row in csv.DictReader(f):
+                yield {k: _number(v) for k, v in row.items() if v not in ("", None)}
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+class QueueSimulation:
+    def __init__(self, service=constant(3.0), servers=1, discipline=FIFO,
+                 priority=None, seed=None):
+        if discipline not in (FIFO, PRIORITY):
+            raise ValueError(f"unknown discipline {discipline!r}")
+        if servers < 1:
+            raise ValueError("need at least one server")
+        self.service = service
+        self.servers = servers
+        self.discipline = discipline
+        self.priority = priority
+        self.seed = seed
+
+    def _item(self, raw, index, rng):
+        item = dict(raw) if isinstance(raw, dict) else {"arrival": float(raw)}
+        item["arrival"] = float(item["arrival"])
+        item["index"] = index
+        if "service" not in item:
+            item["service"] = self.service(rng)
+        if "priority" not in item:
+            item["priority"] = self.priority(rng) if self.priority else 0
+        return item
+
+    def stream(self, arrivals):
+        """Yield (time, kind, item) in processing order, reading arrivals lazily.
+
+        `arrivals` yields arrival times or dicts with an "arrival" key and
+        optional "service" / "priority" (anything else is passed through).
+        """
+        rng = np.random.default_rng(self.seed)
+        arrivals = iter(arrivals)
+        heap = []
+        seq = itertools.count()
+        free = list(range(self.servers))
+        waiting_fifo = deque()
+        waiting_prio = []
+        counter = itertools.count()
+        last_arrival = [-np.inf]
+
+        def schedule_next_arrival():
+            raw = next(arrivals, None)
+            if raw is None:
+                return
+            item = self._item(raw, next(counter), rng)
+            if item["arrival"] < last_arrival[0]:
+                raise ValueError(f"arrivals must be sorted (item {item['index']})")
+            last_arrival[0] = item["arrival"]
+            heapq.heappush(heap, (item["arrival"], _RANK[ARRIVAL], next(seq), item))
+
+        def start(item, t):
+            item["server"] = heapq.heappop(free)
+            item["processing_start"] = t
+            item["finish"] = t + item["service"]
+            heapq.heappush(heap, (item["finish"], _RANK[FINISH], next(seq), item))
+
+        schedule_next_arrival()
+        while heap:
+            t, rank, _, item = heapq.heappop(heap)
+            if rank == _RANK[ARRIVAL]:
+                schedule_next_arrival()
+                yield t, ARRIVAL, item
+                if free:
+                    start(item, t)
+                    yield t, START, item
+                elif self.discipline == FIFO:
+                    waiting_fifo.append(item)
+                else:
+                    heapq.heappush(waiting_prio, (item["priority"], item["index"], item))
+            else:
+                yield t, FINISH, item
+                heapq.heappush(free, item["server"])
+                if waiting_fifo:
+                    nxt = waiting_fifo.popleft()
+                elif waiting_prio:
+                    nxt = heapq.heappop(waiting_prio)[2]
+                else:
+                    continue
+                start(nxt, t)
+                yield t, START, nxt
+
+    def run(self, arrivals):
+        """Simulate everything; return (items ordered by arrival, [(time, kind, index)])."""
+        items, events = [], []
+        for t, kind, item in self.stream(arrivals):
+            if kind == ARRIVAL:
+                items.append(item)
+            events.append((t, kind, item["index"]))
+        return items, events
@@ -0,0 +1,165 @@
+"""Content-addressed cache of rendered scene videos.
+
+A scene's key hashes everything that can change its pixels: the source of the
+scene class, its in-module base classes and any module-level helpers it calls
+(``label_at_end`` in ``ortho-preserving.py``, say), the module preamble
+(imports, ``config.frame_width = ...``), any repo-local module it imports,
+the manim version, the quality flag, extra config and constructor parameters.
+
+On a hit the stored video is copied back to where manim would have written it,
+so nothing is rasterized at all.  Entries are copies rather than hard links:
+manim rewrites its output files in place, which would corrupt a linked entry.
+"""
+import ast
+import hashlib
+import json
+import os
+import shutil
+from importlib import metadata
+from pathlib import Path
+
+# Bump when the key layout changes, so stale entries are never hit.
+CACHE_VERSION = 1
+
+# Config that only moves files around and never changes the rendered frames.
+PATH_ONLY_CONFIG = {"tex_dir", "text_dir", "partial_movie_dir"}
+
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _local_module_paths(tree, directory):
+    paths = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            candidate = directory / f"{name.split('.')[0]}.py"
+            if candidate.exists():
+                paths.append(candidate.resolve())
+    return paths
+
+
+def _module_sources(path, seen):
+    """Full text of a repo-local module plus whatever repo modules it imports."""
+    if path in seen:
+        return []
+    seen.add(path)
+    text = path.read_text(encoding="utf-8")
+    sources = [f"# module {path.name}\n{text}"]
+    for dep in _local_module_paths(ast.parse(text), path.parent):
+        sources += _module_sources(dep, seen)
+    return sources
+
+
+def scene_source(path, scene_name):
+    """Every piece of source text that can influence how `scene_name` renders."""
+    path = Path(path).resolve()
+    text = path.read_text(encoding="utf-8")
+    tree = ast.parse(text)
+
+    definitions = {}
+    preamble = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            definitions[node.name] = node
+        else:
+            preamble.append(ast.get_source_segment(text, node))
+
+    if scene_name not in definitions:
+        raise KeyError(f"{scene_name} is not defined in {path.name}")
+
+    # Walk the class, then every top-level definition it (transitively) names.
+    included = []
+    pending = [scene_name]
+    while pending:
+        name = pending.pop()
+        if name in included:
+            continue
+        included.append(name)
+        for sub in ast.walk(definitions[name]):
+            if isinstance(sub, ast.Name) and sub.id in definitions:
+                pending.append(sub.id)
+
+    parts = preamble + [ast.get_source_segment(text, definitions[n]) for n in sorted(included)]
+    seen = {path}
+    for dep in _local_module_paths(tree, path.parent):
+        parts += _module_sources(dep, seen)
+    return "\n".join(parts)
+
+
+def cache_key(job):
+    payload = {
+        "cache_version": CACHE_VERSION,
+        "manim": manim_version(),
+        "quality": job.quality,
+        "config": {k: v for k, v in job.config.items() if k not in PATH_ONLY_CONFIG},
+        "params": job.params,
+        "scene": job.scene,
+        "output_name": job.output_name,
+        "source": scene_source(job.path, job.scene),
+    }
+    blob = json.dumps(payload, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _place(src, dest):
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.exists() and os.path.samefile(src, dest):
+        return
+    shutil.copy2(src, dest)
+
+
+class RenderCache:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def _paths(self, key):
+        return self.directory / f"{key}.mp4", self.directory / f"{key}.json"
+
+    def lookup(self, job, key=None):
+        """Return a manifest record for a cache hit (video restored), else None."""
+        key = key or cache_key(job)
+        video, meta = self._paths(key)
+        if not (video.exists() and meta.exists()):
+            return None
+        record = json.loads(meta.read_text(encoding="utf-8"))
+        output = Path(job.media_dir) / record.pop("relative_output")
+        _place(video, output)
+        record.update(
+            file=Path(job.path).name,
+            scene=job.scene,
+            params=job.params,
+            status="cached",
+            output=str(output),
+            render_seconds=0.0,
+            cache_key=key,
+        )
+        return record
+
+    def store(self, job, record, key=None):
+        if record["status"] != "ok" or not record.get("output"):
+            return
+        key = key or cache_key(job)
+        video, meta = self._paths(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _place(record["output"], video)
+        output = Path(record["output"]).resolve()
+        info = {
+            "relative_output": str(output.relative_to(Path(job.media_dir).resolve())),
+            "quality": record["quality"],
+            "video_seconds": record["video_seconds"],
+            "num_plays": record["num_plays"],
+            "error": None,
+        }
+        meta.write_text(json.dumps(info, indent=2) + "\n", encoding="utf-8")
+        record["cache_key"] = key
@@ -0,0 +1,178 @@
+"""Opt-in per-``self.play``/``self.wait`` profiling for any scene.
+
+    python scene_profile.py queue_flow.py QueueFlowDiagram
+    python batch_render.py --profile media/profiles     # every scene
+
+For every play/wait call this records the calling source line, the animation
+types, the frames it produced and where its time went:
+
+    updaters        Scene.update_mobjects (mobject and scene updaters)
+    interpolation   the rest of Scene.update_to_time (Animation.interpolate)
+    rasterization   renderer.update_frame (camera.capture_mobjects)
+    encoding        file_writer.write_frame (pipe to ffmpeg)
+    other           everything else inside the call
+
+Results are written as ``<name>.folded`` (collapsed stacks, microseconds, for
+flamegraph.pl / speedscope / inferno) and ``<name>.json`` (one entry per call).
+Nothing is patched unless a PlayProfiler is attached, and only on that scene
+instance.
+"""
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+BUCKETS = ("updaters", "interpolation", "rasterization", "encoding")
+_SKIP_FILES = {__file__, str(Path(__file__).with_name("batch_render.py"))}
+
+
+def _caller():
+    """(function, "file:line") of the scene code that called play/wait."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename not in _SKIP_FILES and "/manim/" not in filename.replace("\\", "/"):
+            return frame.f_code.co_name, f"{Path(filename).name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?", "?"
+
+
+def _animation_names(args):
+    names = []
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            names += _animation_names(arg)
+        elif type(arg).__name__ == "_AnimationBuilder":
+            names.append("animate")
+        else:
+            names.append(type(arg).__name__)
+    return names
+
+
+class PlayProfiler:
+    def __init__(self, scene):
+        self.scene = scene
+        self.calls = []
+        self._current = None
+
+    # -- wrapping -------------------------------------------------------------
+    def _timed(self, owner, attr, bucket, count=None):
+        original = getattr(owner, attr)
+
+        def wrapper(*args, **kwargs):
+            if self._current is None:
+                return original(*args, **kwargs)
+            if count is not None:
+                # manim >= 0.19 writes repeated frames with one call (num_frames=n)
+                self._current[count] += kwargs.get("num_frames", 1)
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self._current[bucket] += time.perf_counter() - start
+
+        setattr(owner, attr, wrapper)
+
+    def _call(self, kind, original):
+        def wrapper(*args, **kwargs):
+            if self._current is not None:  # wait() is a play() internally
+                return original(*args, **kwargs)
+            function, line = _caller()
+            animations = ["Wait"] if kind == "wait" else _animation_names(args)
+            self._current = dict.fromkeys(BUCKETS + ("step",), 0.0)
+            self._current["frames"] = 0
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - start
+                c = self._current
+                self._current = None
+                # update_to_time's time minus the updaters it ran is interpolation
+                c["interpolation"] = max(0.0, c.pop("step") - c["updaters"])
+                c["other"] = max(0.0, total - sum(c[b] for b in BUCKETS))
+                self.calls.append({
+                    "kind": kind,
+                    "function": function,
+                    "line": line,
+                    "animations": animations,
+                    "frames": c.pop("frames"),
+                    "total": total,
+                    **c,
+                })
+        return wrapper
+
+    def attach(self):
+        scene = self.scene
+        renderer = scene.renderer
+        self._timed(scene, "update_mobjects", "updaters")
+        self._timed(scene, "update_to_time", "step")
+        self._timed(renderer, "update_frame", "rasterization")
+        self._timed(renderer.file_writer, "write_frame", "encoding", count="frames")
+
+        scene.play = self._call("play", scene.play)
+        scene.wait = self._call("wait", scene.wait)
+        return self
+
+    # -- output ---------------------------------------------------------------
+    def folded(self):
+        """Collapsed stacks: scene;function:line;kind[animations];bucket microseconds."""
+        scene_name = type(self.scene).__name__
+        stacks = defaultdict(int)
+        for call in self.calls:
+            anims = ",".join(sorted(set(call["animations"])))
+            prefix = f"{scene_name};{call['function']} {call['line']};{call['kind']}[{anims}]"
+            for bucket in BUCKETS + ("other",):
+                stacks[f"{prefix};{bucket}"] += round(call[bucket] * 1e6)
+        return "".join(f"{stack} {us}\n" for stack, us in sorted(stacks.items()) if us)
+
+    def summary(self, top=10):
+        by_line = defaultdict(lambda: {"calls": 0, "frames": 0, "total": 0.0})
+        for call in self.calls:
+            entry = by_line[(call["line"], call["kind"])]
+            entry["calls"] += 1
+            entry["frames"] += call["frames"]
+            entry["total"] += call["total"]
+        rows = sorted(by_line.items(), key=lambda kv: -kv[1]["total"])[:top]
+        lines = [f"{'line':<28} {'kind':<5} {'calls':>6} {'frames':>7} {'seconds':>8}"]
+        for (line, kind), e in rows:
+            lines.append(f"{line:<28} {kind:<5} {e['calls']:>6} {e['frames']:>7} {e['total']:>8.2f}")
+        return "\n".join(lines)
+
+    def write(self, stem):
+        stem = Path(stem)
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        folded = stem.with_name(stem.name + ".folded")
+        folded.write_text(self.folded(), encoding="utf-8")
+        stem.with_name(stem.name + ".json").write_text(
+            json.dumps(self.calls, indent=1) + "\n", encoding="utf-8")
+        return folded
+
+
+def main(argv=None):
+    from batch_render import QUALITIES, REPO_DIR, RenderJob, render_scene
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("--media-dir", default=str(REPO_DIR / "media"))
+    parser.add_argument("--out", default=None, help="default: <media-dir>/profiles")
+    args = parser.parse_args(argv)
+
+    job = RenderJob(str(Path(args.file).resolve()), args.scene, args.quality, args.media_dir,
+                    config={"disable_caching": True},
+                    profile_dir=args.out or str(Path(args.media_dir) / "profiles"))
+    record = render_scene(job)
+    if record["status"] != "ok":
+        print(record["error"])
+        return 1
+    print(record["profile_summary"])
+    print(record["profile"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
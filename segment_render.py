@@ -0,0 +1,110 @@
+"""Render the independent segments of one scene in parallel, then join them.
+
+    python segment_render.py ngon-vector.py RepeatedNGon --param Ns 3 4 5 6 7 8
+
+Each value becomes its own render job with ``{param: [value]}`` passed to the
+scene constructor, so the scene must treat that parameter as a list of
+segments that don't share state (``RepeatedNGon`` calls ``self.clear()`` before
+every N).  Segments share codec settings, so they are joined with ffmpeg's
+concat demuxer and ``-c copy``: no re-encode, no quality loss, and the wall
+time tracks the longest segment rather than the sum.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from batch_render import (
+    QUALITIES,
+    REPO_DIR,
+    RenderJob,
+    print_progress,
+    render_cached,
+    write_manifest,
+)
+from render_cache import RenderCache
+
+
+def concat_videos(inputs, output):
+    """Losslessly join videos that share codec settings (ffmpeg concat demuxer)."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg not found on PATH")
+    output = Path(output)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for path in inputs:
+            quoted = str(Path(path).resolve()).replace("'", r"'\''")
+            listing.write(f"file '{quoted}'\n")
+    try:
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", listing.name, "-c", "copy", "-movflags", "+faststart", str(output)],
+            check=True,
+        )
+    finally:
+        os.unlink(listing.name)
+    return output
+
+
+def render_segments(path, scene, param, values, quality="l", media_dir="media",
+                    workers=None, cache=None, on_result=None):
+    """Render scene(**{param: [v]}) for every v in parallel and concat the results.
+
+    Returns (joined_output_or_None, segment_records).
+    """
+    jobs = [
+        RenderJob(str(path), scene, quality, str(media_dir),
+                  params={param: [value]}, output_name=f"{scene}_segment{i:02d}")
+        for i, value in enumerate(values)
+    ]
+    records, _ = render_cached(jobs, workers, cache, on_result)
+    if any(r["status"] == "failed" for r in records):
+        return None, records
+    outputs = [r["output"] for r in records]
+    joined = Path(outputs[0]).with_name(f"{scene}.mp4")
+    return concat_videos(outputs, joined), records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("--param", required=True,
+                        help="constructor argument that takes the list of segments")
+    parser.add_argument("values", nargs="+",
+                        help="one value per segment (parsed as JSON, eg. 3 or '\"a\"')")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--media-dir", default=str(REPO_DIR / "media"))
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args(argv)
+
+    values = [json.loads(v) for v in args.values]
+    cache = None if args.no_cache else RenderCache(Path(args.media_dir) / "render_cache")
+    started = time.time()
+    joined, records = render_segments(
+        Path(args.file).resolve(), args.scene, args.param, values,
+        args.quality, args.media_dir, args.jobs, cache, on_result=print_progress,
+    )
+    wall = round(time.time() - started, 3)
+    write_manifest(
+        records,
+        Path(args.media_dir) / f"{args.scene}_segments.json",
+        quality=QUALITIES[args.quality],
+        joined_output=str(joined) if joined else None,
+        wall_seconds=wall,
+    )
+    if joined is None:
+        print("some segments failed; nothing joined")
+        return 1
+    print(f"{joined}  ({len(records)} segments in {wall:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
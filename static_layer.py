@@ -0,0 +1,121 @@
+"""Bake mobjects that never change into the camera background.
+
+    class MyScene(StaticLayerMixin, Scene):
+        def construct(self):
+            plane = NumberPlane()
+            self.play(Create(plane))
+            self.promote_to_background(plane)   # or self.add_static(plane) up front
+            ...
+            self.demote(plane)                   # back to a normal mobject
+            self.play(FadeOut(plane))
+
+Manim's Cairo renderer starts every frame from ``camera.background`` and
+draws the scene's mobjects on top; within one ``play`` it also reuses one
+rasterization of the mobjects that are not animated, but that image is
+thrown away at the next ``play``.  A grid that stays on screen for a whole
+clip is therefore rasterized again for every animation.  Baking it into the
+background instead rasterizes it once, and every later frame starts from
+those pixels.
+
+Baked layers are cached in-process, keyed by a hash of the baked mobjects'
+points and style on top of the layer beneath them, so a scene that redraws
+the same plane and circle for each segment (``RepeatedNGon``) rasterizes
+them once.  The camera frame must not move while anything is baked in.
+With the OpenGL renderer the mixin just adds and removes mobjects as usual.
+"""
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+from manim import RendererType, config
+
+# Rasterized backgrounds by layer key; a few full frames at most.
+_LAYERS = OrderedDict()
+LAYER_CACHE_SIZE = 8
+
+_ARRAY_ATTRS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas", "pixel_array")
+_VALUE_ATTRS = ("stroke_width", "background_stroke_width", "z_index")
+
+
+def mobject_digest(mobjects):
+    """Hash of everything about `mobjects` (and their families) that changes their pixels."""
+    h = hashlib.sha1()
+    for mob in mobjects:
+        for member in mob.get_family():
+            h.update(type(member).__name__.encode())
+            for attr in _ARRAY_ATTRS:
+                value = getattr(member, attr, None)
+                if isinstance(value, np.ndarray):
+                    h.update(attr.encode())
+                    h.update(str(value.shape).encode())
+                    h.update(np.ascontiguousarray(value).tobytes())
+            h.update(repr([getattr(member, attr, None) for attr in _VALUE_ATTRS]).encode())
+    return h.hexdigest()
+
+
+class StaticLayerMixin:
+    """Scene mixin: ``add_static``/``promote_to_background`` bake mobjects into the background."""
+
+    def _layer_camera(self):
+        if config.renderer != RendererType.CAIRO:
+            return None
+        camera = self.renderer.camera
+        if not hasattr(self, "_static_mobjects"):
+            self._static_mobjects = []
+            self._base_background = camera.background
+            self._layer_key = hashlib.sha1(repr((
+                camera.background.shape, camera.frame_width, camera.frame_height,
+                tuple(camera.frame_center), camera.background[0, 0].tobytes(),
+                camera.background_image,
+            )).encode()).hexdigest()
+            self._base_layer_key = self._layer_key
+        return camera
+
+    def add_static(self, *mobjects):
+        """Rasterize `mobjects` into the background; they are not scene mobjects afterwards."""
+        camera = self._layer_camera()
+        if camera is None:
+            self.add(*mobjects)
+            return self
+        key = hashlib.sha1((self._layer_key + mobject_digest(mobjects)).encode()).hexdigest()
+        image = _LAYERS.get(key)
+        if image is None:
+            camera.reset()                  # pixel_array = current background
+            camera.capture_mobjects(mobjects)
+            image = camera.pixel_array.copy()
+            _LAYERS[key] = image
+            while len(_LAYERS) > LAYER_CACHE_SIZE:
+                _LAYERS.popitem(last=False)
+        else:
+            _LAYERS.move_to_end(key)
+        camera.background = image
+        self._layer_key = key
+        self._static_mobjects.extend(mobjects)
+        return self
+
+    def promote_to_background(self, *mobjects):
+        """Move mobjects already in the scene (eg. after their intro animation) into the background."""
+        self.remove(*mobjects)
+        return self.add_static(*mobjects)
+
+    def demote(self, *mobjects):
+        """Take baked mobjects out of the background and put them back, behind the rest of the scene."""
+        camera = self._layer_camera()
+        if camera is None:
+            return self
+        keep = [m for m in self._static_mobjects if all(m is not d for d in mobjects)]
+        self.clear_background()
+        if keep:
+            self.add_static(*keep)
+        self.bring_to_back(*mobjects)
+        return self
+
+    def clear_background(self):
+        """Drop every baked mobject and restore the original background."""
+        camera = self._layer_camera()
+        if camera is None:
+            return self
+        camera.background = self._base_background
+        self._layer_key = self._base_layer_key
+        self._static_mobjects = []
+        return self
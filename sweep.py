@@ -0,0 +1,140 @@
+"""Render a parameterized scene once for every point of a parameter grid.
+
+    python sweep.py ngon-vector.py Target --param N=3:65
+    python sweep.py ngon-vector.py Target --param N=3,5,8,13 -q m -j 16
+    python sweep.py cosets.py CosetsAndWaveInZn --param n=12 --param d=2,3,4,6
+
+``--param name=start:stop[:step]`` is a Python-style range (stop excluded),
+``name=a,b,c`` a list of values parsed as JSON, and ``name=value`` a single
+value; the grid is the product of all of them.  Every combination is its own
+job in batch_render's worker pool, so it goes through the same render cache
+(media/render_cache) and TeX cache as every other clip, and its video is
+named after the parameters (``Target_N3.mp4``, ``Target_N4.mp4``, ...).
+"""
+import argparse
+import itertools
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from batch_render import (
+    QUALITIES,
+    REPO_DIR,
+    RenderJob,
+    discover_scenes,
+    print_progress,
+    render_cached,
+    write_manifest,
+)
+from render_cache import RenderCache
+
+
+def parse_param(text):
+    """'N=3:65' -> ('N', [3, ..., 64]); 'k=1,2' -> ('k', [1, 2]); 'x=0.5' -> ('x', [0.5])."""
+    name, sep, spec = text.partition("=")
+    if not sep or not name.isidentifier() or not spec:
+        raise ValueError(f"expected name=values, got {text!r}")
+    if ":" in spec:
+        bounds = [int(part) for part in spec.split(":")]
+        if len(bounds) not in (2, 3):
+            raise ValueError(f"expected start:stop[:step], got {spec!r}")
+        values = list(range(*bounds))
+    else:
+        values = [json.loads(part) for part in spec.split(",")]
+    if not values:
+        raise ValueError(f"{name}: empty range {spec!r}")
+    return name, values
+
+
+def param_grid(params):
+    """Every combination of {name: [values]} as a list of {name: value} dicts."""
+    names = list(params)
+    return [dict(zip(names, combo)) for combo in itertools.product(*params.values())]
+
+
+def output_name(scene, params):
+    """Target, {'N': 3} -> 'Target_N3'; safe to use as a file name."""
+    parts = [scene] + [f"{name}{value}" for name, value in params.items()]
+    return re.sub(r"[^\w.-]+", "-", "_".join(parts))
+
+
+def sweep_jobs(path, scene, params, quality="l", media_dir="media", tex_dir=None):
+    jobs = []
+    for point in param_grid(params):
+        job = RenderJob(str(path), scene, quality, str(media_dir),
+                        params=point, output_name=output_name(scene, point))
+        if tex_dir:
+            job.config["tex_dir"] = tex_dir
+        jobs.append(job)
+    return jobs
+
+
+def render_sweep(path, scene, params, quality="l", media_dir="media", workers=None,
+                 cache=None, on_result=None, tex_dir=None):
+    """Render scene(**point) for every point of the grid in parallel.
+
+    Returns (records, workers) like batch_render.render_cached.
+    """
+    jobs = sweep_jobs(path, scene, params, quality, media_dir, tex_dir)
+    return render_cached(jobs, workers, cache, on_result)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("--param", action="append", required=True, metavar="NAME=VALUES",
+                        help="start:stop[:step], a,b,c or a single value (repeatable)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--media-dir", default=str(REPO_DIR / "media"))
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--warm-tex", action="store_true",
+                        help="pre-compile the file's literal TeX strings first (see tex_warmup.py)")
+    parser.add_argument("--tex-dir", default=None,
+                        help="shared TeX cache directory (default: <media-dir>/Tex)")
+    args = parser.parse_args(argv)
+
+    params = {}
+    for text in args.param:
+        try:
+            name, values = parse_param(text)
+        except ValueError as exc:
+            parser.error(str(exc))
+        params[name] = values
+
+    path = Path(args.file).resolve()
+    spec = next((s for s in discover_scenes([path]) if s.name == args.scene), None)
+    if spec is None:
+        parser.error(f"no scene {args.scene} in {args.file}")
+    missing = [p for p in spec.required if p not in params]
+    if missing:
+        parser.error(f"{args.scene} needs parameters: {', '.join(missing)}")
+
+    if args.warm_tex:
+        from tex_warmup import warm_tex
+
+        n, failures = warm_tex([path], args.media_dir, args.tex_dir, args.jobs)
+        print(f"tex     {n - len(failures)}/{n} strings cached")
+
+    cache = None if args.no_cache else RenderCache(Path(args.media_dir) / "render_cache")
+    started = time.time()
+    records, workers = render_sweep(path, args.scene, params, args.quality, args.media_dir,
+                                    args.jobs, cache, on_result=print_progress, tex_dir=args.tex_dir)
+    manifest = write_manifest(
+        records,
+        Path(args.media_dir) / f"{args.scene}_sweep.json",
+        quality=QUALITIES[args.quality],
+        grid=params,
+        workers=workers,
+        wall_seconds=round(time.time() - started, 3),
+    )
+    print(f"{len(records) - len(manifest['failures'])}/{len(records)} renders ready "
+          f"in {manifest['wall_seconds']:.1f}s")
+    return 1 if manifest["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
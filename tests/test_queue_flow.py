@@ -0,0 +1,34 @@
+"""Smoke tests: both queue_flow scenes build and play through (dry run, no video)."""
+import sys
+from pathlib import Path
+
+import pytest
+
+manim = pytest.importorskip("manim")
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from batch_render import load_scene_module  # noqa: E402
+
+SCENES = ["QueueFlowDiagram", "StreamingQueueFlowDiagram"]
+
+
+@pytest.fixture(scope="module")
+def queue_flow():
+    return load_scene_module(REPO_DIR / "queue_flow.py")
+
+
+def test_simulate(queue_flow):
+    items, events = queue_flow.QueueFlowDiagram().simulate()
+    assert [item["finish"] for item in items] == [3, 6, 9, 12, 15]
+    assert len(events) == 3 * len(items)
+
+
+@pytest.mark.parametrize("name", SCENES)
+def test_scene_builds(queue_flow, name, tmp_path):
+    with manim.tempconfig({"dry_run": True, "media_dir": str(tmp_path),
+                           "quality": "low_quality", "progress_bar": "none"}):
+        scene = getattr(queue_flow, name)()
+        scene.render()
+    assert scene.renderer.num_plays > 0
@@ -0,0 +1,141 @@
+"""Pre-compile every LaTeX string the clips use into manim's shared Tex cache.
+
+    python tex_warmup.py                 # every *.py in the repo
+    python tex_warmup.py cosets.py -j 8
+
+``MathTex``/``Tex`` (and ``Matrix`` entries) whose arguments are literals are
+collected statically from the scene modules, de-duplicated, and built once
+each in a process pool.  Building the mobject is what writes manim's
+``<tex_dir>/<hash>.svg``, so a later render on any worker sharing that
+``tex_dir`` finds the SVG and skips latex/dvisvgm entirely.  Strings built at
+render time (``Tex(f"k = {k}")``) can't be known statically and still compile
+on first use.
+"""
+import argparse
+import ast
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from batch_render import REPO_DIR, find_scene_files
+
+TEX_CLASSES = {"MathTex", "Tex", "SingleStringMathTex"}
+# Keyword arguments that change the generated .tex file (font_size etc. don't).
+TEX_KWARGS = {"tex_environment", "arg_separator"}
+
+
+def _literal(node):
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.JoinedStr) and all(isinstance(v, ast.Constant) for v in node.values):
+        return "".join(v.value for v in node.values)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _literal(node.left), _literal(node.right)
+        if isinstance(left, str) and isinstance(right, str):
+            return left + right
+    raise ValueError("not a literal")
+
+
+def _call_name(node):
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def collect_tex(paths=None):
+    """Return the sorted set of (class_name, args, kwargs) found in the files."""
+    found = set()
+    for path in find_scene_files(paths):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call):
+                continue
+            name = _call_name(node)
+            try:
+                if name in TEX_CLASSES:
+                    args = tuple(_literal(a) for a in node.args)
+                    if not args or not all(isinstance(a, str) for a in args):
+                        continue
+                    kwargs = tuple(sorted(
+                        (k.arg, _literal(k.value)) for k in node.keywords if k.arg in TEX_KWARGS
+                    ))
+                    found.add((name, args, kwargs))
+                elif name == "Matrix" and node.args:
+                    # Default Matrix entries are MathTex(str(entry)).
+                    rows = ast.literal_eval(node.args[0])
+                    for row in rows:
+                        for entry in row:
+                            found.add(("MathTex", (str(entry),), ()))
+            except (ValueError, TypeError):
+                continue
+    return sorted(found)
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+def _init_worker(media_dir, tex_dir):
+    from manim import config
+
+    config.media_dir = media_dir
+    if tex_dir:
+        config.tex_dir = tex_dir
+    # Workers share tex_dir; manim's cleanup would delete each other's .dvi files.
+    config.no_latex_cleanup = True
+    config.verbosity = "WARNING"
+
+
+def _compile(item):
+    import manim
+
+    name, args, kwargs = item
+    try:
+        getattr(manim, name)(*args, **dict(kwargs))
+        return item, None
+    except Exception as exc:  # bad LaTeX should not stop the warm-up
+        return item, f"{type(exc).__name__}: {exc}"
+
+
+def warm_tex(paths=None, media_dir="media", tex_dir=None, workers=None, on_error=None):
+    """Compile every statically known TeX string; returns (n_items, failures)."""
+    items = collect_tex(paths)
+    failures = []
+    if not items:
+        return 0, failures
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(str(media_dir), tex_dir and str(tex_dir))) as pool:
+        for future in as_completed([pool.submit(_compile, item) for item in items]):
+            item, error = future.result()
+            if error is not None:
+                failures.append((item, error))
+                if on_error is not None:
+                    on_error(item, error)
+    return len(items), failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--media-dir", default=str(REPO_DIR / "media"))
+    parser.add_argument("--tex-dir", default=None, help="default: <media-dir>/Tex")
+    parser.add_argument("--list", action="store_true", help="only print what would compile")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, tex_args, kwargs in collect_tex(args.files):
+            print(name, *tex_args, *(f"{k}={v}" for k, v in kwargs))
+        return 0
+
+    started = time.time()
+    n, failures = warm_tex(args.files, args.media_dir, args.tex_dir, args.jobs,
+                           on_error=lambda item, error: print(f"FAILED {item[1]!r}: {error}"))
+    print(f"{n - len(failures)}/{n} TeX strings cached in {time.time() - started:.1f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())